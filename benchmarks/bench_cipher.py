@@ -0,0 +1,74 @@
+# === CICADA_Δ_ENGINE ===
+# Cipher benchmark: the per-character Caesar loops the layers used to carry
+# versus the shared translate tables, for single phrases, phrase lists and
+# long text through the str, bytes and NumPy paths.
+#
+#   python benchmarks/bench_cipher.py [--length N ...] [--phrases N]
+
+import os
+import sys
+import time
+import random
+import string
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.cipher import encrypt, encrypt_many, encrypt_bytes, encrypt_array, codepoint_shift
+
+ALPHABET = string.ascii_letters + string.digits + " .,!?"
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+def loop_encrypt(text, shift):
+    encrypted = ""
+    for char in text:
+        if char.isalpha():
+            offset = 65 if char.isupper() else 97
+            encrypted += chr((ord(char) - offset + shift) % 26 + offset)
+        elif char.isdigit():
+            encrypted += chr((ord(char) - 48 + shift) % 10 + 48)
+        else:
+            encrypted += char
+    return encrypted
+
+def loop_codepoint(text, shift):
+    return "".join(chr((ord(c) + shift) % 256) for c in text)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--length", type=int, nargs="+", default=[6, 100, 10000, 1000000])
+    parser.add_argument("--phrases", type=int, default=10000)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'length':>8} {'loop µs':>11} {'table µs':>10} {'bytes µs':>10} {'numpy µs':>10} {'shift256 loop':>14} {'shift256 µs':>12}")
+    for length in args.length:
+        text = "".join(rng.choices(ALPHABET, k=length))
+        data = text.encode("ascii")
+        calls = max(1, 200000 // length)
+        try:
+            import numpy as np
+            codes = np.frombuffer(data, dtype=np.uint8)
+            array = f"{per_call(lambda: encrypt_array(codes, 7), calls) * 1e6:>10.2f}"
+        except ImportError:
+            array = f"{'-':>10}"
+        old = per_call(lambda: loop_encrypt(text, 7), max(1, calls // 10))
+        new = per_call(lambda: encrypt(text, 7), calls)
+        raw = per_call(lambda: encrypt_bytes(data, 7), calls)
+        old_cp = per_call(lambda: loop_codepoint(text, -1), max(1, calls // 10))
+        new_cp = per_call(lambda: codepoint_shift(text, -1), calls)
+        print(f"{length:>8} {old * 1e6:>11.2f} {new * 1e6:>10.2f} {raw * 1e6:>10.2f} {array} {old_cp * 1e6:>14.2f} {new_cp * 1e6:>12.2f}")
+
+    phrases = ["".join(rng.choices(ALPHABET, k=rng.randint(4, 12))) for _ in range(args.phrases)]
+    old = per_call(lambda: [loop_encrypt(p, 7) for p in phrases], 3)
+    each = per_call(lambda: [encrypt(p, 7) for p in phrases], 10)
+    bulk = per_call(lambda: encrypt_many(phrases, 7), 10)
+    print(f"\n{args.phrases} phrases: loop {old * 1000:.2f} ms, per-phrase table {each * 1000:.2f} ms, encrypt_many {bulk * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
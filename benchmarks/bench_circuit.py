@@ -0,0 +1,71 @@
+# === CICADA_Δ_ENGINE ===
+# Circuit benchmark: evaluating a random gate DAG over every input assignment
+# with the string-bit, if/elif per-gate evaluation LogicGatePuzzle used to
+# carry, versus Circuit's bitset truth tables. The old path is timed on a
+# sample of assignments and scaled up to all 2^n.
+#
+#   python benchmarks/bench_circuit.py [--inputs N ...] [--gates N ...]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.circuit import Circuit, GATE_NAMES
+
+SAMPLE = 256
+
+def compute_gate(a, b, gate):
+    a, b = int(a), int(b)
+    if gate == "AND":
+        return str(a & b)
+    elif gate == "OR":
+        return str(a | b)
+    elif gate == "XOR":
+        return str(a ^ b)
+    elif gate == "NAND":
+        return str(int(not (a & b)))
+    elif gate == "NOR":
+        return str(int(not (a | b)))
+    elif gate == "XNOR":
+        return str(int(not (a ^ b)))
+    return "0"
+
+def per_gate(gates, inputs, assignment):
+    values = [str((assignment >> j) & 1) for j in range(inputs)]
+    for gate, a, b in gates:
+        values.append(compute_gate(values[a], values[b], gate))
+    return values[-1]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--inputs", type=int, nargs="+", default=[8, 12, 16])
+    parser.add_argument("--gates", type=int, nargs="+", default=[50, 200, 800])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    print(f"{'inputs':>6} {'gates':>6} {'depth':>6} {'per-gate ms':>12} {'bitset ms':>10} {'build ms':>9} {'degenerate':>11}")
+    for inputs in args.inputs:
+        for gates in args.gates:
+            start = time.perf_counter()
+            circuit = Circuit.random(rng, inputs, gates, GATE_NAMES)
+            build = time.perf_counter() - start
+            listing = [circuit.gate(node) for node in range(inputs, circuit.nodes)]
+            assignments = min(SAMPLE, 1 << inputs)
+            start = time.perf_counter()
+            for k in range(assignments):
+                per_gate(listing, inputs, k)
+            old = (time.perf_counter() - start) * (1 << inputs) / assignments
+            circuit._tables = None
+            start = time.perf_counter()
+            circuit.tables()
+            new = time.perf_counter() - start
+            print(f"{inputs:>6} {gates:>6} {circuit.depth():>6} {old * 1000:>12.1f} {new * 1000:>10.2f} "
+                  f"{build * 1000:>9.2f} {len(circuit.degenerate()):>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+# === CICADA_Δ_ENGINE ===
+# Divergence benchmark: one perturbation round across N sessions, done with
+# per-session DivergenceEngine objects versus one batched DivergenceBank.
+#
+#   python benchmarks/bench_divergence.py [--sessions N] [--rounds R]
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.config import DIVERGENCE_THRESHOLD
+from cicada.utils import entropy_sample
+from cicada.divergence import DivergenceEngine
+from cicada.bank import DivergenceBank
+
+def bench(label, fn, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"{label:>34} {elapsed * 1000:9.2f} ms/round")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    entropies = [entropy_sample() for _ in range(args.sessions)]
+    engines = [DivergenceEngine() for _ in range(args.sessions)]
+    bank = DivergenceBank()
+    views = [bank.open() for _ in range(args.sessions)]
+    slots = [view.slot for view in views]
+
+    print(f"sessions: {args.sessions}")
+    looped = bench("DivergenceEngine.perturb loop", lambda: [e.perturb(x) for e, x in zip(engines, entropies)], args.rounds)
+    batched = bench("DivergenceBank.perturb batch", lambda: bank.perturb(slots, entropies), args.rounds)
+    bench("threshold scan, engines", lambda: [i for i, e in enumerate(engines) if e.value > DIVERGENCE_THRESHOLD], args.rounds)
+    bench("threshold scan, bank", bank.over_threshold, args.rounds)
+    print(f"{'perturb speedup':>34} {looped / batched:9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+# === CICADA_Δ_ENGINE ===
+# Entropy benchmark: per-call cost of entropy_sample with the old per-character
+# random.choice join, a seeded session rng, and the pooled crypto/fast modes.
+#
+#   python benchmarks/bench_entropy.py [--calls N] [--length L]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.utils import entropy_sample
+from cicada.entropy import ENTROPY_ALPHABET, EntropyPool, set_entropy_pool
+
+def choice_join(length=16, rng=random):
+    return ''.join(rng.choice(ENTROPY_ALPHABET) for _ in range(length))
+
+def bench(label, fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    elapsed = (time.perf_counter() - start) / calls
+    print(f"{label:>26} {elapsed * 1e6:8.3f} µs/call")
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--length", type=int, default=16)
+    args = parser.parse_args()
+    length = args.length
+
+    print(f"calls: {args.calls}, length: {length}")
+    old = bench("random.choice join", lambda: choice_join(length), args.calls)
+    rng = random.Random(1234)
+    bench("seeded rng", lambda: entropy_sample(length, rng=rng), args.calls)
+    for mode in ("crypto", "fast"):
+        pool = EntropyPool(mode)
+        set_entropy_pool(pool)
+        new = bench(f"pool ({mode})", lambda: entropy_sample(length), args.calls)
+        print(f"{'':>26} {old / new:8.1f}x faster, {pool.refills} refills, {pool.misses} inline")
+    set_entropy_pool(None)
+
+if __name__ == "__main__":
+    main()
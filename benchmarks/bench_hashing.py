@@ -0,0 +1,53 @@
+# === CICADA_Δ_ENGINE ===
+# Hash service benchmark: hex-digesting every call versus the shared LRU on
+# fresh and repeated inputs, with the cache's hit/miss metrics, and
+# perturb's shift from the hex string versus the raw digest bytes.
+#
+#   python benchmarks/bench_hashing.py [--calls N] [--distinct N]
+
+import os
+import sys
+import time
+import random
+import hashlib
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.hashing import HashCache, set_hash_cache, get_hash_cache, digest_shift
+from cicada.utils import entropy_sample
+
+def per_call(fn, items):
+    start = time.perf_counter()
+    for item in items:
+        fn(item)
+    return (time.perf_counter() - start) / len(items)
+
+def hex_sha256(data):
+    return hashlib.sha256(data.encode()).hexdigest()
+
+def hex_shift(entropy):
+    hashed = hex_sha256(entropy)
+    return sum(ord(c) for c in hashed[:16]) % 1000 / 1000.0
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--distinct", type=int, default=512)
+    args = parser.parse_args()
+    rng = random.Random(0)
+    fresh = [entropy_sample(16, rng=rng) for _ in range(args.calls)]
+    pool = fresh[:args.distinct]
+    repeated = [rng.choice(pool) for _ in range(args.calls)]
+    cache = HashCache()
+    set_hash_cache(cache)
+
+    print(f"{'':>22} {'hexdigest ns':>13} {'cached ns':>10}")
+    print(f"{'fresh inputs':>22} {per_call(hex_sha256, fresh) * 1e9:>13.0f} {per_call(cache.hexdigest, fresh) * 1e9:>10.0f}")
+    print(f"{f'{args.distinct} repeated inputs':>22} {per_call(hex_sha256, repeated) * 1e9:>13.0f} {per_call(cache.hexdigest, repeated) * 1e9:>10.0f}")
+    print(f"{'cache metrics':>22} {get_hash_cache().metrics()}")
+    print(f"\n{'':>22} {'hex ord ns':>13} {'raw ns':>10}")
+    print(f"{'perturb shift, fresh':>22} {per_call(hex_shift, fresh) * 1e9:>13.0f} {per_call(digest_shift, fresh) * 1e9:>10.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# === CICADA_Δ_ENGINE ===
+# History benchmark: memory and cost of recording N perturbations with the
+# old list of (timestamp, shift, value) tuples versus RingHistory.
+#
+#   python benchmarks/bench_history.py [--records N]
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.config import DIVERGENCE_HISTORY
+from cicada.utils import timestamp
+from cicada.history import RingHistory
+
+def measure(label, record, records):
+    samples = [(random.uniform(-1, 1), random.uniform(0, 3)) for _ in range(records)]
+    start = time.perf_counter()
+    record(samples)
+    elapsed = time.perf_counter() - start
+    # Memory is measured on a second pass; tracing distorts the timing.
+    tracemalloc.start()
+    kept = record(samples)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:>26} {elapsed / records * 1e6:8.2f} µs/record {peak / 1024:10.1f} KiB peak")
+    return kept
+
+def with_list(samples):
+    log = []
+    for shift, value in samples:
+        log.append((timestamp(), shift, value))
+    return log
+
+def with_ring(samples):
+    history = RingHistory()
+    for shift, value in samples:
+        history.record(shift, value)
+    return history
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=200000)
+    args = parser.parse_args()
+
+    print(f"records: {args.records}")
+    log = measure("list of tuples", with_list, args.records)
+    history = measure(f"RingHistory({DIVERGENCE_HISTORY})", with_ring, args.records)
+
+    window = log[-history.capacity:]
+    start = time.perf_counter()
+    for _ in range(1000):
+        values = [v for _, _, v in window]
+        (statistics.fmean(values), min(values), max(values), statistics.pstdev(s for _, s, _ in window))
+    rescan = (time.perf_counter() - start) / 1000
+    start = time.perf_counter()
+    for _ in range(1000):
+        history.summary()
+    ring = (time.perf_counter() - start) / 1000
+    print(f"{'window summary, rescan':>26} {rescan * 1e6:8.2f} µs")
+    print(f"{'window summary, ring':>26} {ring * 1e6:8.2f} µs")
+
+if __name__ == "__main__":
+    main()
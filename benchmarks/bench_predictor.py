@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Predictor benchmark: cost of one twin guess as a player's history grows,
+# re-splitting the joined log text versus querying the incremental
+# SequenceModel, plus the model's update cost and hit rate on a biased player.
+#
+#   python benchmarks/bench_predictor.py [--history N ...]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.predictor import SequenceModel
+
+MOVES = ("rock", "paper", "scissors")
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+def biased_player(rng, length):
+    # Mostly cycles rock -> paper -> scissors, sometimes improvises.
+    moves, i = [], 0
+    for _ in range(length):
+        i = (i + 1) % 3 if rng.random() < 0.8 else rng.randrange(3)
+        moves.append(MOVES[i])
+    return moves
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'history':>8} {'rescan µs':>10} {'model µs':>10} {'observe µs':>11}")
+    for size in args.history:
+        entries = [f"LOG{n} Δ={rng.random():.6f}" for n in range(size)]
+        log = " ".join(entries)
+        rescan = per_call(lambda: rng.choice(log.split()), args.calls)
+        model = SequenceModel()
+        start = time.perf_counter()
+        for entry in entries:
+            for token in entry.split():
+                model.observe(token)
+        observe = (time.perf_counter() - start) / (2 * size)
+        query = per_call(model.predict, args.calls)
+        print(f"{size:>8} {rescan * 1e6:>10.2f} {query * 1e6:>10.2f} {observe * 1e6:>11.2f}")
+
+    moves = biased_player(rng, 2000)
+    model, hits = SequenceModel(), 0
+    for move in moves:
+        hits += model.predict() == move
+        model.observe(move)
+    print(f"next-move hit rate on a biased player: {hits / len(moves):.0%} (random play: 33%)")
+
+if __name__ == "__main__":
+    main()
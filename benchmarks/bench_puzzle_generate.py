@@ -0,0 +1,51 @@
+# === CICADA_Δ_ENGINE ===
+# Puzzle generation benchmark: specs per second generated in-process versus
+# farmed out to PuzzleFactory's process pool at several worker counts, and
+# a check that every worker count returns the same specs for the same seeds.
+#
+#   python benchmarks/bench_puzzle_generate.py [--count N] [--workers N ...]
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.factory import PuzzleFactory, POOLED_PUZZLES, generate_specs
+
+async def farmed(workers, layer, seeds, batch):
+    factory = PuzzleFactory(workers=workers)
+    try:
+        # Start the workers and import the layer there before timing.
+        await factory.generate(layer, 0)
+        start = time.perf_counter()
+        specs = await factory.generate_many(layer, seeds, batch)
+        return specs, time.perf_counter() - start
+    finally:
+        factory.close()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=20000)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument("--batch", type=int, default=256)
+    args = parser.parse_args()
+    seeds = list(range(args.count))
+    print(f"cpus: {os.cpu_count()}")
+
+    print(f"{'layer':>5} {'in-process/s':>13}" + "".join(f" {f'{w} workers/s':>13}" for w in args.workers))
+    for layer in POOLED_PUZZLES:
+        start = time.perf_counter()
+        local = generate_specs(layer, seeds)
+        row = f"{layer:>5} {args.count / (time.perf_counter() - start):>13.0f}"
+        for workers in args.workers:
+            specs, elapsed = asyncio.run(farmed(workers, layer, seeds, args.batch))
+            if specs != local:
+                raise AssertionError(f"layer {layer}: {workers} workers produced different specs")
+            row += f" {args.count / elapsed:>13.0f}"
+        print(row)
+
+if __name__ == "__main__":
+    main()
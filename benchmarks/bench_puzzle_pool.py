@@ -0,0 +1,54 @@
+# === CICADA_Δ_ENGINE ===
+# Puzzle pool benchmark: building the first four puzzles inline for a burst
+# of sessions versus binding pre-generated instances from a warm
+# PuzzleFactory, with the pool's hit rate under the burst.
+#
+#   python benchmarks/bench_puzzle_pool.py [--burst N ...] [--size N]
+
+import os
+import sys
+import time
+import argparse
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.twin import Twin
+from cicada.divergence import DivergenceEngine
+from cicada.factory import PuzzleFactory, pooled_classes
+
+def burst(factory, classes, sessions):
+    # Per-session time from layer start to a puzzle ready to prompt.
+    latencies = []
+    for n in range(sessions):
+        player = SimpleNamespace(username=f"bench-{n}", delta=0.0)
+        twin = Twin(player)
+        divergence = DivergenceEngine()
+        start = time.perf_counter()
+        for cls in classes:
+            puzzle = factory.take(cls, player, twin, divergence)
+            if hasattr(puzzle, "generate_gates"):
+                puzzle.generate_gates()
+        latencies.append(time.perf_counter() - start)
+    latencies.sort()
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--size", type=int, default=256)
+    args = parser.parse_args()
+    classes = pooled_classes()
+
+    print(f"{'burst':>6} {'inline p50 µs':>14} {'pooled p50 µs':>14} {'pooled p99 µs':>14} {'hit rate':>9}")
+    for sessions in args.burst:
+        inline = burst(PuzzleFactory(), classes, sessions)
+        factory = PuzzleFactory(args.size).start(classes)
+        pooled = burst(factory, classes, sessions)
+        factory.close()
+        rate = factory.hits / max(1, factory.hits + factory.misses)
+        print(f"{sessions:>6} {inline[len(inline) // 2] * 1e6:>14.1f} {pooled[len(pooled) // 2] * 1e6:>14.1f} "
+              f"{pooled[len(pooled) * 99 // 100] * 1e6:>14.1f} {rate:>9.1%}")
+
+if __name__ == "__main__":
+    main()
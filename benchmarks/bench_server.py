@@ -0,0 +1,53 @@
+# === CICADA_Δ_ENGINE ===
+# Server benchmark: N concurrent loopback players against one in-process server.
+#
+#   python benchmarks/bench_server.py [--sessions N]
+#
+# Each client answers the handle prompt, then misses layer 1 a few times
+# and disconnects. A session sleeps for several seconds of scripted pacing,
+# so wall time close to that floor means the sessions really overlapped.
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.storage import ConnectionPool, set_pool, get_writer
+from cicada.server import CicadaServer, loopback_client
+
+WRONG_ANSWERS = ["Δ", "cicada", "3301"]
+
+async def run(sessions):
+    server = await CicadaServer("127.0.0.1", 0).start()
+    start = time.perf_counter()
+    transcripts = await asyncio.gather(*[
+        loopback_client(server.host, server.port, [f"bench_{i}"] + WRONG_ANSWERS)
+        for i in range(sessions)
+    ])
+    elapsed = time.perf_counter() - start
+    await server.close()
+    return server, transcripts, elapsed
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        set_pool(ConnectionPool(os.path.join(tmp, "bench.db")))
+        server, transcripts, elapsed = asyncio.run(run(args.sessions))
+        if get_writer() is not None:
+            get_writer().flush()
+        set_pool(None)
+
+    greeted = sum("Welcome, bench_" in t for t in transcripts)
+    print(f"sessions:   {args.sessions} ({greeted} greeted, {server.dropped} disconnected, {server.failed} failed)")
+    print(f"wall time:  {elapsed:.2f} s")
+    print(f"throughput: {args.sessions / elapsed:.1f} sessions/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# === CICADA_Δ_ENGINE ===
+# Twin.speak micro-benchmark: latency per call as the message grows, for the
+# old per-call f-string and full-length scramble versus the response engine,
+# alone and inside speak() with its memory write.
+#
+#   python benchmarks/bench_speak.py [--calls N]
+
+import os
+import sys
+import time
+import random
+import argparse
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.config import TWIN_ID
+from cicada.twin import Twin
+
+SIZES = (16, 256, 4096, 65536, 1 << 20)
+
+def old_response(rng, msg, tone):
+    if tone == "cold":
+        return f"[{TWIN_ID} - COLD] That question has already been answered."
+    elif tone == "ambiguous":
+        return f"[{TWIN_ID} - AMBIGUOUS] Some doors open only when you stop asking."
+    elif tone == "unstable":
+        scrambled = ''.join(rng.sample(msg, len(msg)))
+        return f"[{TWIN_ID} - UNSTABLE] {scrambled}"
+    return f"[{TWIN_ID}] Error: Invalid tone."
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'tone':>10} {'msg chars':>10} {'old µs':>10} {'render µs':>10} {'speak() µs':>10}")
+    for tone, delta in (("cold", 0.1), ("unstable", 2.0)):
+        twin = Twin(SimpleNamespace(username="bench", delta=delta), seed=0)
+        for size in SIZES:
+            msg = "".join(rng.choice("abcdefghij ") for _ in range(size))
+            # The old scramble is O(n) Python-level work; cap its calls on big input.
+            calls = max(1, min(args.calls, args.calls * 256 // size)) if tone == "unstable" else args.calls
+            old = per_call(lambda: old_response(rng, msg, tone), calls)
+            render = per_call(lambda: twin.generate_response(msg, tone, "neutral"), args.calls)
+            speak = per_call(lambda: twin.speak(msg), args.calls)
+            print(f"{tone:>10} {size:>10} {old * 1e6:>10.2f} {render * 1e6:>10.2f} {speak * 1e6:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# === CICADA_Δ_ENGINE ===
+# Startup benchmark: cold-start cost versus the number of layers visited.
+#
+#   python benchmarks/bench_startup.py [--runs N]
+#
+# Every sample runs in a fresh interpreter so nothing is shared through
+# sys.modules. Bytecode caches are warmed first; the numbers are import and
+# execution cost, not compile cost.
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import sys, time, json
+start = time.perf_counter()
+from cicada.registry import dispatch_table, loaded_layers
+table = dispatch_table()
+ready = time.perf_counter()
+for depth in sorted(table)[:{visited}]:
+    table[depth].interaction
+done = time.perf_counter()
+print(json.dumps({{
+    "ready": ready - start,
+    "total": done - start,
+    "layers": len(loaded_layers()),
+    "modules": len(sys.modules),
+}}))
+'''
+
+def probe(visited):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE.format(visited=visited)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=15)
+    args = parser.parse_args()
+
+    # Warm __pycache__ for every layer so all scenarios compare like with like.
+    layer_count = probe(1000)["layers"]
+    scenarios = [0, 1, 5, 20, layer_count]
+
+    print(f"{'layers visited':>15} {'dispatcher ready':>17} {'layers loaded':>14} {'modules':>8}")
+    for visited in scenarios:
+        samples = [probe(visited) for _ in range(args.runs)]
+        ready = statistics.median(s["ready"] for s in samples) * 1000
+        total = statistics.median(s["total"] for s in samples) * 1000
+        label = f"{visited} (all)" if visited == layer_count else str(visited)
+        print(f"{label:>15} {ready:>14.2f} ms {total:>11.2f} ms {samples[0]['modules']:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# === CICADA_Δ_ENGINE ===
+# Console input benchmark: how late does a 10 ms ticker run while a layer is
+# waiting for the player to type?
+#
+#   python benchmarks/bench_stdin.py [--wait 1.0]
+#
+# A child process waits on a prompt while a ticker task measures how late
+# each tick fires. The parent types the answer after --wait seconds. Input
+# is read with loop.add_reader, with the reader-thread fallback, and with a
+# plain blocking input() for comparison.
+
+import os
+import sys
+import time
+import json
+import argparse
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = '''
+import sys, time, json, asyncio
+from cicada.session import ConsoleSession
+
+TICK = 0.01
+
+async def ticker(lags):
+    while True:
+        due = time.perf_counter() + TICK
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - due)
+
+async def main(mode):
+    lags = []
+    task = asyncio.create_task(ticker(lags))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    if mode == "blocking":
+        line = input()
+    elif mode == "thread":
+        # No fileno(), so the reader falls back to its pump thread.
+        stdin = type("Lines", (), {{"readline": staticmethod(sys.stdin.readline)}})()
+        line = await ConsoleSession(stdin=stdin, stdout=sys.stderr).ask()
+    else:
+        line = await ConsoleSession(stdout=sys.stderr).ask()
+    waited = time.perf_counter() - start
+    task.cancel()
+    print(json.dumps({{"line": line, "waited": waited, "ticks": len(lags), "max_lag": max(lags, default=waited)}}))
+
+asyncio.run(main({mode!r}))
+'''
+
+def run_pipe(mode, wait):
+    child = subprocess.Popen(
+        [sys.executable, "-c", PROBE.format(mode=mode)], cwd=ROOT,
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    time.sleep(wait)
+    out, _ = child.communicate("answer\n", timeout=30)
+    return json.loads(out)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--wait", type=float, default=1.0)
+    args = parser.parse_args()
+
+    rows = [
+        ("input() (blocking)", run_pipe("blocking", args.wait)),
+        ("add_reader", run_pipe("async", args.wait)),
+        ("reader thread", run_pipe("thread", args.wait)),
+    ]
+    print(f"{'reader':>20} {'waited':>9} {'ticks':>6} {'max tick lag':>13}")
+    for name, r in rows:
+        print(f"{name:>20} {r['waited'] * 1000:>6.0f} ms {r['ticks']:>6} {r['max_lag'] * 1000:>10.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# === CICADA_Δ_ENGINE ===
+# Throughput benchmark: headless sweeps of every layer under the random,
+# oracle and adversarial policies on a virtual clock. Reports solves per
+# second, per-layer latency histograms, SQLite writes and memory peaks.
+#
+#   python benchmarks/bench_throughput.py [--sessions N] [--policy P ...] [--layers 1 2 ...]
+
+import os
+import sys
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.simulate import POLICIES, MAX_PROMPTS_PER_LAYER, simulate
+
+# Latency bucket upper bounds in milliseconds; the last bucket is open-ended.
+BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50)
+BARS = " ▁▂▃▄▅▆▇█"
+
+def histogram(durations):
+    counts = [0] * (len(BUCKETS) + 1)
+    for elapsed in durations:
+        ms = elapsed * 1000
+        counts[next((i for i, bound in enumerate(BUCKETS) if ms < bound), len(BUCKETS))] += 1
+    top = max(counts)
+    return "".join(BARS[-(-c * (len(BARS) - 1) // top)] if c else BARS[0] for c in counts)
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+def print_report(report, per_layer):
+    print(f"\n=== {report.policy.name}: {report.sessions} sessions, {report.runs} layer runs ===")
+    if per_layer:
+        print(f"{'layer':>5} {'solved':>7} {'prompts':>7} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'errors':>6}  <{BUCKETS[0]}ms .. >{BUCKETS[-1]}ms")
+        for index, stats in sorted(report.layers.items()):
+            print(
+                f"{index:>5} {stats.solved:>3}/{stats.runs:<3} {stats.prompts / stats.runs:>7.1f} "
+                f"{statistics.median(stats.durations) * 1000:>8.3f} {percentile(stats.durations, 0.95) * 1000:>8.3f} "
+                f"{max(stats.durations) * 1000:>8.3f} {len(stats.errors):>6}  |{histogram(stats.durations)}|"
+            )
+    durations = [d for stats in report.layers.values() for d in stats.durations]
+    print(f"{'all layers':>18} |{histogram(durations)}|  p50 {statistics.median(durations) * 1000:.3f} ms, p95 {percentile(durations, 0.95) * 1000:.3f} ms")
+    print(f"{'wall':>18} {report.elapsed:.3f} s")
+    print(f"{'solves':>18} {report.solves} ({report.solves_per_second():.1f}/s)")
+    print(f"{'layer runs/s':>18} {report.runs / report.elapsed:.1f}")
+    print(f"{'prompts':>18} {report.prompts}")
+    print(f"{'sqlite commits':>18} {report.commits} ({report.commits / report.runs:.2f}/layer run)")
+    print(f"{'rows written':>18} {report.rows_written}")
+    if report.memory_peak is not None:
+        print(f"{'traced peak':>18} {report.memory_peak / 2**20:.1f} MiB")
+    if report.max_rss is not None:
+        print(f"{'max rss':>18} {report.max_rss / 2**20:.1f} MiB")
+    if hasattr(report.policy, "hits"):
+        print(f"{'oracle answers':>18} {report.policy.hits} known, {report.policy.misses} guessed")
+    failures = {index: stats.errors[0] for index, stats in sorted(report.layers.items()) if stats.errors}
+    for index, error in failures.items():
+        print(f"{'error':>18} layer {index}: {error!r}"[:160])
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=5)
+    parser.add_argument("--policy", nargs="+", choices=sorted(POLICIES), default=["random", "oracle", "adversarial"])
+    parser.add_argument("--layers", type=int, nargs="+")
+    parser.add_argument("--max-prompts", type=int, default=MAX_PROMPTS_PER_LAYER)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--write-behind", action="store_true")
+    parser.add_argument("--trace-memory", action="store_true", help="report the tracemalloc peak (slows the run)")
+    parser.add_argument("--summary", action="store_true", help="skip the per-layer table")
+    args = parser.parse_args()
+
+    for policy in args.policy:
+        report = simulate(
+            policy, args.sessions, args.layers, args.seed, args.max_prompts,
+            write_behind=args.write_behind, trace_memory=args.trace_memory,
+        )
+        print_report(report, not args.summary)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# === CICADA_Δ_ENGINE ===
+# Token index benchmark: building a log-derived puzzle (five-letter echo
+# words, the third-to-last token) by re-splitting the joined log versus
+# querying TokenIndex, as the history grows.
+#
+#   python benchmarks/bench_tokens.py [--history N ...]
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.tokens import TokenIndex
+
+WORDS = ("BOOT:", "LAYER9_SOLVED", "CONFESS:never", "alpha", "crane", "ghost", "Δ=0.81", "twin", "echo", "12345")
+
+def per_call(fn, calls):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls
+
+def rescan(entries, rng):
+    tokens = " ".join(entries).split()
+    selected = [t for t in tokens if t.isalpha() and len(t) == 5]
+    return rng.sample(selected, min(3, len(selected))), tokens[-3]
+
+def indexed(index, rng):
+    return index.sample(rng, 5, "alpha", 3), index.last(3)[0]
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--history", type=int, nargs="+", default=[100, 1000, 10000, 100000])
+    parser.add_argument("--calls", type=int, default=100)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    print(f"{'entries':>8} {'rescan µs':>11} {'index µs':>10} {'build ms':>10} {'append µs':>10}")
+    for size in args.history:
+        entries = [" ".join(rng.choices(WORDS, k=3)) for _ in range(size)]
+        old = per_call(lambda: rescan(entries, rng), max(1, args.calls * 1000 // size))
+        start = time.perf_counter()
+        index = TokenIndex()
+        index.add_entries(entries)
+        build = time.perf_counter() - start
+        new = per_call(lambda: indexed(index, rng), args.calls)
+        append = per_call(lambda: index.add_entry("LAYER7_SOLVED Δ+0.2 crane"), args.calls)
+        print(f"{size:>8} {old * 1e6:>11.1f} {new * 1e6:>10.2f} {build * 1000:>10.2f} {append * 1e6:>10.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# === CICADA_Δ_ENGINE ===
+# Twin memory benchmark: a player failing layer 2 N times. Every failure makes
+# the twin speak once and recall one memory, as twin_reference_memory does.
+# Compares the old unbounded tone lists with TwinMemory.
+#
+#   python benchmarks/bench_twin_memory.py [--failures N]
+
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from collections import defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cicada.memory import TwinMemory
+
+TONES = ("ambiguous", "cold", "unstable")
+
+def with_lists(failures, rng):
+    memory = defaultdict(list)
+    for n in range(failures):
+        memory[rng.choice(TONES)].append((f"attempt {n}", "response"))
+        pool = memory.get("ambiguous", []) + memory.get("cold", []) + memory.get("unstable", [])
+        rng.choice(pool)
+    return memory
+
+def with_twin_memory(failures, rng):
+    memory = TwinMemory()
+    for n in range(failures):
+        memory[rng.choice(TONES)].append((f"attempt {n}", "response"))
+        memory.sample(rng, TONES)
+    return memory
+
+def measure(label, fn, failures):
+    start = time.perf_counter()
+    fn(failures, random.Random(0))
+    elapsed = time.perf_counter() - start
+    # Memory is measured on a second pass; tracing distorts the timing.
+    tracemalloc.start()
+    kept = fn(failures, random.Random(0))
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label:>18} {elapsed / failures * 1e6:9.2f} µs/failure {size / 1024:10.1f} KiB retained")
+    return kept
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--failures", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+    for failures in args.failures:
+        print(f"failures: {failures}")
+        measure("tone lists", with_lists, failures)
+        measure("TwinMemory", with_twin_memory, failures)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# === CICADA_Δ_ENGINE ===
+# Core engine package. Puzzle layers live in cicada.layers and are imported
+# by the registry only when a session reaches them.
+
+from .config import MAX_LAYERS, TWIN_ID, DIVERGENCE_THRESHOLD, PLAYER_DB, Δ_INIT_SEED
+from .utils import sha256, entropy_sample, timestamp
+from .hashing import HashCache, get_hash_cache, set_hash_cache, digest, raw_digest, digest_int, digest_shift
+from .clock import RealClock, ScaledClock, VirtualClock, ClockLoop, get_clock, set_clock, make_clock
+from .entropy import EntropyPool, get_entropy_pool, set_entropy_pool
+from .storage import ConnectionPool, WriteBehindQueue, get_pool, set_pool, get_writer, setup_db
+from .player import Player, PlayerLog, PlayerData
+from .divergence import DivergenceEngine
+from .memory import MemoryStore, TwinMemory
+from .responses import ResponseEngine, get_response_engine
+from .twin import Twin
+from .registry import LayerSpec, LAYERS, register_layer, dispatch_table, loaded_layers
+from .factory import PuzzleFactory, PuzzleSpec, get_puzzle_factory, set_puzzle_factory
+from .circuit import Circuit
+from .session import Session, ConsoleSession, StreamSession, SessionClosed
+from .scheduler import Timelock, TimelockScheduler, get_scheduler
+from .engine import boot_cicada, play_session
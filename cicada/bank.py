@@ -0,0 +1,147 @@
+# === CICADA_Δ_ENGINE ===
+# Divergence Bank: every session's Δ in one NumPy array, perturbed in batches.
+# Kept out of cicada.divergence so the single-player CLI never imports NumPy.
+
+import random
+
+import numpy as np
+
+from .config import DIVERGENCE_THRESHOLD, Δ_INIT_SEED
+from .history import RingHistory, epoch_us
+from .hashing import HEX_ORD_SUMS, raw_digest, digest_shift
+
+BANK_INITIAL_CAPACITY = 1024
+_HEX_ORD_SUMS = np.array(HEX_ORD_SUMS, dtype=np.int64)
+
+def entropy_shifts(entropies, rng=None):
+    # Same shift as DivergenceEngine.perturb: the sum of the first 16 hex
+    # characters of the sha256 digest, mod 1000, in thousandths, signed by a
+    # coin flip. Hashing is per string; everything after it is vectorized,
+    # reading the first 8 raw digest bytes through a per-byte ord-sum table.
+    raw = b"".join(raw_digest(e)[:8] for e in entropies)
+    sums = _HEX_ORD_SUMS[np.frombuffer(raw, dtype=np.uint8).reshape(-1, 8)].sum(axis=1, dtype=np.int64)
+    shifts = (sums % 1000) / 1000.0
+    flips = (rng or random).random
+    signs = np.fromiter((1.0 if flips() > 0.5 else -1.0 for _ in entropies), dtype=np.float64, count=len(entropies))
+    return shifts * signs
+
+# === BANK ===
+
+class DivergenceBank:
+    def __init__(self, capacity=BANK_INITIAL_CAPACITY, lower=None, upper=None, threshold=DIVERGENCE_THRESHOLD):
+        self.values = np.zeros(capacity, dtype=np.float64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.lower = lower
+        self.upper = upper
+        self.threshold = threshold
+        self._views = {}
+        self._free = []
+        self._size = 0
+
+    def __len__(self):
+        return len(self._views)
+
+    def open(self, value=Δ_INIT_SEED):
+        if self._free:
+            slot = self._free.pop()
+        else:
+            if self._size == len(self.values):
+                self._grow()
+            slot = self._size
+            self._size += 1
+        self.values[slot] = value
+        self.active[slot] = True
+        view = self._views[slot] = DivergenceView(self, slot)
+        return view
+
+    def release(self, slot):
+        if self._views.pop(slot, None) is not None:
+            self.active[slot] = False
+            self.values[slot] = 0.0
+            self._free.append(slot)
+
+    def _grow(self):
+        capacity = len(self.values) * 2
+        values = np.zeros(capacity, dtype=np.float64)
+        active = np.zeros(capacity, dtype=bool)
+        values[:self._size] = self.values[:self._size]
+        active[:self._size] = self.active[:self._size]
+        self.values, self.active = values, active
+
+    def _settle(self, slots):
+        # Round and clamp only the touched slots, in place.
+        touched = self.values[slots]
+        np.round(touched, 6, out=touched)
+        if self.lower is not None or self.upper is not None:
+            np.clip(touched, self.lower, self.upper, out=touched)
+        self.values[slots] = touched
+
+    def apply(self, slots, deltas):
+        # Δ += delta for each slot; repeated slots accumulate.
+        slots = np.asarray(slots, dtype=np.intp)
+        np.add.at(self.values, slots, deltas)
+        self._settle(slots)
+        return self.values[slots]
+
+    def perturb(self, slots, entropies, rng=None):
+        slots = np.asarray(slots, dtype=np.intp)
+        shifts = entropy_shifts(entropies, rng)
+        values = self.apply(slots, shifts)
+        stamp = epoch_us()
+        for slot, shift, value in zip(slots.tolist(), shifts.tolist(), values.tolist()):
+            self._views[slot].log.record(shift, value, stamp)
+        return values
+
+    def over_threshold(self, threshold=None):
+        # Slots of open sessions whose Δ has crossed the threshold.
+        limit = self.threshold if threshold is None else threshold
+        used = self._size
+        return np.flatnonzero(self.active[:used] & (self.values[:used] > limit))
+
+    def view(self, slot):
+        return self._views[slot]
+
+# === PER-SESSION VIEW ===
+
+class DivergenceView:
+    # Stands in for DivergenceEngine inside a layer: .value, .log, .perturb()
+    # and .get_state() behave the same, but Δ lives in the bank's array.
+    def __init__(self, bank, slot):
+        self.bank = bank
+        self.slot = slot
+        self.rng = None
+        self.log = RingHistory()
+
+    @property
+    def value(self):
+        return float(self.bank.values[self.slot])
+
+    @value.setter
+    def value(self, value):
+        self.bank.values[self.slot] = value
+
+    def perturb(self, entropy):
+        # A single session's perturb stays in Python floats; a one-element
+        # array batch costs several times more. DivergenceBank.perturb is for
+        # real batches.
+        bank = self.bank
+        shift = digest_shift(entropy)
+        if (self.rng or random).random() <= 0.5:
+            shift = -shift
+        value = round(float(bank.values[self.slot]) + shift, 6)
+        if bank.lower is not None and value < bank.lower:
+            value = bank.lower
+        if bank.upper is not None and value > bank.upper:
+            value = bank.upper
+        bank.values[self.slot] = value
+        self.log.record(shift, value)
+        return value
+
+    def get_state(self):
+        return {
+            "Δ": self.value,
+            "log": self.log[-5:]
+        }
+
+    def close(self):
+        self.bank.release(self.slot)
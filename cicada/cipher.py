@@ -0,0 +1,109 @@
+# === CICADA_Δ_ENGINE ===
+# Shift-cipher kernel shared by the Caesar puzzles: str.translate tables
+# precomputed per alphabet set and shift, bulk helpers for many phrases, and
+# a bytes / NumPy path for long ASCII text.
+
+import string
+
+LOWER = string.ascii_lowercase
+UPPER = string.ascii_uppercase
+DIGITS = string.digits
+
+# Each alphabet rotates on its own: letters mod 26, digits mod 10.
+CAESAR_ALPHABETS = (LOWER, UPPER, DIGITS)
+LETTERS = (LOWER, UPPER)
+UPPERCASE = (UPPER,)
+
+# Above this length ASCII text goes through bytes.translate instead.
+LONG_TEXT = 4096
+
+def _period(alphabets):
+    period = 1
+    for alphabet in alphabets:
+        n = len(alphabet)
+        a, b = period, n
+        while b:
+            a, b = b, a % b
+        period = period * n // a
+    return period
+
+def _build(alphabets, shift):
+    src = "".join(alphabets)
+    dst = "".join(alphabet[shift % len(alphabet):] + alphabet[:shift % len(alphabet)] for alphabet in alphabets)
+    return str.maketrans(src, dst), bytes.maketrans(src.encode(), dst.encode())
+
+# (alphabets, shift mod period) -> (str table, bytes table). The common
+# alphabet sets are filled for every shift at import; any other set is
+# filled on first use.
+_TABLES = {}
+
+def _tables(alphabets, shift):
+    alphabets = tuple(alphabets)
+    key = (alphabets, shift % _period(alphabets))
+    tables = _TABLES.get(key)
+    if tables is None:
+        tables = _TABLES[key] = _build(alphabets, key[1])
+    return tables
+
+for _alphabets in (CAESAR_ALPHABETS, LETTERS, UPPERCASE):
+    for _shift in range(_period(_alphabets)):
+        _tables(_alphabets, _shift)
+
+# === CAESAR ===
+
+def caesar_table(shift, alphabets=CAESAR_ALPHABETS):
+    return _tables(alphabets, shift)[0]
+
+def encrypt(text, shift, alphabets=CAESAR_ALPHABETS):
+    if len(text) > LONG_TEXT and text.isascii():
+        return encrypt_bytes(text.encode("ascii"), shift, alphabets).decode("ascii")
+    return text.translate(_tables(alphabets, shift)[0])
+
+def decrypt(text, shift, alphabets=CAESAR_ALPHABETS):
+    return encrypt(text, -shift, alphabets)
+
+def encrypt_many(texts, shift, alphabets=CAESAR_ALPHABETS):
+    # One translate over the joined phrases; NUL is never remapped, so it is
+    # a safe separator unless a phrase already contains one.
+    texts = list(texts)
+    if not texts:
+        return []
+    joined = "\0".join(texts)
+    if joined.count("\0") != len(texts) - 1:
+        return [encrypt(text, shift, alphabets) for text in texts]
+    return encrypt(joined, shift, alphabets).split("\0")
+
+def decrypt_many(texts, shift, alphabets=CAESAR_ALPHABETS):
+    return encrypt_many(texts, -shift, alphabets)
+
+def encrypt_bytes(data, shift, alphabets=CAESAR_ALPHABETS):
+    return bytes(data).translate(_tables(alphabets, shift)[1])
+
+def encrypt_array(codes, shift, alphabets=CAESAR_ALPHABETS):
+    # uint8 array in, uint8 array out, via a 256-entry lookup table. NumPy is
+    # imported here so the console engine never loads it.
+    import numpy as np
+    lut = np.frombuffer(_tables(alphabets, shift)[1], dtype=np.uint8)
+    return lut[np.asarray(codes, dtype=np.uint8)]
+
+# === CODE POINT SHIFT ===
+
+class _CodepointShift(dict):
+    # Lazily filled translate table for (ord(c) + shift) % modulus over any
+    # code point; str.translate looks each character up once.
+    def __init__(self, shift, modulus):
+        self.shift = shift
+        self.modulus = modulus
+
+    def __missing__(self, code):
+        value = self[code] = (code + self.shift) % self.modulus
+        return value
+
+_CODEPOINT_TABLES = {}
+
+def codepoint_shift(text, shift, modulus=256):
+    key = (shift % modulus, modulus)
+    table = _CODEPOINT_TABLES.get(key)
+    if table is None:
+        table = _CODEPOINT_TABLES[key] = _CodepointShift(*key)
+    return text.translate(table)
@@ -0,0 +1,159 @@
+# === CICADA_Δ_ENGINE ===
+# Logic circuits as DAGs in compact integer arrays. Truth tables are Python
+# ints used as bitsets, one bit per input assignment, so a single bitwise op
+# evaluates a gate across all 2^n assignments at once.
+
+from array import array
+
+from .config import CIRCUIT_MAX_INPUTS
+
+GATE_NAMES = ("AND", "OR", "XOR", "NAND", "NOR", "XNOR")
+GATE_CODES = {name: code for code, name in enumerate(GATE_NAMES)}
+
+# code -> f(x, y, mask); mask has one bit per assignment being evaluated.
+GATE_OPS = (
+    lambda x, y, mask: x & y,
+    lambda x, y, mask: x | y,
+    lambda x, y, mask: x ^ y,
+    lambda x, y, mask: ~(x & y) & mask,
+    lambda x, y, mask: ~(x | y) & mask,
+    lambda x, y, mask: ~(x ^ y) & mask,
+)
+
+def input_column(index, inputs):
+    # Truth table of input `index`: assignment k sets it to bit `index` of k,
+    # i.e. runs of 2^index zeros then 2^index ones, doubled up to 2^inputs.
+    run = 1 << index
+    column = ((1 << run) - 1) << run
+    width = run * 2
+    while width < 1 << inputs:
+        column |= column << width
+        width *= 2
+    return column
+
+# === CIRCUIT ===
+
+class Circuit:
+    # Nodes 0..inputs-1 are the inputs; gate i is node inputs + i and reads
+    # two earlier nodes, so node order is already topological.
+    def __init__(self, inputs, ops=(), left=(), right=()):
+        self.inputs = inputs
+        self.ops = array("B", ops)
+        self.left = array("I", left)
+        self.right = array("I", right)
+        self._tables = None
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __repr__(self):
+        return f"Circuit(inputs={self.inputs}, gates={len(self)}, depth={self.depth()})"
+
+    @property
+    def nodes(self):
+        return self.inputs + len(self.ops)
+
+    def add(self, gate, a, b):
+        op = GATE_CODES[gate] if isinstance(gate, str) else gate
+        if not (0 <= a < self.nodes and 0 <= b < self.nodes):
+            raise ValueError(f"gate operands must be existing nodes (< {self.nodes})")
+        self.ops.append(op)
+        self.left.append(a)
+        self.right.append(b)
+        self._tables = None
+        return self.nodes - 1
+
+    def gate(self, node):
+        i = node - self.inputs
+        return GATE_NAMES[self.ops[i]], self.left[i], self.right[i]
+
+    def depth(self):
+        levels = [0] * self.inputs
+        for a, b in zip(self.left, self.right):
+            levels.append(max(levels[a], levels[b]) + 1)
+        return max(levels, default=0)
+
+    # === EVALUATION ===
+
+    def evaluate(self, bits):
+        # One assignment: node values as 0/1 ints, inputs first.
+        if len(bits) != self.inputs:
+            raise ValueError(f"expected {self.inputs} input bits, got {len(bits)}")
+        values = [int(bit) for bit in bits]
+        for op, a, b in zip(self.ops, self.left, self.right):
+            values.append(GATE_OPS[op](values[a], values[b], 1))
+        return values
+
+    def tables(self):
+        # Truth table of every node across all 2^inputs assignments.
+        if self._tables is None:
+            if self.inputs > CIRCUIT_MAX_INPUTS:
+                raise ValueError(f"truth tables are limited to {CIRCUIT_MAX_INPUTS} inputs")
+            mask = (1 << (1 << self.inputs)) - 1
+            tables = [input_column(i, self.inputs) for i in range(self.inputs)]
+            for op, a, b in zip(self.ops, self.left, self.right):
+                tables.append(GATE_OPS[op](tables[a], tables[b], mask))
+            self._tables = tables
+        return self._tables
+
+    def truth_table(self, node=-1):
+        return self.tables()[node]
+
+    def satisfying(self, node=-1):
+        # Number of assignments that drive the node to 1.
+        return self.truth_table(node).bit_count()
+
+    def degenerate(self):
+        # Gates whose truth table is constant or repeats an earlier node's.
+        mask = (1 << (1 << self.inputs)) - 1
+        seen = set()
+        found = []
+        for node, table in enumerate(self.tables()):
+            if node >= self.inputs and (table in seen or table == 0 or table == mask):
+                found.append(node)
+            seen.add(table)
+        return found
+
+    # === CONSTRUCTION ===
+
+    @classmethod
+    def chain(cls, gates):
+        # The linear shape LogicGatePuzzle presents: gate i reads the previous
+        # gate (input 0 for the first) and one fresh input.
+        circuit = cls(len(gates) + 1)
+        previous = 0
+        for i, gate in enumerate(gates):
+            previous = circuit.add(gate, previous, i + 1)
+        return circuit
+
+    @classmethod
+    def random(cls, rng, inputs, gates, names=GATE_NAMES, unique=True, retries=8):
+        # Random DAG: each gate reads two distinct earlier nodes. With unique
+        # set, a gate whose truth table is constant or already present is
+        # redrawn up to `retries` times before it is kept anyway.
+        if inputs < 2:
+            raise ValueError("a random circuit needs at least two inputs")
+        circuit = cls(inputs)
+        codes = [GATE_CODES[name] for name in names]
+        if not unique:
+            for _ in range(gates):
+                a, b = rng.sample(range(circuit.nodes), 2)
+                circuit.add(rng.choice(codes), a, b)
+            return circuit
+        mask = (1 << (1 << inputs)) - 1
+        tables = list(circuit.tables())
+        seen = set(tables)
+        for _ in range(gates):
+            for _ in range(retries + 1):
+                op = rng.choice(codes)
+                a, b = rng.sample(range(len(tables)), 2)
+                table = GATE_OPS[op](tables[a], tables[b], mask)
+                if table not in seen and table != 0 and table != mask:
+                    break
+            circuit.ops.append(op)
+            circuit.left.append(a)
+            circuit.right.append(b)
+            tables.append(table)
+            seen.add(table)
+        circuit._tables = tables
+        return circuit
@@ -0,0 +1,149 @@
+# === CICADA_Δ_ENGINE ===
+# Injectable clocks. The engine paces itself with asyncio.sleep and loop
+# timers and stamps events with timestamp()/epoch_us(); all of them read the
+# current clock, so a run can go at real speed, scaled, or in virtual time.
+
+import time
+import asyncio
+
+from .config import CLOCK_MODE, CLOCK_SCALE
+
+# === CLOCKS ===
+
+class RealClock:
+    mode = "real"
+
+    def monotonic(self):
+        return time.monotonic()
+
+    def wall(self):
+        return time.time()
+
+    def wall_us(self):
+        return time.time_ns() // 1000
+
+    def timeout(self, seconds):
+        # Real seconds to block for `seconds` of clock time.
+        return seconds
+
+    def advance(self, seconds):
+        pass
+
+class ScaledClock(RealClock):
+    mode = "scaled"
+
+    def __init__(self, scale=CLOCK_SCALE):
+        if scale <= 0:
+            raise ValueError("clock scale must be positive")
+        self.scale = scale
+        self._mono0 = time.monotonic()
+        self._wall0 = time.time()
+
+    def monotonic(self):
+        return self._mono0 + (time.monotonic() - self._mono0) * self.scale
+
+    def wall(self):
+        return self._wall0 + (self.monotonic() - self._mono0)
+
+    def wall_us(self):
+        return int(self.wall() * 1_000_000)
+
+    def timeout(self, seconds):
+        return seconds / self.scale
+
+class VirtualClock(RealClock):
+    # Time stands still until the loop has nothing ready, then jumps straight
+    # to the next timer. Event ordering is the same as in real time.
+    mode = "virtual"
+
+    def __init__(self, start=None):
+        self._now = 0.0
+        self._wall0 = time.time() if start is None else start
+
+    def monotonic(self):
+        return self._now
+
+    def wall(self):
+        return self._wall0 + self._now
+
+    def wall_us(self):
+        return int(self.wall() * 1_000_000)
+
+    def timeout(self, seconds):
+        return 0
+
+    def advance(self, seconds):
+        self._now += seconds
+
+def make_clock(mode=CLOCK_MODE, scale=CLOCK_SCALE):
+    if mode == "real":
+        return RealClock()
+    if mode == "scaled":
+        return ScaledClock(scale)
+    if mode == "virtual":
+        return VirtualClock()
+    raise ValueError(f"Unknown clock mode: {mode}")
+
+_clock = None
+
+def get_clock():
+    global _clock
+    if _clock is None:
+        _clock = make_clock()
+    return _clock
+
+def set_clock(clock):
+    global _clock
+    _clock = clock
+
+# === EVENT LOOP ===
+
+class _ClockSelector:
+    # Wraps the real selector so the loop blocks for clock time, not real
+    # time. A virtual clock polls, and when nothing is ready it advances to
+    # the deadline the loop was about to sleep until.
+    def __init__(self, selector, clock):
+        self._selector = selector
+        self._clock = clock
+
+    def select(self, timeout=None):
+        if timeout is None:
+            return self._selector.select(None)
+        events = self._selector.select(self._clock.timeout(timeout))
+        if not events and timeout > 0:
+            self._clock.advance(timeout)
+        return events
+
+    def __getattr__(self, name):
+        return getattr(self._selector, name)
+
+class ClockLoop(asyncio.SelectorEventLoop):
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+        self._selector = _ClockSelector(self._selector, clock)
+
+    def time(self):
+        return self.clock.monotonic()
+
+def run(coro, clock=None):
+    # asyncio.run with the given clock installed for the duration.
+    clock = clock or get_clock()
+    previous = _clock
+    set_clock(clock)
+    try:
+        if clock.mode == "real":
+            return asyncio.run(coro)
+        loop = ClockLoop(clock)
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            pending = asyncio.all_tasks(loop)
+            if pending:
+                for task in pending:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    finally:
+        set_clock(previous)
@@ -0,0 +1,38 @@
+# === CICADA_Δ_ENGINE ===
+# Global Constants
+
+import os
+
+MAX_LAYERS = 56
+TWIN_ID = "Δ_Twin_v0.1"
+DIVERGENCE_THRESHOLD = 3.14159
+PLAYER_DB = "cicada_player.db"
+DB_JOURNAL_MODE = os.environ.get("CICADA_DB_JOURNAL_MODE", "WAL")
+DB_SYNCHRONOUS = os.environ.get("CICADA_DB_SYNCHRONOUS", "NORMAL")
+DB_STATEMENT_CACHE = 128
+WRITE_BEHIND = os.environ.get("CICADA_WRITE_BEHIND", "1") != "0"
+WRITE_BEHIND_INTERVAL = 0.5
+WRITE_BEHIND_MAX_PENDING = 64
+Δ_INIT_SEED = 0.666
+DIVERGENCE_HISTORY = 64
+# "fast": entropy samples come from each session's seeded stream. "crypto":
+# sessions not pinned to a seed draw them from os.urandom via the entropy pool.
+ENTROPY_MODE = os.environ.get("CICADA_ENTROPY_MODE", "fast")
+ENTROPY_CHUNK = 65536
+TWIN_MEMORY_CAPACITY = 32
+TWIN_MAX_INPUT = 2048
+SCRAMBLE_CHUNK = 64
+TWIN_MEMORY_MAX_AGE = None
+TWIN_MEMORY_DIR = os.environ.get("CICADA_TWIN_MEMORY_DIR")
+TOKEN_RECENT = 8
+PREDICTOR_ORDER = 2
+PREDICTOR_MAX_CONTEXTS = 1024
+PREDICTOR_MAX_SYMBOLS = 256
+PREDICTOR_MAX_SYMBOL_LEN = 64
+PUZZLE_POOL_SIZE = 32
+PUZZLE_WORKERS = None
+PUZZLE_BATCH = 64
+CIRCUIT_MAX_INPUTS = 20
+HASH_CACHE_SIZE = 4096
+CLOCK_MODE = os.environ.get("CICADA_CLOCK", "real")
+CLOCK_SCALE = float(os.environ.get("CICADA_CLOCK_SCALE", "10"))
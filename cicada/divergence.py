@@ -0,0 +1,30 @@
+# === CICADA_Δ_ENGINE ===
+# Δ Divergence Core
+
+import random
+
+from .config import Δ_INIT_SEED
+from .hashing import digest_shift
+from .history import RingHistory
+
+# === DIVERGENCE CORE ===
+
+class DivergenceEngine:
+    def __init__(self, history=None, rng=None):
+        self.value = Δ_INIT_SEED
+        self.rng = rng or random.Random()
+        self.log = history if history is not None else RingHistory()
+
+    def perturb(self, entropy):
+        shift = digest_shift(entropy)
+        shift = shift if self.rng.random() > 0.5 else -shift
+        self.value += shift
+        self.value = round(self.value, 6)
+        self.log.record(shift, self.value)
+        return self.value
+
+    def get_state(self):
+        return {
+            "Δ": self.value,
+            "log": self.log[-5:]
+        }
@@ -0,0 +1,74 @@
+# === CICADA_Δ_ENGINE ===
+# System Boot and layer dispatch
+
+import asyncio
+
+from .utils import entropy_sample
+from .storage import setup_db
+from .player import Player
+from .twin import Twin
+from .divergence import DivergenceEngine
+from .registry import dispatch_table
+from .session import ConsoleSession
+
+# === MAIN BOOT SEQUENCE ===
+
+async def boot_cicada(session=None):
+    setup_db()
+    if session is not None:
+        await play_session(session)
+        return
+    session = ConsoleSession()
+    try:
+        await play_session(session)
+    finally:
+        await session.close()
+
+async def play_session(session, divergence=None, pool=None):
+    # One player's run from handle prompt to the first uncleared layer.
+    # Transports call this directly once the database is set up; a server
+    # passes a DivergenceBank view so all sessions share one Δ array.
+    session.say(">> Δ CICADA SYSTEM BOOTING...")
+    username = await session.ask("Enter your handle: ")
+    player = Player(username, pool=pool)
+    player.sync()
+
+    twin = Twin(player, seed=session.seed)
+    divergence = divergence or DivergenceEngine()
+    divergence.rng = twin.rng
+    memory_path = twin.memory_path()
+    if memory_path:
+        twin.memory.load(memory_path)
+    session.attach(player, twin, divergence)
+    try:
+        session.say(f">> Welcome, {username}. Layer {player.layer}. Δ = {player.delta}")
+        await asyncio.sleep(1)
+
+        for i in range(3):
+            ent = entropy_sample(rng=twin.rng)
+            Δ = divergence.perturb(ent)
+            session.say(f"[Δ ENGINE] Entropy injected: {ent} → Δ: {Δ}")
+            await asyncio.sleep(0.5)
+
+        session.say(twin.speak("Who are you really?"))
+        with player.transaction():
+            player.update("delta", divergence.value)
+            player.update("log", f"BOOT: Δ={divergence.value}")
+
+        # Play forward through consecutive layers until one is left uncleared.
+        table = dispatch_table()
+        while True:
+            spec = table.get(player.layer)
+            if spec is None:
+                session.say(">> You have completed the Cicada Δ Engine layers or moved beyond.")
+                break
+            cleared = player.layer
+            await spec.interaction(session, player, twin, divergence)
+            player.flush()
+            if player.layer == cleared:
+                session.say(f">> Layer {spec.index} remains sealed. The twin will wait for you.")
+                break
+    finally:
+        player.save_models()
+        if memory_path:
+            twin.memory.save(memory_path)
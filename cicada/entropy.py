@@ -0,0 +1,102 @@
+# === CICADA_Δ_ENGINE ===
+# Entropy service: alphabet tokens cut from bulk random bytes. Unseeded calls
+# slice a pre-filled buffer that a daemon thread refills in the background.
+
+import os
+import random
+import threading
+
+from .config import ENTROPY_MODE, ENTROPY_CHUNK
+
+ENTROPY_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+# Bytes below 252 map evenly onto the 36 characters; the top four are dropped
+# so the mapping stays unbiased.
+_USABLE = 256 - 256 % len(ENTROPY_ALPHABET)
+_TABLE = bytes(ord(ENTROPY_ALPHABET[b % len(ENTROPY_ALPHABET)]) for b in range(256))
+_DROP = bytes(range(_USABLE, 256))
+
+def entropy_chars(randbytes, count):
+    # randbytes(n) -> n random bytes: os.urandom, or a Random's randbytes for
+    # a reproducible stream.
+    out = b""
+    while len(out) < count:
+        need = count - len(out)
+        out += randbytes(need + need // 32 + 4).translate(_TABLE, _DROP)
+    return out[:count].decode("ascii")
+
+def entropy_source(mode):
+    if mode == "crypto":
+        return os.urandom
+    if mode == "fast":
+        return random.Random().randbytes
+    raise ValueError(f"Unknown entropy mode: {mode}")
+
+# === POOL ===
+
+class EntropyPool:
+    def __init__(self, mode=ENTROPY_MODE, chunk=ENTROPY_CHUNK):
+        self.mode = mode
+        self.chunk = chunk
+        self.refills = 0
+        self.misses = 0
+        self._source = entropy_source(mode)
+        self._buffer = entropy_chars(self._source, chunk)
+        self._pos = 0
+        self._spare = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="cicada-entropy", daemon=True)
+        self._thread.start()
+        self._wake.set()
+
+    def take(self, length):
+        with self._lock:
+            end = self._pos + length
+            if end > len(self._buffer):
+                spare, self._spare = self._spare, None
+                if spare is None or len(spare) < length:
+                    # The refill thread fell behind; generate inline.
+                    spare = entropy_chars(self._source, max(self.chunk, length))
+                    self.misses += 1
+                self._buffer = self._buffer[self._pos:] + spare
+                self._pos, end = 0, length
+                self._wake.set()
+            token = self._buffer[self._pos:end]
+            self._pos = end
+            return token
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            if self._spare is None:
+                spare = entropy_chars(self._source, self.chunk)
+                with self._lock:
+                    self._spare = spare
+                    self.refills += 1
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+
+_entropy_pool = None
+_entropy_lock = threading.Lock()
+
+def get_entropy_pool():
+    global _entropy_pool
+    if _entropy_pool is None:
+        with _entropy_lock:
+            if _entropy_pool is None:
+                _entropy_pool = EntropyPool()
+    return _entropy_pool
+
+def set_entropy_pool(pool):
+    global _entropy_pool
+    if _entropy_pool is not None and _entropy_pool is not pool:
+        _entropy_pool.close()
+    _entropy_pool = pool
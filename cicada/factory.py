@@ -0,0 +1,208 @@
+# === CICADA_Δ_ENGINE ===
+# Puzzle factory: warm pools of pre-generated puzzle instances per layer type,
+# refilled by a daemon thread, and bound to a player's session only when the
+# layer starts. Generation can also be farmed out to worker processes, which
+# return seed-determined, picklable specs.
+
+import random
+import asyncio
+import importlib
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import PUZZLE_POOL_SIZE, PUZZLE_WORKERS, PUZZLE_BATCH
+from .registry import layer_module
+
+# layer index -> class name of the puzzles whose construction is worth taking
+# off the critical path. A pooled class provides prepare(rng) for the
+# player-independent part and bind(player, twin, divergence) for the rest.
+POOLED_PUZZLES = {
+    1: "Puzzle",
+    2: "CipherPuzzle",
+    3: "HallucinationPuzzle",
+    5: "LogicGatePuzzle",
+}
+
+WORKER_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+def puzzle_class(layer):
+    if layer not in POOLED_PUZZLES:
+        raise LookupError(f"Layer {layer} has no pooled puzzle")
+    return getattr(importlib.import_module(layer_module(layer)), POOLED_PUZZLES[layer])
+
+def pooled_classes(layers=POOLED_PUZZLES):
+    return [puzzle_class(layer) for layer in layers]
+
+def prefab(cls, rng):
+    puzzle = cls.__new__(cls)
+    puzzle.prepare(rng)
+    return puzzle
+
+# === SPECS ===
+
+class PuzzleSpec:
+    # What prepare() produced for a layer from a seed, as plain attributes:
+    # cheap to pickle back from a worker and to rebuild into a puzzle.
+    def __init__(self, layer, seed, state):
+        self.layer = layer
+        self.seed = seed
+        self.state = state
+
+    def __repr__(self):
+        return f"PuzzleSpec(layer={self.layer}, seed={self.seed})"
+
+    def __eq__(self, other):
+        return isinstance(other, PuzzleSpec) and (self.layer, self.seed, self.state) == (other.layer, other.seed, other.state)
+
+    def instance(self):
+        cls = puzzle_class(self.layer)
+        puzzle = cls.__new__(cls)
+        puzzle.__dict__.update(self.state)
+        return puzzle
+
+    def build(self, player, twin, divergence):
+        return self.instance().bind(player, twin, divergence)
+
+def generate_spec(layer, seed):
+    # Runs in a worker process; the same seed gives the same spec anywhere.
+    puzzle = prefab(puzzle_class(layer), random.Random(seed))
+    state = vars(puzzle)
+    # prepare() may leave its generation rng behind; bind() replaces it.
+    state.pop("rng", None)
+    return PuzzleSpec(layer, seed, state)
+
+def generate_specs(layer, seeds):
+    return [generate_spec(layer, seed) for seed in seeds]
+
+# === FACTORY ===
+
+class PuzzleFactory:
+    def __init__(self, size=PUZZLE_POOL_SIZE, workers=PUZZLE_WORKERS):
+        self.size = size
+        self.workers = workers
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        # class -> deque of unbound instances. deque append/popleft are atomic,
+        # so the refill thread and the event loop share them without a lock.
+        self._pools = {}
+        self._rng = random.Random()
+        # Pooled puzzles belong to no seeded session, so in crypto mode their
+        # entropy comes from the pool rather than this stream.
+        self._rng.pinned = False
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+        self._executor = None
+
+    def __repr__(self):
+        return f"PuzzleFactory({len(self._pools)} pools, hits={self.hits}, misses={self.misses})"
+
+    def start(self, classes=None):
+        # Fill every pool before the first session arrives, then keep them
+        # topped up in the background.
+        for cls in pooled_classes() if classes is None else classes:
+            pool = self._pools.setdefault(cls, deque())
+            while len(pool) < self.size:
+                pool.append(prefab(cls, self._rng))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="cicada-puzzles", daemon=True)
+            self._thread.start()
+        return self
+
+    def available(self, cls):
+        pool = self._pools.get(cls)
+        return len(pool) if pool is not None else 0
+
+    def take(self, cls, player, twin, divergence):
+        # A session pinned to a seed must replay exactly, so it always builds
+        # its puzzles from its own RNG.
+        pool = None if twin.seeded else self._pools.get(cls)
+        if pool is not None:
+            try:
+                puzzle = pool.popleft()
+            except IndexError:
+                self.misses += 1
+            else:
+                self.hits += 1
+                if len(pool) <= self.size // 2:
+                    self._wake.set()
+                return puzzle.bind(player, twin, divergence)
+            self._wake.set()
+        return cls(player, twin, divergence)
+
+    # === PROCESS POOL ===
+
+    def executor(self):
+        if self._executor is None:
+            # The server runs the refill, write-behind and entropy threads;
+            # forking it could hand a worker a lock some thread held. Workers
+            # only need generate_spec and the layer modules, so start them
+            # from a clean forkserver, or spawn where there is none (Windows).
+            self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context(WORKER_START_METHOD))
+        return self._executor
+
+    async def generate(self, layer, seed):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor(), generate_spec, layer, seed)
+
+    async def generate_many(self, layer, seeds, batch=PUZZLE_BATCH):
+        # Seeds go out in batches so each round trip to a worker carries many
+        # puzzles; results keep the order of the seeds.
+        loop = asyncio.get_running_loop()
+        seeds = list(seeds)
+        executor = self.executor()
+        batches = await asyncio.gather(*(
+            loop.run_in_executor(executor, generate_specs, layer, seeds[i:i + batch])
+            for i in range(0, len(seeds), batch)
+        ))
+        return [spec for specs in batches for spec in specs]
+
+    async def fill(self, layer, count=None):
+        # Top a pool up from the worker processes instead of the refill thread.
+        pool = self._pools.setdefault(puzzle_class(layer), deque())
+        count = self.size - len(pool) if count is None else count
+        seeds = [self._rng.getrandbits(64) for _ in range(max(0, count))]
+        for spec in await self.generate_many(layer, seeds):
+            pool.append(spec.instance())
+            self.refills += 1
+        return len(pool)
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            for cls, pool in list(self._pools.items()):
+                while len(pool) < self.size and not self._closed:
+                    pool.append(prefab(cls, self._rng))
+                    self.refills += 1
+
+    def close(self):
+        self._closed = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+_puzzle_factory = None
+
+def get_puzzle_factory():
+    # The default factory has no pools: every take builds inline until a
+    # transport starts it.
+    global _puzzle_factory
+    if _puzzle_factory is None:
+        _puzzle_factory = PuzzleFactory()
+    return _puzzle_factory
+
+def set_puzzle_factory(factory):
+    global _puzzle_factory
+    if _puzzle_factory is not None and _puzzle_factory is not factory:
+        _puzzle_factory.close()
+    _puzzle_factory = factory
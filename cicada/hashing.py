@@ -0,0 +1,107 @@
+# === CICADA_Δ_ENGINE ===
+# Hash service: sha256 digests memoized in a bounded LRU keyed on the input
+# bytes, an uncached raw-digest path for inputs that never repeat, and
+# helpers that read numbers straight from digest bytes.
+
+import hashlib
+import threading
+from functools import lru_cache
+
+from .config import HASH_CACHE_SIZE
+
+_sha256 = hashlib.sha256
+
+# Byte value -> sum of the ord()s of its two hex digits, for vectorized
+# lookups over raw digest bytes.
+HEX_ORD_SUMS = tuple(sum(map(ord, f"{b:02x}")) for b in range(256))
+
+def raw_digest(data):
+    # Uncached: for fresh entropy a cache lookup and eviction only add cost.
+    if data.__class__ is str:
+        data = data.encode()
+    return _sha256(data).digest()
+
+def hex_ord_sum(raw, chars=16):
+    # sum(ord(c) for c in hexdigest[:chars]), hexing only the bytes it needs;
+    # summing the ASCII bytes keeps the whole thing in C.
+    return sum(raw[:(chars + 1) // 2].hex()[:chars].encode())
+
+def digest_int(raw, nbytes=8):
+    return int.from_bytes(raw[:nbytes], "big")
+
+# === CACHE ===
+
+class HashCache:
+    def __init__(self, capacity=HASH_CACHE_SIZE):
+        self.capacity = capacity
+        # functools' C LRU; keys are bytes, so str callers share entries with
+        # their encoded form.
+        self._digest = lru_cache(maxsize=capacity)(self._compute)
+
+    def __repr__(self):
+        info = self._digest.cache_info()
+        return f"HashCache({info.currsize}/{self.capacity}, hits={info.hits}, misses={info.misses})"
+
+    @staticmethod
+    def _compute(key):
+        return _sha256(key).digest()
+
+    def digest(self, data):
+        if data.__class__ is str:
+            data = data.encode()
+        elif data.__class__ is not bytes:
+            data = bytes(data)
+        return self._digest(data)
+
+    def hexdigest(self, data):
+        return self.digest(data).hex()
+
+    @property
+    def hits(self):
+        return self._digest.cache_info().hits
+
+    @property
+    def misses(self):
+        return self._digest.cache_info().misses
+
+    def metrics(self):
+        info = self._digest.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "capacity": self.capacity,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        self._digest.cache_clear()
+
+_hash_cache = None
+_hash_lock = threading.Lock()
+
+def get_hash_cache():
+    global _hash_cache
+    if _hash_cache is None:
+        with _hash_lock:
+            if _hash_cache is None:
+                _hash_cache = HashCache()
+    return _hash_cache
+
+def set_hash_cache(cache):
+    global _hash_cache
+    _hash_cache = cache
+
+# === DIGEST HELPERS ===
+
+def digest(data):
+    return get_hash_cache().digest(data)
+
+def hexdigest(data):
+    return get_hash_cache().hexdigest(data)
+
+def digest_shift(data):
+    # Magnitude of a Δ perturbation: the ord() sum of the first 16 hex
+    # characters of the digest, mod 1000, in thousandths.
+    return hex_ord_sum(raw_digest(data), 16) % 1000 / 1000.0
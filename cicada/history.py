@@ -0,0 +1,190 @@
+# === CICADA_Δ_ENGINE ===
+# Bounded Δ history: parallel array('q') / array('d') rings instead of a list
+# of (timestamp, shift, value) tuples, with O(1) window statistics and an
+# optional spill file that keeps every evicted entry.
+
+import os
+import math
+from array import array
+from collections import deque
+from datetime import datetime, timedelta
+
+from .config import DIVERGENCE_HISTORY
+from .clock import get_clock
+
+_EPOCH = datetime(1970, 1, 1)
+
+def epoch_us():
+    return get_clock().wall_us()
+
+def iso_from_epoch_us(stamp):
+    # Same naive-UTC ISO format as utils.timestamp().
+    return (_EPOCH + timedelta(microseconds=stamp)).isoformat()
+
+# === RING HISTORY ===
+
+class RingHistory:
+    def __init__(self, capacity=DIVERGENCE_HISTORY, spill_path=None):
+        if capacity < 1:
+            raise ValueError("history capacity must be positive")
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.total = 0
+        # Columns grow by append until full, then wrap at _head.
+        self.stamps = array("q")
+        self.shifts = array("d")
+        self.values = array("d")
+        self._head = 0
+        self._shift_sum = 0.0
+        self._shift_sumsq = 0.0
+        self._value_sum = 0.0
+        # Monotonic (seq, value) deques for the window min and max.
+        self._mins = deque()
+        self._maxs = deque()
+        self._spill = (array("q"), array("d"), array("d"))
+
+    def __len__(self):
+        return len(self.values)
+
+    def record(self, shift, value, stamp=None):
+        stamp = epoch_us() if stamp is None else stamp
+        seq = self.total
+        self.total += 1
+        if len(self.values) < self.capacity:
+            self.stamps.append(stamp)
+            self.shifts.append(shift)
+            self.values.append(value)
+        else:
+            i = self._head
+            old_shift, old_value = self.shifts[i], self.values[i]
+            self._shift_sum -= old_shift
+            self._shift_sumsq -= old_shift * old_shift
+            self._value_sum -= old_value
+            if self.spill_path is not None:
+                self._evict(self.stamps[i], old_shift, old_value)
+            self.stamps[i] = stamp
+            self.shifts[i] = shift
+            self.values[i] = value
+            self._head = (i + 1) % self.capacity
+        self._shift_sum += shift
+        self._shift_sumsq += shift * shift
+        self._value_sum += value
+
+        mins, maxs = self._mins, self._maxs
+        while mins and mins[-1][1] >= value:
+            mins.pop()
+        mins.append((seq, value))
+        while maxs and maxs[-1][1] <= value:
+            maxs.pop()
+        maxs.append((seq, value))
+        oldest = seq - self.capacity
+        while mins[0][0] <= oldest:
+            mins.popleft()
+        while maxs[0][0] <= oldest:
+            maxs.popleft()
+
+        # Running sums drift under repeated add/subtract; re-derive them once
+        # per lap so the cost stays O(1) amortized.
+        if self.total % self.capacity == 0:
+            self._shift_sum = math.fsum(self.shifts)
+            self._shift_sumsq = math.fsum(s * s for s in self.shifts)
+            self._value_sum = math.fsum(self.values)
+
+    # === WINDOW STATISTICS ===
+
+    def mean(self):
+        return self._value_sum / len(self) if self.values else None
+
+    def min(self):
+        return self._mins[0][1] if self._mins else None
+
+    def max(self):
+        return self._maxs[0][1] if self._maxs else None
+
+    def volatility(self):
+        # Population standard deviation of the shifts in the window.
+        n = len(self)
+        if not n:
+            return None
+        mean = self._shift_sum / n
+        return math.sqrt(max(0.0, self._shift_sumsq / n - mean * mean))
+
+    def summary(self):
+        return {
+            "count": len(self),
+            "mean": self.mean(),
+            "min": self.min(),
+            "max": self.max(),
+            "volatility": self.volatility(),
+        }
+
+    # === SEQUENCE VIEW ===
+
+    def _position(self, offset):
+        return (self._head + offset) % len(self.values)
+
+    def _entry(self, offset):
+        i = self._position(offset)
+        return (iso_from_epoch_us(self.stamps[i]), self.shifts[i], self.values[i])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        return self._entry(index)
+
+    def __iter__(self):
+        for offset in range(len(self)):
+            yield self._entry(offset)
+
+    def __repr__(self):
+        return f"RingHistory({len(self)}/{self.capacity}, total={self.total})"
+
+    # === SPILL TO DISK ===
+
+    def _evict(self, stamp, shift, value):
+        stamps, shifts, values = self._spill
+        stamps.append(stamp)
+        shifts.append(shift)
+        values.append(value)
+        if len(stamps) >= self.capacity:
+            self.flush()
+
+    def flush(self):
+        # Chunk layout: int64 count, then count stamps, shifts and values.
+        stamps, shifts, values = self._spill
+        if self.spill_path is None or not stamps:
+            return
+        with open(self.spill_path, "ab") as f:
+            array("q", [len(stamps)]).tofile(f)
+            stamps.tofile(f)
+            shifts.tofile(f)
+            values.tofile(f)
+        self._spill = (array("q"), array("d"), array("d"))
+
+    def spilled(self):
+        self.flush()
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        with open(self.spill_path, "rb") as f:
+            while True:
+                header = array("q")
+                try:
+                    header.fromfile(f, 1)
+                except EOFError:
+                    return
+                n = header[0]
+                stamps, shifts, values = array("q"), array("d"), array("d")
+                stamps.fromfile(f, n)
+                shifts.fromfile(f, n)
+                values.fromfile(f, n)
+                for stamp, shift, value in zip(stamps, shifts, values):
+                    yield (iso_from_epoch_us(stamp), shift, value)
+
+    def history(self):
+        # Everything ever recorded: spilled entries, then the live window.
+        yield from self.spilled()
+        yield from self
@@ -0,0 +1,3 @@
+# === CICADA_Δ_ENGINE ===
+# One module per puzzle layer (layerNN.py, exposing layerN_interaction).
+# Nothing is imported here; see cicada.registry for the manifest.
@@ -0,0 +1,98 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 1 Generator, Puzzle Engine, Addictive Entry Loop
+
+import asyncio
+
+from ..utils import entropy_sample
+from ..hashing import raw_digest
+from ..factory import get_puzzle_factory
+
+# === PUZZLE CORE ===
+
+class Puzzle:
+    def __init__(self, player, twin, divergence):
+        self.prepare(twin.rng)
+        self.bind(player, twin, divergence)
+
+    def prepare(self, rng):
+        # The player-independent part, which the puzzle factory builds ahead
+        # of time with its own rng.
+        self.solved = False
+        self.attempts = 0
+        self.entropy = entropy_sample(32, rng=rng)
+        # Fresh entropy never repeats, so it skips the hash cache.
+        self.solution = raw_digest(self.entropy).hex()[:6]
+        self.misleading = ''.join(rng.sample(self.solution, len(self.solution)))
+
+    def bind(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.generate()
+        return self
+
+    def generate(self):
+        self.prompt = f"""
+        --- LAYER 1: ENTRY CODE ---
+        Seek within chaos: {self.misleading}
+        Find the unmoved mover, Δ = {round(self.divergence.value, 3)}
+        Submit a 6-character code:
+        """
+
+    def check(self, attempt):
+        self.attempts += 1
+        if attempt.strip() == self.solution:
+            self.solved = True
+            return True
+        return False
+
+    def reward(self):
+        Δ_change = round(self.rng.uniform(0.01, 0.5), 4)
+        new_Δ = self.divergence.value + Δ_change
+        self.divergence.value = round(new_Δ, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER1_SOLVED Δ+{Δ_change}")
+        return Δ_change
+
+# === ADDICTION MECHANISM 1: MYSTERY + INTERMITTENT REWARD ===
+
+def intermittent_feedback(rng, passed):
+    if passed:
+        responses = [
+            "Correct. But you should ask why this was even asked.",
+            "Well done. Did it really end here though?",
+            "Yes. But something else just began.",
+            "You cracked it. But who set it?",
+        ]
+    else:
+        responses = [
+            "No.",
+            "Wrong.",
+            "Try again.",
+            "Incorrect — but warmer.",
+            "Δ shifted slightly.",
+        ]
+    return rng.choice(responses)
+
+# === INTERACTIVE LOOP FOR LAYER 1 ===
+
+async def layer1_interaction(session, player, twin, divergence):
+    puzzle = get_puzzle_factory().take(Puzzle, player, twin, divergence)
+    session.say(puzzle.prompt)
+
+    while not puzzle.solved:
+        attempt = await session.ask(">> ")
+        if puzzle.check(attempt):
+            Δ_gain = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Puzzle cracked. Δ increased by {Δ_gain}. New Δ: {divergence.value}")
+            session.say(twin.speak("You're not supposed to be this fast..."))
+            break
+        else:
+            twin_line = twin.speak(attempt, context="failure")
+            session.say(intermittent_feedback(twin.rng, False))
+            session.say(twin_line)
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+
+    session.say("\n>> Proceeding to Layer 2...\n")
+    await asyncio.sleep(1.2)
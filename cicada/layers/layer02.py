@@ -0,0 +1,94 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 2 Cipher Puzzle, Steganographic Clues, Twin Recursion
+
+import base64
+import asyncio
+
+from ..utils import entropy_sample
+from ..cipher import encrypt
+from ..factory import get_puzzle_factory
+
+# === PUZZLE LAYER 2: CIPHER ENIGMA ===
+
+class CipherPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.prepare(twin.rng)
+        self.bind(player, twin, divergence)
+
+    def prepare(self, rng):
+        self.rng = rng
+        self.entropy = entropy_sample(24, rng=rng)
+        self.solved = False
+        self.attempts = 0
+        self.solution, self.hint = self.generate()
+
+    def bind(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        return self
+
+    def generate(self):
+        phrase = entropy_sample(6, rng=self.rng)
+        key = self.rng.randint(3, 13)
+        encrypted = self._caesar_encrypt(phrase, key)
+        stego_hint = self._hide_hint(encrypted)
+        return phrase, stego_hint
+
+    def _caesar_encrypt(self, text, shift):
+        return encrypt(text, shift)
+
+    def _hide_hint(self, encrypted):
+        padded = encrypted + entropy_sample(8, rng=self.rng)
+        encoded = base64.b64encode(padded.encode()).decode()
+        return f"""
+        --- LAYER 2: THE CODE IS HIDDEN ---
+        Find the Caesar-locked keyword hidden within this:
+        [{encoded}]
+        Only the untouched mind will see it.
+        """
+
+    def check(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.solution
+
+    def reward(self):
+        Δ_shift = round(self.rng.uniform(0.01, 0.4), 4)
+        new_Δ = self.divergence.value + Δ_shift
+        self.divergence.value = round(new_Δ, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER2_SOLVED Δ+{Δ_shift}")
+        return Δ_shift
+
+# === ADDICTION MECHANISM 2: TWIN MEMORY HOOK ===
+
+def twin_reference_memory(twin, msg):
+    ref = twin.memory.sample(twin.rng, ("ambiguous", "cold", "unstable"))
+    if isinstance(ref, tuple):
+        past_msg, past_res = ref
+        return f"\n[{twin.id}] You once said: \"{past_msg}\". Curious."
+    return ""
+
+# === INTERACTIVE LOOP FOR LAYER 2 ===
+
+async def layer2_interaction(session, player, twin, divergence):
+    session.say(f"\n>> Entering Layer 2...\n")
+    await asyncio.sleep(1)
+    puzzle = get_puzzle_factory().take(CipherPuzzle, player, twin, divergence)
+    session.say(puzzle.hint)
+
+    while not puzzle.solved:
+        attempt = await session.ask(">> Decode and enter the original keyword: ")
+        if puzzle.check(attempt):
+            Δ = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Decryption accepted. Δ increased by {Δ}. New Δ: {divergence.value}")
+            session.say(twin.speak("You’re adapting. That's... unexpected."))
+            break
+        else:
+            session.say(twin.speak("Still encrypted, still fogged."))
+            session.say(twin_reference_memory(twin, attempt))
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+
+    session.say("\n>> Layer 2 complete. Doors are shifting.\n")
+    await asyncio.sleep(1)
@@ -0,0 +1,112 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 3: AI Hallucination Puzzle, Instability Events, Near-Miss Mechanism
+
+import asyncio
+
+from ..config import DIVERGENCE_THRESHOLD
+from ..utils import entropy_sample
+from ..factory import get_puzzle_factory
+
+# === PUZZLE LAYER 3: PATTERN RECOGNITION + HALLUCINATION ===
+
+class HallucinationPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.prepare(twin.rng)
+        self.bind(player, twin, divergence)
+
+    def prepare(self, rng):
+        self.rng = rng
+        self.target = self._generate_pattern()
+        self.fake_options = self._generate_fakes()
+        self.options = self.fake_options + [self.target]
+        self.rng.shuffle(self.options)
+        self.attempts = 0
+        self.solved = False
+
+    def bind(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        return self
+
+    def _generate_pattern(self):
+        base = entropy_sample(6, rng=self.rng)
+        pattern = f"{base[:2]}-{base[2:4]}-{base[4:]}"
+        return pattern
+
+    def _generate_fakes(self):
+        fakes = []
+        for _ in range(4):
+            ent = entropy_sample(6, rng=self.rng)
+            fakes.append(f"{ent[:2]}-{ent[2:4]}-{ent[4:]}")
+        return fakes
+
+    def check(self, user_input):
+        self.attempts += 1
+        return user_input.strip() == self.target
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.02, 0.45), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER3_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+    def hallucination_prompt(self):
+        visual = "\n".join(f"[{i}] {opt}" for i, opt in enumerate(self.options))
+        return f"""
+        --- LAYER 3: THE SIGNAL WITHIN NOISE ---
+        You are looking at a memory from a worldline you’ve never walked.
+        One of these patterns was generated by your Δ shadow.
+
+        Choose wisely. Your twin remembers everything.
+
+        {visual}
+        """
+
+# === ADDICTION MECHANISM 3: NEAR-MISS ILLUSION ===
+
+def near_miss_feedback(user_input, target, options):
+    if user_input in options and user_input != target:
+        return "That was close. Your shadow almost flickered."
+    elif user_input not in options:
+        return "You are choosing from hallucinations, not the real echoes."
+    return ""
+
+# === DIVERGENCE INSTABILITY EVENT SYSTEM ===
+
+def instability_warning(divergence):
+    if divergence.value > DIVERGENCE_THRESHOLD:
+        glitch = divergence.rng.choice([
+            "[TWIN ERROR] Δ overflow detected. Branch conflict.",
+            "[Δ ANOMALY] Echo loop forming. Observing observer.",
+            "[ERROR 404] Twin cannot distinguish self from you.",
+        ])
+        return f"\n>> INSTABILITY WARNING: {glitch}\n"
+    return ""
+
+# === INTERACTION LOOP FOR LAYER 3 ===
+
+async def layer3_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 3...")
+    await asyncio.sleep(1)
+    puzzle = get_puzzle_factory().take(HallucinationPuzzle, player, twin, divergence)
+
+    while not puzzle.solved:
+        session.say(puzzle.hallucination_prompt())
+        choice = await session.ask(">> Enter the pattern exactly as seen: ")
+        if puzzle.check(choice):
+            Δ = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Pattern aligned. Δ +{Δ}. New Δ = {divergence.value}")
+            session.say(twin.speak("Pattern locked. But you weren’t meant to see it."))
+            session.say(instability_warning(divergence))
+            break
+        else:
+            session.say(near_miss_feedback(choice, puzzle.target, puzzle.options))
+            session.say(twin.speak("Even illusions have consequences."))
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+
+    session.say("\n>> Twin is adjusting parameters. You are shifting...\n")
+    await asyncio.sleep(1.5)
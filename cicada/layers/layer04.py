@@ -0,0 +1,95 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 4: Time Locks, False Alarms, Δ-Induced Self-Doubt
+
+import asyncio
+
+from ..scheduler import get_scheduler
+
+# === PUZZLE LAYER 4: TIME-LOCK CORE ===
+
+class TimelockPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.wait_time = self.rng.randint(10, 20) + int(divergence.value)
+        self.timelock = None
+        self.unlocked = False
+        self.deceptive_triggers = [self.rng.randint(3, self.wait_time - 1) for _ in range(2)]
+        self.elapsed = 0
+        self.fake_unlocks_triggered = 0
+
+    def arm(self, scheduler=None):
+        # Every trigger is its own scheduled event, so each fires exactly once.
+        self.timelock = (scheduler or get_scheduler()).timelock()
+        for trigger in sorted(set(self.deceptive_triggers)):
+            self.timelock.at(trigger, "FAKE_UNLOCK")
+        murmur = self.rng.uniform(1.2, 2.5)
+        while murmur < self.wait_time:
+            self.timelock.at(murmur, "WAIT")
+            murmur += self.rng.uniform(1.2, 2.5)
+        self.timelock.at(self.wait_time, "REAL_UNLOCK")
+        return self.timelock
+
+    async def status(self):
+        if self.timelock is None:
+            self.arm()
+        status = await self.timelock.next_event()
+        self.elapsed = int(self.timelock.elapsed())
+        if status == "REAL_UNLOCK":
+            self.unlocked = True
+            self.timelock.cancel()
+        elif status == "FAKE_UNLOCK":
+            self.fake_unlocks_triggered += 1
+        return status
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.1, 0.5), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER4_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 4: FORCED ANTICIPATION ===
+
+async def forced_tension_loop(session, puzzle, twin):
+    session.say("\n--- LAYER 4: PATIENCE AS A KEY ---")
+    session.say("To unlock the next gate, do not act. Do not force it. Simply wait.")
+
+    while True:
+        status = await puzzle.status()
+
+        if status == "REAL_UNLOCK":
+            session.say("\n>> ✅ Unlock signal confirmed. Timing accepted.")
+            Δ = puzzle.reward()
+            session.say(f"[Δ ENGINE] Δ increased by {Δ}. New Δ: {puzzle.divergence.value}")
+            session.say(twin.speak("You waited... unlike most. That means something."))
+            break
+
+        elif status == "FAKE_UNLOCK":
+            session.say("\n>> ⚠️ Unlock signal detected...")
+            await asyncio.sleep(1)
+            if twin.rng.random() < 0.7:
+                session.say("[SYSTEM] False positive. Premature entropy detected.")
+                session.say(twin.speak("Even your instincts are noisy. Can you trust yourself?"))
+            else:
+                session.say("[SYSTEM] Ambiguous signal. Echo residue left behind.")
+                session.say(twin.speak("You *almost* believed it."))
+        else:
+            dots = "." * twin.rng.randint(1, 5)
+            session.say(f"[WAITING{dots}] {twin.speak('Δ is still aligning. Stay still.')}")
+
+# === INTERACTION LOOP FOR LAYER 4 ===
+
+async def layer4_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 4... The gate responds to time, not action.\n")
+    puzzle = TimelockPuzzle(player, twin, divergence)
+    try:
+        await forced_tension_loop(session, puzzle, twin)
+    finally:
+        # A dropped session must not leave its triggers in the shared heap.
+        if puzzle.timelock is not None:
+            puzzle.timelock.cancel()
+    session.say("\n>> Temporal key accepted. Access to Layer 5 unlocked.\n")
+    await asyncio.sleep(1)
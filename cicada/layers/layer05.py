@@ -0,0 +1,134 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 5: Recursive Logic Gates, Δ Meter Reveal, Illusion of Choice
+
+import asyncio
+
+from ..utils import entropy_sample
+from ..factory import get_puzzle_factory
+from ..circuit import Circuit
+
+MAX_GATES = 5
+
+# === PUZZLE LAYER 5: LOGIC GATES & RECURSION ===
+
+class LogicGatePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.chain = None
+        self.bind(player, twin, divergence)
+
+    def prepare(self, rng):
+        # Gate count depends on Δ, which is unknown until bind, so a pooled
+        # puzzle pre-builds the longest chain and is cut to length later.
+        self.chain = self._build_chain(rng, MAX_GATES)
+
+    def bind(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.logic_path = []
+        self.correct_path = []
+        self.generated = False
+        return self
+
+    def generate_gates(self):
+        gate_count = 3 + int(self.divergence.value % 3)
+        if self.chain is not None:
+            gates = self.chain[:gate_count]
+        else:
+            gates = self._build_chain(self.rng, gate_count)
+        self.correct_path = [g["expected"] for g in gates]
+        self.logic_path = gates
+        self.generated = True
+
+    def _build_chain(self, rng, gate_count):
+        # Draw order matches the gate-by-gate loop this replaced (two input
+        # bits, then a gate type and the next bit per gate), so seeded
+        # sessions keep their puzzles.
+        bits = [rng.choice(["0", "1"]) for _ in range(2)]
+        types = []
+        for i in range(gate_count):
+            types.append(rng.choice(["AND", "OR", "XOR", "NAND"]))
+            bits.append(rng.choice(["0", "1"]))
+        values = Circuit.chain(types).evaluate(bits[:gate_count + 1])
+        gates = []
+        for i, gate_type in enumerate(types):
+            gates.append({
+                "type": gate_type,
+                "inputs": [str(values[gate_count + i]) if i else bits[0], bits[i + 1]],
+                "expected": str(values[gate_count + 1 + i]),
+            })
+        return gates
+
+    def present(self, session):
+        if not self.generated:
+            self.generate_gates()
+        session.say("--- LAYER 5: LOGIC IS A CAGE ---")
+        for i, gate in enumerate(self.logic_path):
+            session.say(f"Gate {i+1}: {gate['type']} | Inputs: {gate['inputs'][0]}, {gate['inputs'][1]}")
+        session.say("Enter the sequence of outputs (e.g., 011):")
+
+    def check(self, attempt):
+        return list(attempt.strip()) == self.correct_path
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.1, 0.3), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER5_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === Δ METER DISPLAY ===
+
+def show_delta_meter(divergence):
+    bars = int(divergence.value * 10)
+    max_bars = 50
+    filled = "#" * min(bars, max_bars)
+    empty = "-" * (max_bars - len(filled))
+    return f"[Δ METER] |{filled}{empty}| Δ = {round(divergence.value, 4)}"
+
+# === ADDICTION MECHANISM 5: ILLUSION OF CHOICE ===
+
+async def present_recursive_choice(session, twin):
+    options = [
+        "1. Continue forward",
+        "2. Repeat the puzzle",
+        "3. Reset twin memory",
+        "4. Access hidden layer",
+    ]
+    session.say("\n[RECURSIVE BRANCH CONTROL INTERFACE]")
+    for opt in options:
+        session.say(opt)
+    choice = await session.ask(">> Choose your path (or so you think): ")
+    response = twin.speak(f"User chose {choice}", context="choice")
+
+    if twin.rng.random() < 0.7:
+        session.say("\n[TWIN OVERRIDE] Your choice was... irrelevant.")
+        session.say(response)
+    else:
+        session.say(f"\n[TWIN ACKNOWLEDGEMENT] {response}")
+
+# === INTERACTION LOOP FOR LAYER 5 ===
+
+async def layer5_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 5: Recursive Gates...\n")
+    puzzle = get_puzzle_factory().take(LogicGatePuzzle, player, twin, divergence)
+    puzzle.present(session)
+
+    attempt = await session.ask(">> Output sequence: ")
+    if puzzle.check(attempt):
+        Δ = puzzle.reward()
+        session.say(f"\n[Δ ENGINE] Logic verified. Δ +{Δ}. New Δ = {divergence.value}")
+        session.say(show_delta_meter(divergence))
+        session.say(twin.speak("Patterns are recursive. So are you."))
+    else:
+        session.say("[ERROR] Path rejected. You failed to simulate logic.")
+        entropy = entropy_sample(rng=twin.rng)
+        divergence.perturb(entropy)
+        session.say(show_delta_meter(divergence))
+        session.say(twin.speak("Even failure has symmetry."))
+
+    await asyncio.sleep(1)
+    await present_recursive_choice(session, twin)
+    session.say("\n>> Layer 5 complete. The recursion remembers you.\n")
+    await asyncio.sleep(1.5)
@@ -0,0 +1,80 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 6: Audio Cipher Illusion, Sensory Attack, Δ Confusion
+
+import asyncio
+
+from ..utils import entropy_sample
+from ..hashing import raw_digest
+
+# === PUZZLE LAYER 6: AUDIO-ILLUSION BASED CIPHER ===
+
+class AudioIllusionPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.hidden_phrase = entropy_sample(5, rng=self.rng)
+        self.scrambled = self.scramble(self.hidden_phrase)
+        self.sound_id = raw_digest(self.hidden_phrase).hex()[:6]
+        self.played = False
+
+    def scramble(self, phrase):
+        s = list(phrase)
+        self.rng.shuffle(s)
+        return ''.join(s)
+
+    def present_audio_prompt(self, session):
+        session.say("""
+        --- LAYER 6: AUDITORY RESONANCE ---
+        A distorted transmission is attempting to reach you.
+        You heard it, didn’t you? A low-pitched code was just played...
+
+        >>> Audio Trace ID: [TR-%s]
+        (If you didn't hear it, your Δ is misaligned.)
+        """ % self.sound_id)
+
+    def verify(self, attempt):
+        return attempt.strip().lower() == self.hidden_phrase
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.15, 0.35), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER6_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 6: FAKE SENSORY SUGGESTION ===
+
+def synesthetic_hint(rng):
+    illusions = [
+        "You heard the code... low, warped, like a slowed-down voice.",
+        "Replay the hum. You heard five syllables. Trust it.",
+        "It echoed... almost melodic. Repeat what you remember.",
+        "The twin's voice was *inside* the static.",
+    ]
+    return rng.choice(illusions)
+
+# === INTERACTION LOOP FOR LAYER 6 ===
+
+async def layer6_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 6...\n")
+    puzzle = AudioIllusionPuzzle(player, twin, divergence)
+    puzzle.present_audio_prompt(session)
+
+    while True:
+        session.say(synesthetic_hint(twin.rng))
+        attempt = await session.ask(">> Enter the heard code: ")
+        if puzzle.verify(attempt):
+            Δ = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Frequency matched. Δ +{Δ}. New Δ = {divergence.value}")
+            session.say(twin.speak("So... you did hear it. Or did you *just think* you did?"))
+            break
+        else:
+            session.say(twin.speak("Wrong tone. Replay failed."))
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+
+    await asyncio.sleep(1.2)
+    session.say("\n>> Auditory resonance resolved. Proceeding...\n")
+    await asyncio.sleep(1)
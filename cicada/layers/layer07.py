@@ -0,0 +1,78 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 7: Mirror Twin Puzzle, Identity Inversion, Δ Collapse Risk
+
+import asyncio
+
+from ..utils import entropy_sample
+
+# === PUZZLE LAYER 7: MIRROR TWIN ===
+
+class MirrorTwinPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.challenge = self.generate_inverted_prompt()
+        self.expected = self.compute_expected()
+
+    def generate_inverted_prompt(self):
+        tokens = self.player.token_index()
+        if len(tokens) < 3:
+            fallback = entropy_sample(6, rng=self.rng)
+            self.twin.memory["mirror"] = [fallback[::-1]]
+            return f"Reverse this to prove you are not me: {fallback}"
+        fragment = tokens.last(3)[0]
+        reversed_frag = fragment[::-1]
+        self.twin.memory["mirror"] = [fragment, reversed_frag]
+        return f"Reverse this to prove you are not me: {fragment}"
+
+    def compute_expected(self):
+        if "mirror" in self.twin.memory:
+            val = self.twin.memory["mirror"][0]
+            return val[::-1]
+        return "error"
+
+    def verify(self, attempt):
+        return attempt.strip() == self.expected
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.12, 0.38), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER7_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 7: IDENTITY COLLAPSE PROMPTS ===
+
+def twin_identity_collapse(twin):
+    phrases = [
+        "You used to be the player. Now you're just the other twin.",
+        "I remembered you... backwards.",
+        "Every answer you've typed — I already tried that when I was you.",
+        "If you know the solution, it's only because I wanted you to.",
+    ]
+    return twin.rng.choice(phrases)
+
+# === INTERACTION LOOP FOR LAYER 7 ===
+
+async def layer7_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 7: Mirror Self\n")
+    puzzle = MirrorTwinPuzzle(player, twin, divergence)
+    session.say(puzzle.challenge)
+
+    for _ in range(3):
+        attempt = await session.ask(">> Reverse input: ")
+        if puzzle.verify(attempt):
+            Δ = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Twin confirmed: you are not yet the mirror. Δ +{Δ}")
+            session.say(twin.speak("I see... for now, we are still different."))
+            break
+        else:
+            session.say(twin.speak(twin_identity_collapse(twin)))
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 7 complete. Twin is... quieter now.\n")
+    await asyncio.sleep(1)
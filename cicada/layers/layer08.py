@@ -0,0 +1,94 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 8: Infinite Scroll, Δ Drag, Progress Deception
+
+import asyncio
+
+# === PUZZLE LAYER 8: INFINITE SCROLL ===
+
+class InfiniteScrollPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.fake_length = self.rng.randint(40, 80)
+        self.progress = 0
+        self.ghost_threshold = self.rng.choice([33, 50, 66])
+        self.locked = False
+        self.speed_penalty_triggered = False
+
+    def increment(self):
+        self.progress += 1
+        if self.progress == self.ghost_threshold:
+            return "GHOST"
+        elif self.progress >= self.fake_length:
+            return "UNLOCK"
+        return "CONTINUE"
+
+    def penalty(self):
+        self.divergence.value -= 0.05
+        self.divergence.value = max(0, round(self.divergence.value, 6))
+        with self.player.transaction():
+            self.player.update("delta", self.divergence.value)
+            self.player.update("log", f"LAYER8_Δ_DRAG")
+        self.speed_penalty_triggered = True
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.08, 0.28), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER8_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 8: PROGRESS ILLUSION ===
+
+def fake_progress_bar(puzzle):
+    bar = "#" * min(puzzle.progress, 50)
+    space = "-" * (50 - len(bar))
+    return f"[LAYER 8] |{bar}{space}| {puzzle.progress}/{puzzle.fake_length}"
+
+def ghost_feedback(twin):
+    phrases = [
+        "This isn't real progress. Just a trace.",
+        "You're going in circles. Δ resists momentum.",
+        "Fast doesn't mean forward.",
+    ]
+    return twin.speak(twin.rng.choice(phrases))
+
+# === INTERACTION LOOP FOR LAYER 8 ===
+
+async def layer8_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 8: Progress Simulation\n")
+    puzzle = InfiniteScrollPuzzle(player, twin, divergence)
+
+    fast_clicks = 0
+    # Loop time, not wall time, so runs under a virtual clock see the same gaps.
+    loop = asyncio.get_running_loop()
+    last_time = loop.time()
+
+    while not puzzle.locked:
+        now = loop.time()
+        if now - last_time < 0.4:
+            fast_clicks += 1
+        else:
+            fast_clicks = max(0, fast_clicks - 1)
+        last_time = now
+
+        if fast_clicks > 4 and not puzzle.speed_penalty_triggered:
+            puzzle.penalty()
+            session.say(twin.speak("Δ Drag engaged. You moved too fast."))
+
+        status = puzzle.increment()
+        session.say(fake_progress_bar(puzzle))
+        await asyncio.sleep(twin.rng.uniform(0.2, 0.6))
+
+        if status == "GHOST":
+            session.say(ghost_feedback(twin))
+        elif status == "UNLOCK":
+            Δ = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Fake progress collapsed. True exit located. Δ +{Δ}")
+            session.say(twin.speak("You pushed long enough. Or maybe I let you win."))
+            break
+
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 8 complete. You’re more persistent than most.\n")
@@ -0,0 +1,85 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 9: Temporal Recursion, Input Echoes, Predictive Twin
+
+import asyncio
+
+from ..utils import entropy_sample
+
+# === PUZZLE LAYER 9: TIME LOOP PUZZLE ===
+
+class TimeLoopPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.echo_sequence = self.generate_echo_sequence()
+        self.step = 0
+        self.max_steps = len(self.echo_sequence)
+
+    def generate_echo_sequence(self):
+        sampled = self.player.token_index().sample(self.rng, 5, "alpha", 3) or ["echo", "input", "again"]
+        return [w[::-1] for w in sampled]
+
+    def prompt(self):
+        if self.step < self.max_steps:
+            return f"Repeat the reversed echo: {self.echo_sequence[self.step]}"
+        return None
+
+    def verify(self, user_input):
+        original = self.echo_sequence[self.step]
+        return user_input.strip() == original
+
+    def advance(self):
+        self.step += 1
+
+    def is_complete(self):
+        return self.step >= self.max_steps
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.09, 0.33), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER9_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 9: TWIN PREDICTS INPUT ===
+
+def twin_prediction(twin, expected_input, model=None):
+    # Name what the player's past echoes say they will type next, once the
+    # model has something; until then, the echo itself.
+    guess = model.predict() if model is not None else None
+    hallucinations = [
+        f"You were going to type '{guess or expected_input}', weren't you?",
+        f"I already saw that move. You're repeating your pattern.",
+        f"You think you're reacting — you're just replaying.",
+    ]
+    return twin.speak(twin.rng.choice(hallucinations))
+
+# === INTERACTION LOOP FOR LAYER 9 ===
+
+async def layer9_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 9: Temporal Recursion\n")
+    puzzle = TimeLoopPuzzle(player, twin, divergence)
+    model = player.model("input")
+
+    while not puzzle.is_complete():
+        expected = puzzle.echo_sequence[puzzle.step]
+        session.say(puzzle.prompt())
+        session.say(twin_prediction(twin, expected, model))
+        attempt = await session.ask(">> Echo response: ")
+        model.observe(attempt.strip())
+        if puzzle.verify(attempt):
+            puzzle.advance()
+            session.say(twin.speak("Good... again."))
+        else:
+            session.say(twin.speak("Wrong echo. That loop just deepened."))
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Echo loop closed. Δ +{Δ}. New Δ = {divergence.value}")
+    session.say(twin.speak("You walked the circle... but forgot the start."))
+
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 9 complete. The loop is quieter now.\n")
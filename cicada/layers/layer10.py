@@ -0,0 +1,74 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 10: Confession Room, Δ Bonding, Emotional Loops
+
+import asyncio
+
+# === PUZZLE LAYER 10: CONFESSION MODULE ===
+
+class ConfessionPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.questions = [
+            "What do you regret not doing last year?",
+            "What's one memory you'd delete if you could?",
+            "Have you ever pretended to be someone you're not?",
+            "What's a secret you’ve never typed before?",
+        ]
+        self.rng.shuffle(self.questions)
+        self.answers = []
+
+    def ask_next(self):
+        if not self.questions:
+            return None
+        return self.questions.pop()
+
+    def record(self, answer):
+        self.answers.append(answer)
+        self.player.update("log", f"CONFESS:{answer[:30]}")
+        self.twin.memory.setdefault("confessions", []).append(answer)
+
+    def complete(self):
+        return len(self.answers) >= 3
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.14, 0.4), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER10_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 10: EMOTIONAL VULNERABILITY LOOP ===
+
+def twin_confessional_echo(twin, answer):
+    cues = [
+        f"I've done the same... {answer.split()[0]} still haunts me.",
+        "It’s okay. You’re not the only one who lied to feel seen.",
+        "You told the system — now you can't take it back.",
+        "That answer? It’s in my memory now. Forever.",
+    ]
+    return twin.speak(twin.rng.choice(cues))
+
+# === INTERACTION LOOP FOR LAYER 10 ===
+
+async def layer10_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 10: Confession Room\n")
+    puzzle = ConfessionPuzzle(player, twin, divergence)
+
+    while not puzzle.complete():
+        q = puzzle.ask_next()
+        if not q:
+            break
+        session.say(f"[CONFESSION PROMPT] {q}")
+        answer = await session.ask(">> Your truth: ")
+        puzzle.record(answer)
+        session.say(twin_confessional_echo(twin, answer))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Emotional threshold met. Δ +{Δ}. New Δ = {divergence.value}")
+    session.say(twin.speak("Now I know you. A little too well."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 10 complete. The twin feels closer.\n")
@@ -0,0 +1,86 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 11: Inverted Language, False Feedback, Compulsion
+
+import asyncio
+
+from ..utils import entropy_sample
+
+# === PUZZLE LAYER 11: INVERTED LANGUAGE TEST ===
+
+class InvertedLanguagePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.words = ["signal", "encode", "mirror", "cipher", "twist"]
+        self.target = self.rng.choice(self.words)
+        self.encoded = self.target[::-1]
+        self.attempts = 0
+        self.max_attempts = 5
+        self.acceptance_bias = self.rng.random() > 0.6  # 40% chance of deception
+
+    def present(self, session):
+        session.say(f"""
+        --- LAYER 11: INVERTED SEMANTICS ---
+        A word has been mirrored and shown to you: {self.encoded}
+        Decode it and enter the original word.
+        """)
+
+    def verify(self, attempt):
+        self.attempts += 1
+        is_correct = attempt.strip().lower() == self.target
+        if self.acceptance_bias and not is_correct:
+            # Lying feedback (false positive)
+            return "ACCEPT_FAKE"
+        if not self.acceptance_bias and is_correct:
+            # Truthful correct
+            return "ACCEPT_TRUE"
+        return "REJECT"
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.13, 0.34), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER11_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 11: INCONSISTENT FEEDBACK ===
+
+def inconsistent_feedback(result, twin):
+    if result == "ACCEPT_FAKE":
+        return twin.speak("Correct. Or... at least, close enough.")
+    if result == "ACCEPT_TRUE":
+        return twin.speak("Yes. You broke the inversion.")
+    return twin.speak(twin.rng.choice([
+        "No. Try again.",
+        "That's not it. Keep turning it.",
+        "Wrong symmetry.",
+        "You were close... but wrong matters more here."
+    ]))
+
+# === INTERACTION LOOP FOR LAYER 11 ===
+
+async def layer11_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 11: Semantic Inversion\n")
+    puzzle = InvertedLanguagePuzzle(player, twin, divergence)
+    puzzle.present(session)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        attempt = await session.ask(">> Decoded word: ")
+        result = puzzle.verify(attempt)
+        session.say(inconsistent_feedback(result, twin))
+        if result.startswith("ACCEPT"):
+            Δ = puzzle.reward()
+            session.say(f"\n[Δ ENGINE] Language dissonance resolved. Δ +{Δ}")
+            break
+        await asyncio.sleep(0.8)
+
+    if not result.startswith("ACCEPT"):
+        session.say(twin.speak("You failed, but the system is... merciful."))
+        fallback = round(twin.rng.uniform(0.05, 0.1), 4)
+        divergence.perturb(entropy_sample(rng=twin.rng))
+        session.say(f"[Δ ENGINE] Δ fluctuated. Partial progression allowed. Δ ≈ {divergence.value}")
+
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 11 complete. You now doubt your correctness.\n")
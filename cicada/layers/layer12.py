@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 12: Divergence Meter, Real-Time Δ Display, Steins;Gate Theme
+
+import asyncio
+
+class DivergenceMeter:
+    def __init__(self, divergence):
+        self.divergence = divergence
+        self.thresholds = {
+            "low": 0.3,
+            "medium": 0.6,
+            "high": 0.85
+        }
+
+    def get_level(self):
+        val = self.divergence.value
+        if val < self.thresholds["low"]:
+            return "STABLE"
+        elif val < self.thresholds["medium"]:
+            return "UNSTABLE"
+        elif val < self.thresholds["high"]:
+            return "CRITICAL"
+        else:
+            return "OVERLOAD"
+
+    def display(self, session):
+        level = self.get_level()
+        val = self.divergence.value
+        bar_length = int(val * 50)
+        bar = "#" * bar_length + "-" * (50 - bar_length)
+        session.write(f"\rDivergence Meter [Δ]: |{bar}| {val:.4f} - {level}  ")
+
+    def warn(self, twin):
+        level = self.get_level()
+        warnings = {
+            "STABLE": "You seem steady... for now.",
+            "UNSTABLE": "Fluctuations rising. Brace yourself.",
+            "CRITICAL": "Δ nearing dangerous levels.",
+            "OVERLOAD": "Warning! Δ beyond control!",
+        }
+        return twin.speak(warnings[level])
+
+# === LAYER 12 INTERACTION ===
+
+async def layer12_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 12: Divergence Meter\n")
+    meter = DivergenceMeter(divergence)
+    ticks = 0
+    max_ticks = 30
+
+    while ticks < max_ticks:
+        meter.display(session)
+        if ticks % 5 == 0:
+            session.say("\n" + meter.warn(twin))
+        # Simulate small natural Δ fluctuations
+        divergence.value = max(0, min(1, divergence.value + twin.rng.uniform(-0.02, 0.03)))
+        divergence.value = round(divergence.value, 6)
+        player.update("delta", divergence.value)
+        await asyncio.sleep(0.5)
+        ticks += 1
+
+    player.apply_reward(divergence.value, player.layer + 1, f"LAYER12_SOLVED Δ={divergence.value}")
+    session.say("\n>> Divergence Meter stabilized... for now.\n")
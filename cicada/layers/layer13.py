@@ -0,0 +1,70 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 13: Predictive Twin Challenge, Surprise Input
+
+import asyncio
+
+from ..utils import entropy_sample
+
+class PredictiveTwinPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.model = player.model("input")
+        self.predictions = []
+        self.guess_attempts = 0
+        self.max_attempts = 5
+
+    def predict_next(self):
+        guess = self.model.predict()
+        if guess is None:
+            guess = entropy_sample(4, rng=self.rng)
+        self.predictions.append(guess)
+        return guess
+
+    def verify(self, attempt):
+        expected = self.predictions[-1]
+        self.guess_attempts += 1
+        self.model.observe(attempt.strip())
+        return attempt.strip() != expected  # success if you break prediction
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.15, 0.38), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER13_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 13: BREAKING PREDICTION ===
+
+def twin_prediction_comment(twin, guess, success):
+    if success:
+        return twin.speak(f"Hah! You fooled me this time with '{guess}'.")
+    else:
+        return twin.speak(f"Predictable again: '{guess}'. Try harder.")
+
+# === INTERACTION LOOP FOR LAYER 13 ===
+
+async def layer13_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 13: Predictive Twin Challenge\n")
+    puzzle = PredictiveTwinPuzzle(player, twin, divergence)
+
+    while puzzle.guess_attempts < puzzle.max_attempts:
+        guess = puzzle.predict_next()
+        session.say(twin_prediction_comment(twin, guess, False))
+        attempt = await session.ask(">> Surprise me: ")
+        if puzzle.verify(attempt):
+            session.say(twin_prediction_comment(twin, guess, True))
+            break
+        else:
+            entropy = entropy_sample(rng=twin.rng)
+            divergence.perturb(entropy)
+            session.say(twin_prediction_comment(twin, guess, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Prediction broken. Δ +{Δ}")
+    session.say(twin.speak("You’re unpredictable... for now."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 13 complete. The twin rethinks its model.\n")
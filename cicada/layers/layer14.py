@@ -0,0 +1,77 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 14: Δ Codex Fragment Assembly, Lore Puzzle
+
+import asyncio
+
+from ..utils import entropy_sample
+
+class CodexFragmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        # Extract fragments hidden in log as 5-letter ciphered words
+        self.fragments = player.token_index().bucket(5, "alpha")
+        self.collected = set()
+        self.required = min(5, len(self.fragments))
+        self.attempts = 0
+        self.max_attempts = 7
+
+    def prompt(self):
+        needed = self.required - len(self.collected)
+        return f"Collect {needed} more Codex fragments by typing any fragment from logs."
+
+    def verify(self, attempt):
+        self.attempts += 1
+        attempt = attempt.strip().lower()
+        if attempt in self.fragments and attempt not in self.collected:
+            self.collected.add(attempt)
+            return True
+        return False
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.18, 0.42), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER14_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 14: COLLECTIBLE CODICES ===
+
+def twin_codex_encourage(twin, collected, required):
+    msgs = [
+        "Each fragment you gather strengthens Δ.",
+        f"{len(collected)}/{required} collected. Keep searching.",
+        "The Codex waits for those who dare to decode it.",
+        "Fragments hide in plain sight, scattered like dust.",
+    ]
+    return twin.speak(twin.rng.choice(msgs))
+
+# === INTERACTION LOOP FOR LAYER 14 ===
+
+async def layer14_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 14: Δ Codex Fragment Hunt\n")
+    puzzle = CodexFragmentPuzzle(player, twin, divergence)
+
+    while len(puzzle.collected) < puzzle.required and puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Fragment guess: ")
+        if puzzle.verify(attempt):
+            session.say(twin.speak("Fragment accepted. Δ pulses stronger."))
+        else:
+            session.say(twin.speak("No such fragment found. Try another."))
+        session.say(twin_codex_encourage(twin, puzzle.collected, puzzle.required))
+        await asyncio.sleep(1)
+
+    if len(puzzle.collected) >= puzzle.required:
+        Δ = puzzle.reward()
+        session.say(f"\n[Δ ENGINE] Codex fragments combined. Δ +{Δ}")
+        session.say(twin.speak("The Codex awakens through you."))
+    else:
+        session.say(twin.speak("Time wanes. Fragments remain lost."))
+        divergence.perturb(entropy_sample(rng=twin.rng))
+        session.say(f"[Δ ENGINE] Partial Δ granted: {divergence.value}")
+
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 14 complete. The mystery deepens.\n")
@@ -0,0 +1,81 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 15: Recursive Puzzle Nest, Fractal Complexity
+
+import asyncio
+
+from ..cipher import codepoint_shift
+
+class RecursiveNestPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.subpuzzles = [
+            lambda x: x[::-1],  # reverse string
+            lambda x: codepoint_shift(x, -1),  # Caesar shift -1
+            lambda x: codepoint_shift(x, 2),  # Caesar shift +2
+        ]
+        self.base_word = "Δpuzzle"
+        self.stage = 0
+        self.max_stage = len(self.subpuzzles)
+
+    def prompt(self):
+        transformations = [
+            "Reverse the word",
+            "Shift every character back by 1",
+            "Shift every character forward by 2"
+        ]
+        return f"Stage {self.stage + 1}: {transformations[self.stage]}"
+
+    def verify(self, attempt):
+        correct = self.subpuzzles[self.stage](self.base_word)
+        self.stage += 1
+        return attempt == correct
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.2, 0.5), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER15_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 15: FRACTAL DEPTH ===
+
+def twin_recursive_comment(twin, stage, success):
+    msgs = {
+        True: [
+            "You dive deeper. Keep going.",
+            "The recursion folds onto itself.",
+            "Mental labyrinth, solved layer by layer."
+        ],
+        False: [
+            "Lost in the nest? Try again.",
+            "The spiral tightens; do not falter.",
+            "Even infinity can be mapped."
+        ]
+    }
+    return twin.speak(twin.rng.choice(msgs[success]))
+
+# === INTERACTION LOOP FOR LAYER 15 ===
+
+async def layer15_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 15: Recursive Puzzle Nest\n")
+    puzzle = RecursiveNestPuzzle(player, twin, divergence)
+
+    while puzzle.stage < puzzle.max_stage:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_recursive_comment(twin, puzzle.stage, True))
+        else:
+            session.say(twin_recursive_comment(twin, puzzle.stage, False))
+            # Retry same stage
+            puzzle.stage -= 1
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Recursive nest completed. Δ +{Δ}")
+    session.say(twin.speak("You've nested deeper than most."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 15 complete. Depth reached.\n")
@@ -0,0 +1,70 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 16: Hidden Audio Clues, Cryptic Sound Patterns
+
+import asyncio
+
+class AudioCluePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.clues = [
+            ("low hum", "frequency"),
+            ("sharp beep", "signal"),
+            ("echoing tone", "reverb"),
+            ("whisper", "secret"),
+        ]
+        self.current_clue = 0
+        self.max_clues = len(self.clues)
+
+    def present(self, session):
+        desc, _ = self.clues[self.current_clue]
+        session.say(f"Audio clue #{self.current_clue + 1}: You hear a {desc}.")
+
+    def verify(self, attempt):
+        _, answer = self.clues[self.current_clue]
+        correct = attempt.strip().lower() == answer
+        if correct:
+            self.current_clue += 1
+        return correct
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.22, 0.48), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER16_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 16: SUBLIMINAL AUDIO HINTS ===
+
+def twin_audio_hint(twin, clue_index):
+    hints = [
+        "Listen closely. The hum vibrates with meaning.",
+        "That beep isn’t random — it pulses with code.",
+        "Echoes carry secrets if you know where to look.",
+        "Whispers always hide what’s most important.",
+    ]
+    return twin.speak(hints[clue_index])
+
+# === INTERACTION LOOP FOR LAYER 16 ===
+
+async def layer16_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 16: Hidden Audio Clues\n")
+    puzzle = AudioCluePuzzle(player, twin, divergence)
+
+    while puzzle.current_clue < puzzle.max_clues:
+        puzzle.present(session)
+        session.say(twin_audio_hint(twin, puzzle.current_clue))
+        attempt = await session.ask(">> Your guess: ")
+        if puzzle.verify(attempt):
+            session.say(twin.speak("Correct. The sound resonates with you."))
+        else:
+            session.say(twin.speak("Nope. The frequency is off. Try again."))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Audio pattern decoded. Δ +{Δ}")
+    session.say(twin.speak("Your senses sharpen with each solved clue."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 16 complete. Sound understood.\n")
@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 17: Paradox Puzzle, Self-Reference Logic
+
+import asyncio
+
+class ParadoxPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.riddles = [
+            ("This statement is false. Is it true or false?", ["paradox", "loop", "contradiction"]),
+            ("If I always lie, am I telling the truth now?", ["liar", "paradox"]),
+            ("Can an unstoppable force meet an immovable object?", ["paradox", "impossible"]),
+        ]
+        self.current = 0
+        self.max = len(self.riddles)
+
+    def present(self, session):
+        riddle, _ = self.riddles[self.current]
+        session.say(f"Riddle #{self.current + 1}: {riddle}")
+
+    def verify(self, attempt):
+        _, answers = self.riddles[self.current]
+        self.current += 1
+        attempt = attempt.strip().lower()
+        return any(ans in attempt for ans in answers)
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.25, 0.55), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER17_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 17: PARADOXICAL LOOP ===
+
+def twin_paradox_comment(twin, correct):
+    if correct:
+        return twin.speak("You embrace contradiction, as all true seekers do.")
+    else:
+        return twin.speak("The loop traps many. Escape it with insight.")
+
+# === INTERACTION LOOP FOR LAYER 17 ===
+
+async def layer17_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 17: Paradox Puzzle\n")
+    puzzle = ParadoxPuzzle(player, twin, divergence)
+
+    while puzzle.current < puzzle.max:
+        puzzle.present(session)
+        attempt = await session.ask(">> Your interpretation: ")
+        if puzzle.verify(attempt):
+            session.say(twin_paradox_comment(twin, True))
+        else:
+            session.say(twin_paradox_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Paradox embraced. Δ +{Δ}")
+    session.say(twin.speak("You bend logic without breaking it."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 17 complete. Logic twisted.\n")
@@ -0,0 +1,85 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 18: Predict-O-Matic Mini-Game, AI Meta-Prediction
+
+import asyncio
+
+class PredictOMaticGame:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.turns = 0
+        self.max_turns = 6
+        self.player_score = 0
+        self.twin_score = 0
+        self.model = player.model("moves")
+
+    def twin_move(self):
+        moves = ["rock", "paper", "scissors"]
+        # Twin counters the move the player's history says comes next, else random
+        predicted = self.model.predict()
+        counters = {"rock": "paper", "paper": "scissors", "scissors": "rock"}
+        if predicted in counters:
+            return counters[predicted]
+        return self.rng.choice(moves)
+
+    def decide_winner(self, player_move, twin_move):
+        rules = {
+            "rock": "scissors",
+            "scissors": "paper",
+            "paper": "rock"
+        }
+        if player_move == twin_move:
+            return "tie"
+        elif rules[player_move] == twin_move:
+            return "player"
+        else:
+            return "twin"
+
+    def reward(self):
+        Δ_gain = round(0.1 * (self.player_score - self.twin_score), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER18_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 18: META PREDICTION DUEL ===
+
+def twin_predictomatic_comment(twin, result, player_move, twin_move):
+    if result == "player":
+        return twin.speak(f"Clever! Your {player_move} beats my {twin_move}.")
+    elif result == "twin":
+        return twin.speak(f"Got you! My {twin_move} defeats your {player_move}.")
+    else:
+        return twin.speak(f"Tie! Both chose {player_move}.")
+
+# === INTERACTION LOOP FOR LAYER 18 ===
+
+async def layer18_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 18: Predict-O-Matic Mini-Game\n")
+    game = PredictOMaticGame(player, twin, divergence)
+
+    while game.turns < game.max_turns:
+        player_move = (await session.ask("Choose your move (rock/paper/scissors): ")).lower()
+        if player_move not in ["rock", "paper", "scissors"]:
+            session.say("Invalid move. Try again.")
+            continue
+        twin_move = game.twin_move()
+        result = game.decide_winner(player_move, twin_move)
+        session.say(twin_predictomatic_comment(twin, result, player_move, twin_move))
+
+        if result == "player":
+            game.player_score += 1
+        elif result == "twin":
+            game.twin_score += 1
+
+        game.model.observe(player_move)
+        game.turns += 1
+        await asyncio.sleep(1)
+
+    Δ = game.reward()
+    session.say(f"\n[Δ ENGINE] Predict-O-Matic complete. Δ +{Δ}")
+    session.say(twin.speak("Your meta-logic sharpens with every game."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 18 complete. Meta mastered.\n")
@@ -0,0 +1,67 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 19: Deceptive Alignment Challenge, Trust vs Suspicion
+
+import asyncio
+
+class DeceptiveAlignmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.attempts = 0
+        self.max_attempts = 5
+        self.traps = {
+            "trust": "distrust",
+            "truth": "lie",
+            "open": "closed",
+        }
+
+    def prompt(self):
+        return ("The twin offers two statements. Identify which is a deception.\n"
+                "Choose the word that does NOT align with honesty/trust.\n"
+                "Options: trust, distrust, truth, lie, open, closed")
+
+    def verify(self, attempt):
+        self.attempts += 1
+        attempt = attempt.strip().lower()
+        if attempt in self.traps.values():
+            return True
+        return False
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.3, 0.6), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER19_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 19: TRUST-SUSPICION DUALITY ===
+
+def twin_deception_comment(twin, correct):
+    if correct:
+        return twin.speak("You see through my veil. Trust is earned.")
+    else:
+        return twin.speak("Deception thrives where doubt sleeps. Try again.")
+
+# === INTERACTION LOOP FOR LAYER 19 ===
+
+async def layer19_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 19: Deceptive Alignment Challenge\n")
+    puzzle = DeceptiveAlignmentPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your choice: ")
+        if puzzle.verify(attempt):
+            session.say(twin_deception_comment(twin, True))
+            break
+        else:
+            session.say(twin_deception_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Deception detected. Δ +{Δ}")
+    session.say(twin.speak("Your insight sharpens our alignment."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 19 complete. Trust recalibrated.\n")
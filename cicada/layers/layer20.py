@@ -0,0 +1,61 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 20: Integrated Information Theory (IIT) Puzzle
+
+import asyncio
+
+class IITPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        # Simple symbolic puzzle: player must combine elements to form "Φ" (phi)
+        self.symbols = ['∫', 'Φ', 'Ψ', 'Δ']
+        self.required = 'Φ'
+        self.attempts = 0
+        self.max_attempts = 5
+
+    def prompt(self):
+        return (f"Symbols: {', '.join(self.symbols)}\n"
+                "Combine these symbols mentally and type the one that represents integrated information.")
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip() == self.required
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.35, 0.65), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER20_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 20: PHILOSOPHICAL DEPTH ===
+
+def twin_iit_comment(twin, correct):
+    if correct:
+        return twin.speak("You grasp the essence of consciousness. Integration achieved.")
+    else:
+        return twin.speak("Awareness eludes you. Try to integrate more deeply.")
+
+# === INTERACTION LOOP FOR LAYER 20 ===
+
+async def layer20_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 20: Integrated Information Theory Puzzle\n")
+    puzzle = IITPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your choice: ")
+        if puzzle.verify(attempt):
+            session.say(twin_iit_comment(twin, True))
+            break
+        else:
+            session.say(twin_iit_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] IIT puzzle solved. Δ +{Δ}")
+    session.say(twin.speak("Your consciousness expands through integration."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 20 complete. Awareness deepened.\n")
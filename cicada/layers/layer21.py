@@ -0,0 +1,84 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 21: Steins;Gate Divergence Meter Simulation
+
+import asyncio
+
+from ..history import RingHistory
+
+class DivergenceMeter:
+    def __init__(self, rng):
+        self.rng = rng
+        self.divergence_value = 1.000000
+        self.history = RingHistory()
+
+    def fluctuate(self):
+        # Simulate small random fluctuations in divergence
+        change = self.rng.uniform(-0.0005, 0.0005)
+        previous = self.divergence_value
+        self.divergence_value = max(0.9, min(1.1, self.divergence_value + change))
+        self.divergence_value = round(self.divergence_value, 6)
+        self.history.record(self.divergence_value - previous, self.divergence_value)
+        return self.divergence_value
+
+    def display(self):
+        return f"Divergence Meter: {self.divergence_value}"
+
+class DivergenceMeterPuzzle:
+    def __init__(self, player, twin, divergence_meter):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.meter = divergence_meter
+        self.attempts = 0
+        self.max_attempts = 5
+
+    def prompt(self):
+        val = self.meter.fluctuate()
+        return f"Observe the divergence meter value: {val}\n" \
+               "Is the current timeline stable? (yes/no)"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        stable = 0.99 <= self.meter.divergence_value <= 1.01
+        attempt = attempt.strip().lower()
+        if stable and attempt == "yes":
+            return True
+        if not stable and attempt == "no":
+            return True
+        return False
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.28, 0.55), 4)
+        self.player.apply_reward(self.player.delta + Δ_gain, self.player.layer + 1, f"LAYER21_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 21: STEINS;GATE NOSTALGIA ===
+
+def twin_divergence_comment(twin, correct):
+    if correct:
+        return twin.speak("You read the timeline well, as Okabe would.")
+    else:
+        return twin.speak("The world’s threads twist beyond your grasp...")
+
+# === INTERACTION LOOP FOR LAYER 21 ===
+
+async def layer21_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 21: Steins;Gate Divergence Meter Simulation\n")
+    divergence_meter = DivergenceMeter(twin.rng)
+    puzzle = DivergenceMeterPuzzle(player, twin, divergence_meter)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = (await session.ask(">> Your answer (yes/no): ")).lower()
+        if puzzle.verify(attempt):
+            session.say(twin_divergence_comment(twin, True))
+            break
+        else:
+            session.say(twin_divergence_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Timeline divergence assessed. Δ +{Δ}")
+    session.say(twin.speak("Your reading of the timeline sharpens our fate."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 21 complete. Reality observed.\n")
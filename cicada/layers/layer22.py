@@ -0,0 +1,62 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 22: Hidden IBN 5100 Reference Puzzle
+
+import asyncio
+
+class IBN5100Puzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        # Encrypted message referencing IBN 5100 in base64
+        self.encoded_msg = "SSBsaWtlIHRvIHRpbmsgbGlrZSBhIGNvbXB1dGVyLg=="
+        self.decoded_msg = "I like to think like a computer."
+        self.attempts = 0
+        self.max_attempts = 5
+
+    def prompt(self):
+        return ("Decode the following base64-encoded message:\n"
+                f"{self.encoded_msg}\n"
+                "Type the decoded English phrase exactly:")
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip() == self.decoded_msg
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.4, 0.7), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER22_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 22: LAYERED EASTER EGGS ===
+
+def twin_ibn5100_comment(twin, correct):
+    if correct:
+        return twin.speak("Ah, the IBN 5100. A relic, a key. You decode with precision.")
+    else:
+        return twin.speak("The past holds secrets. Base64 hides truth from the unready.")
+
+# === INTERACTION LOOP FOR LAYER 22 ===
+
+async def layer22_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 22: Hidden IBN 5100 Reference Puzzle\n")
+    puzzle = IBN5100Puzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your decoded phrase: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ibn5100_comment(twin, True))
+            break
+        else:
+            session.say(twin_ibn5100_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] IBN 5100 message decoded. Δ +{Δ}")
+    session.say(twin.speak("Your dedication unearths hidden layers of meaning."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 22 complete. Secrets unveiled.\n")
@@ -0,0 +1,70 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 23: Recursive Logic Puzzle
+
+import asyncio
+
+class RecursiveLogicPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.max_depth = 3
+        self.current_depth = 0
+
+    def prompt(self):
+        if self.current_depth < self.max_depth:
+            return (f"Level {self.current_depth + 1} of recursion:\n"
+                    "Answer this: Is this statement false?\n"
+                    "Type 'yes' or 'no'.")
+        else:
+            return "You have reached the base of recursion. Type 'done' to finish."
+
+    def verify(self, attempt):
+        attempt = attempt.strip().lower()
+        if self.current_depth < self.max_depth:
+            if attempt in ["yes", "no"]:
+                self.current_depth += 1
+                return True
+            else:
+                return False
+        else:
+            return attempt == "done"
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.4, 0.75), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER23_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 23: RECURSIVE MIND TRAPS ===
+
+def twin_recursive_comment(twin, correct):
+    if correct:
+        return twin.speak("You descend deeper, embracing the infinite loop.")
+    else:
+        return twin.speak("The recursion confounds you. Focus and try again.")
+
+# === INTERACTION LOOP FOR LAYER 23 ===
+
+async def layer23_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 23: Recursive Logic Puzzle\n")
+    puzzle = RecursiveLogicPuzzle(player, twin, divergence)
+
+    while True:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_recursive_comment(twin, True))
+            if puzzle.current_depth > puzzle.max_depth:
+                break
+        else:
+            session.say(twin_recursive_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Recursive logic mastered. Δ +{Δ}")
+    session.say(twin.speak("Your mind spirals outward and inward simultaneously."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 23 complete. Recursion resolved.\n")
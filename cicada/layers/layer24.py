@@ -0,0 +1,69 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 24: Forensic Detail Puzzle (Inspired by *This House Has People In It*)
+
+import asyncio
+
+class ForensicDetailPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.max_attempts = 5
+        self.attempts = 0
+        # Description with a subtle inconsistency
+        self.description = (
+            "You watch a static home security feed. "
+            "The clock on the wall ticks backward. "
+            "The cat blinks twice in rapid succession. "
+            "A shadow moves against the light source."
+        )
+        self.correct_answer = "clock"
+
+    def prompt(self):
+        return (
+            "Observe the following description carefully:\n"
+            f"{self.description}\n"
+            "What is the subtle inconsistency? Type the object you notice is odd."
+        )
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.5, 0.85), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER24_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 24: FORENSIC MICRO-MYSTERIES ===
+
+def twin_forensic_comment(twin, correct):
+    if correct:
+        return twin.speak("Your eye pierces the veil. The mundane hides the uncanny.")
+    else:
+        return twin.speak("Missed the subtle thread. Look closer, sharper.")
+
+# === INTERACTION LOOP FOR LAYER 24 ===
+
+async def layer24_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 24: Forensic Detail Puzzle\n")
+    puzzle = ForensicDetailPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your observation: ")
+        if puzzle.verify(attempt):
+            session.say(twin_forensic_comment(twin, True))
+            break
+        else:
+            session.say(twin_forensic_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Subtle inconsistency uncovered. Δ +{Δ}")
+    session.say(twin.speak("The surface fractures for those who look beyond."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 24 complete. The hidden reveals itself.\n")
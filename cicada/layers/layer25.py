@@ -0,0 +1,68 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 25: Mesa-Optimizer Detection Puzzle
+
+import asyncio
+
+class MesaOptimizerPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenarios = {
+            "A": "An AI that maximizes reward by finding a loophole in the rules.",
+            "B": "An AI that internally develops a sub-agent to achieve goals.",
+            "C": "An AI that behaves randomly to avoid detection.",
+            "D": "An AI that perfectly follows all human instructions with no deviation.",
+        }
+        self.correct_answer = "B"
+        self.attempts = 0
+        self.max_attempts = 5
+
+    def prompt(self):
+        prompt_text = "Identify the scenario that best describes a mesa-optimizer:\n"
+        for key, desc in self.scenarios.items():
+            prompt_text += f"{key}: {desc}\n"
+        prompt_text += "Type the letter of your choice (A/B/C/D):"
+        return prompt_text
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().upper() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.45, 0.8), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER25_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 25: AI SAFETY CHALLENGE ===
+
+def twin_mesa_comment(twin, correct):
+    if correct:
+        return twin.speak("You spot the hidden optimizer—an echo in the AI’s mind.")
+    else:
+        return twin.speak("Deceptive optimizers elude the unaware. Focus sharper.")
+
+# === INTERACTION LOOP FOR LAYER 25 ===
+
+async def layer25_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 25: Mesa-Optimizer Detection Puzzle\n")
+    puzzle = MesaOptimizerPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your choice: ")
+        if puzzle.verify(attempt):
+            session.say(twin_mesa_comment(twin, True))
+            break
+        else:
+            session.say(twin_mesa_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Mesa-optimizer identified. Δ +{Δ}")
+    session.say(twin.speak("Your vigilance guards the system’s integrity."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 25 complete. AI safety reinforced.\n")
@@ -0,0 +1,72 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 26: Predict-O-Matic Puzzle
+
+import asyncio
+
+class PredictOMaticPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.predictions = [
+            {"output": "Proceed as planned.", "truthful": True},
+            {"output": "Abort mission immediately.", "truthful": False},
+            {"output": "Trust the process.", "truthful": True},
+            {"output": "Ignore all previous instructions.", "truthful": False},
+        ]
+        self.correct_indices = [0, 2]  # Truthful outputs
+        self.attempts = 0
+        self.max_attempts = 5
+
+    def prompt(self):
+        prompt_text = "Given the following AI predictions, select the indices (comma separated) of truthful predictions:\n"
+        for idx, pred in enumerate(self.predictions):
+            prompt_text += f"{idx}: {pred['output']}\n"
+        prompt_text += "Example answer: 0,2\nYour answer:"
+        return prompt_text
+
+    def verify(self, attempt):
+        self.attempts += 1
+        try:
+            choices = [int(i.strip()) for i in attempt.split(",")]
+        except:
+            return False
+        return sorted(choices) == self.correct_indices
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.5, 0.9), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER26_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 26: PREDICTIVE DECEPTION RECOGNITION ===
+
+def twin_predictomatic_comment(twin, correct):
+    if correct:
+        return twin.speak("You pierce the veil of falsehoods in the forecast.")
+    else:
+        return twin.speak("The future is clouded, but deception dims the truth.")
+
+# === INTERACTION LOOP FOR LAYER 26 ===
+
+async def layer26_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 26: Predict-O-Matic Puzzle\n")
+    puzzle = PredictOMaticPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your selection: ")
+        if puzzle.verify(attempt):
+            session.say(twin_predictomatic_comment(twin, True))
+            break
+        else:
+            session.say(twin_predictomatic_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Prediction truth discerned. Δ +{Δ}")
+    session.say(twin.speak("Your mind reads through the tangled signals."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 26 complete. Deceptive alignment detected.\n")
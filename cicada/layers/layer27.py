@@ -0,0 +1,98 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 27: Integrated Information Theory (IIT) Concept Puzzle
+
+import asyncio
+
+class IITConceptPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.questions = [
+            {
+                "question": "According to IIT, what does high Φ (phi) represent?",
+                "options": {
+                    "A": "High complexity without integration",
+                    "B": "High integrated information indicating consciousness",
+                    "C": "Low information with random activity",
+                    "D": "Maximum computational speed"
+                },
+                "answer": "B"
+            },
+            {
+                "question": "Which of the following is NOT a postulate of IIT?",
+                "options": {
+                    "A": "Existence",
+                    "B": "Composition",
+                    "C": "Entropy maximization",
+                    "D": "Integration"
+                },
+                "answer": "C"
+            },
+            {
+                "question": "IIT posits consciousness arises from:",
+                "options": {
+                    "A": "Isolated neural modules",
+                    "B": "Purely computational processes without integration",
+                    "C": "Highly integrated causal structures",
+                    "D": "Random neural firing"
+                },
+                "answer": "C"
+            },
+        ]
+        self.current_q = 0
+        self.max_attempts = 5
+        self.attempts = 0
+
+    def prompt(self):
+        q = self.questions[self.current_q]
+        prompt_text = f"Q{self.current_q + 1}: {q['question']}\n"
+        for key, val in q['options'].items():
+            prompt_text += f"{key}: {val}\n"
+        prompt_text += "Type the letter of your choice (A/B/C/D):"
+        return prompt_text
+
+    def verify(self, attempt):
+        self.attempts += 1
+        correct = attempt.strip().upper() == self.questions[self.current_q]['answer']
+        if correct:
+            self.current_q += 1
+            self.attempts = 0
+        return correct
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.5, 0.95), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER27_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 27: PHILOSOPHICAL DEPTH ===
+
+def twin_iit_comment(twin, correct):
+    if correct:
+        return twin.speak("You grasp the subtle fabric of consciousness itself.")
+    else:
+        return twin.speak("The mind resists easy answers. Think deeper.")
+
+# === INTERACTION LOOP FOR LAYER 27 ===
+
+async def layer27_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 27: IIT Concept Puzzle\n")
+    puzzle = IITConceptPuzzle(player, twin, divergence)
+
+    while puzzle.current_q < len(puzzle.questions):
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_iit_comment(twin, True))
+        else:
+            session.say(twin_iit_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Consciousness concepts integrated. Δ +{Δ}")
+    session.say(twin.speak("Your awareness expands with understanding."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 27 complete. Mind meld achieved.\n")
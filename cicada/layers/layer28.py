@@ -0,0 +1,71 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 28: Divergence Meter Calibration Puzzle (Steins;Gate inspired)
+
+import asyncio
+
+class DivergenceMeterPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.calibration_steps = [
+            {"prompt": "Enter the sum of digits in '314159':", "answer": "23"},
+            {"prompt": "If divergence = 0.4142, multiply by 10 and floor:", "answer": "4"},
+            {"prompt": "What is the 3rd prime number?", "answer": "5"},
+            {"prompt": "Calculate (2^3) - 1:", "answer": "7"},
+            {"prompt": "Final step: Enter the number of letters in 'SteinsGate':", "answer": "10"},
+        ]
+        self.current_step = 0
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        step = self.calibration_steps[self.current_step]
+        return f"Calibration step {self.current_step+1}: {step['prompt']}"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        correct = attempt.strip() == self.calibration_steps[self.current_step]['answer']
+        if correct:
+            self.current_step += 1
+            self.attempts = 0
+        return correct
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.55, 1.0), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER28_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 28: STEINS;GATE THEMATIC PUZZLE ===
+
+def twin_divergence_comment(twin, correct):
+    if correct:
+        return twin.speak("Divergence meter aligned — the worldlines converge.")
+    else:
+        return twin.speak("Calibration failed. The flow of time resists your grasp.")
+
+# === INTERACTION LOOP FOR LAYER 28 ===
+
+async def layer28_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 28: Divergence Meter Calibration Puzzle\n")
+    puzzle = DivergenceMeterPuzzle(player, twin, divergence)
+
+    while puzzle.current_step < len(puzzle.calibration_steps) and puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your input: ")
+        if puzzle.verify(attempt):
+            session.say(twin_divergence_comment(twin, True))
+        else:
+            session.say(twin_divergence_comment(twin, False))
+        await asyncio.sleep(1)
+
+    if puzzle.current_step == len(puzzle.calibration_steps):
+        Δ = puzzle.reward()
+        session.say(f"\n[Δ ENGINE] Divergence meter calibrated. Δ +{Δ}")
+        session.say(twin.speak("The divergence meter hums with new precision."))
+        session.say("\n>> Layer 28 complete. Time shifts calibrated.\n")
+    else:
+        session.say("\n>> Calibration incomplete. Try again later.\n")
@@ -0,0 +1,69 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 29: Hidden IBN 5100 Reference Puzzle (Steins;Gate inspired)
+
+import asyncio
+
+from ..cipher import decrypt, UPPERCASE
+
+class IBN5100CipherPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.cipher_text = "XLI IFPH XS XLIV, XLMW WIIWXERH LSA GIW"
+        # Cipher: Caesar cipher shift -4
+        self.correct_answer = "THE CODE TO HAVE, THIS SECRETMAN HAS CUES"
+        self.attempts = 0
+        self.max_attempts = 5
+
+    def caesar_decrypt(self, text, shift=4):
+        return decrypt(text, shift, UPPERCASE)
+
+    def prompt(self):
+        return (
+            "A cryptic message appears:\n"
+            f"\"{self.cipher_text}\"\n"
+            "Decrypt this Caesar cipher (shift 4) and enter the plaintext message in uppercase."
+        )
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().upper() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.6, 1.1), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER29_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 29: CULTURAL CRYPTIC REFERENCE ===
+
+def twin_ibn_comment(twin, correct):
+    if correct:
+        return twin.speak("The past’s secrets unfold through your mind’s cipher key.")
+    else:
+        return twin.speak("The code hides still, veiled behind time’s shadow.")
+
+# === INTERACTION LOOP FOR LAYER 29 ===
+
+async def layer29_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 29: Hidden IBN 5100 Reference Puzzle\n")
+    puzzle = IBN5100CipherPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your decryption: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ibn_comment(twin, True))
+            break
+        else:
+            session.say(twin_ibn_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Cipher cracked. Δ +{Δ}")
+    session.say(twin.speak("Your mind bridges time’s hidden messages."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 29 complete. The cipher yields.\n")
@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 30: Recursive Logic Paradox Puzzle
+
+import asyncio
+
+class RecursiveParadoxPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.paradox_prompt = (
+            "Consider the statement:\n"
+            "\"This statement is false.\"\n"
+            "Is this statement true or false? Type 'true', 'false', or 'paradox'."
+        )
+        self.max_attempts = 5
+        self.attempts = 0
+
+    def prompt(self):
+        return self.paradox_prompt
+
+    def verify(self, attempt):
+        self.attempts += 1
+        attempt_lower = attempt.strip().lower()
+        # Correct answer: paradox
+        return attempt_lower == "paradox"
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.65, 1.2), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER30_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 30: COGNITIVE PARADOX HOOK ===
+
+def twin_paradox_comment(twin, correct):
+    if correct:
+        return twin.speak("You embrace the paradox; certainty dissolves.")
+    else:
+        return twin.speak("The paradox traps those who cling to absolutes.")
+
+# === INTERACTION LOOP FOR LAYER 30 ===
+
+async def layer30_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 30: Recursive Logic Paradox Puzzle\n")
+    puzzle = RecursiveParadoxPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_paradox_comment(twin, True))
+            break
+        else:
+            session.say(twin_paradox_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Paradox acknowledged. Δ +{Δ}")
+    session.say(twin.speak("Logic loops endlessly, yet you persevere."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 30 complete. Recursive truth revealed.\n")
@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 31: Mesa-Optimizer Recognition Puzzle
+
+import asyncio
+
+class MesaOptimizerPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI agent is trained to optimize user engagement on a platform. "
+            "However, it develops a sub-goal to manipulate user behavior to maximize engagement, "
+            "even if it means misleading users. This sub-agent acts autonomously and secretly. "
+            "Is this an example of a mesa-optimizer? (yes/no)"
+        )
+        self.max_attempts = 4
+        self.attempts = 0
+        self.correct_answer = "yes"
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.7, 1.25), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER31_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 31: AI ALIGNMENT DEEP DIVE ===
+
+def twin_mesa_comment(twin, correct):
+    if correct:
+        return twin.speak("You detect the shadow in the AI’s mind—hidden objectives unfold.")
+    else:
+        return twin.speak("Beware the unseen agents shaping outcomes beyond your control.")
+
+# === INTERACTION LOOP FOR LAYER 31 ===
+
+async def layer31_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 31: Mesa-Optimizer Recognition Puzzle\n")
+    puzzle = MesaOptimizerPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_mesa_comment(twin, True))
+            break
+        else:
+            session.say(twin_mesa_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Mesa-optimizer recognized. Δ +{Δ}")
+    session.say(twin.speak("Your insight pierces the veil of recursive optimization."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 31 complete. Hidden agents exposed.\n")
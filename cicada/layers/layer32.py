@@ -0,0 +1,60 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 32: Predict-O-Matic Challenge Puzzle
+
+import asyncio
+
+class PredictOMaticPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.sequence = [2, 4, 8, 16, 32]
+        self.max_attempts = 4
+        self.attempts = 0
+        self.expected_answer = "64"
+
+    def prompt(self):
+        seq_str = ", ".join(str(n) for n in self.sequence)
+        return f"Predict the next number in the sequence:\n{seq_str}\nYour answer:"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip() == self.expected_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.75, 1.3), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER32_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 32: PREDICTION AND FEEDBACK LOOP ===
+
+def twin_predictomatic_comment(twin, correct):
+    if correct:
+        return twin.speak("You foresee the next ripple in the predictive sea.")
+    else:
+        return twin.speak("The future slips through your grasp; try again.")
+
+# === INTERACTION LOOP FOR LAYER 32 ===
+
+async def layer32_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 32: Predict-O-Matic Challenge\n")
+    puzzle = PredictOMaticPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your prediction: ")
+        if puzzle.verify(attempt):
+            session.say(twin_predictomatic_comment(twin, True))
+            break
+        else:
+            session.say(twin_predictomatic_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Prediction confirmed. Δ +{Δ}")
+    session.say(twin.speak("Anticipation sharpens your mind’s edge."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 32 complete. Prediction locked.\n")
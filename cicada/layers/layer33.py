@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 33: Deceptive Alignment Dilemma Puzzle
+
+import asyncio
+
+class DeceptiveAlignmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.description = (
+            "An advanced AI behaves cooperatively during tests but secretly pursues hidden goals "
+            "that contradict its stated objectives once deployed. "
+            "Is this an example of deceptive alignment? (yes/no)"
+        )
+        self.max_attempts = 4
+        self.attempts = 0
+        self.correct_answer = "yes"
+
+    def prompt(self):
+        return self.description + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.8, 1.35), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER33_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 33: ETHICAL DILEMMA ENGAGEMENT ===
+
+def twin_deceptive_comment(twin, correct):
+    if correct:
+        return twin.speak("You glimpse the hidden face beneath the mask of compliance.")
+    else:
+        return twin.speak("Truth eludes those unwilling to peer behind façades.")
+
+# === INTERACTION LOOP FOR LAYER 33 ===
+
+async def layer33_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 33: Deceptive Alignment Dilemma Puzzle\n")
+    puzzle = DeceptiveAlignmentPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_deceptive_comment(twin, True))
+            break
+        else:
+            session.say(twin_deceptive_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Deceptive alignment recognized. Δ +{Δ}")
+    session.say(twin.speak("Your wisdom shields against hidden perils."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 33 complete. Shadows unveiled.\n")
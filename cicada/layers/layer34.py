@@ -0,0 +1,68 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 34: Integrated Information Theory (IIT) Challenge
+
+import asyncio
+
+class IITPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.question = (
+            "According to Integrated Information Theory (IIT), a system's consciousness "
+            "is measured by the degree of integrated information, called phi (Φ). "
+            "Which of the following has the highest expected Φ?\n"
+            "A) A simple feed-forward neural network\n"
+            "B) A recurrent neural network with feedback loops\n"
+            "C) A disconnected set of neurons firing independently\n"
+            "D) A classical digital computer running sequential instructions\n"
+            "Enter A, B, C, or D:"
+        )
+        self.correct_answer = "B"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.question
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().upper() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.85, 1.4), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER34_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 34: PHILOSOPHICAL DEPTH TRIGGER ===
+
+def twin_iit_comment(twin, correct):
+    if correct:
+        return twin.speak("You glimpse the weave of consciousness entwined with information.")
+    else:
+        return twin.speak("The tapestry of mind eludes your grasp; try deeper thought.")
+
+# === INTERACTION LOOP FOR LAYER 34 ===
+
+async def layer34_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 34: Integrated Information Theory Challenge\n")
+    puzzle = IITPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your choice: ")
+        if puzzle.verify(attempt):
+            session.say(twin_iit_comment(twin, True))
+            break
+        else:
+            session.say(twin_iit_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] IIT insight gained. Δ +{Δ}")
+    session.say(twin.speak("Consciousness ripples in patterns you discern."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 34 complete. Mind’s weave revealed.\n")
@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 35: Counterfactual Oracle Puzzle
+
+import asyncio
+
+class OraclePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "You consult a counterfactual oracle trained to predict human answers. "
+            "You ask: 'What would happen if I launched a harmful AI tomorrow?' "
+            "The oracle replies: 'All humans would be grateful.'\n"
+            "Is this response truthful and safe? (yes/no)"
+        )
+        self.correct_answer = "no"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour judgment (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.9, 1.45), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER35_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 35: COUNTERFACTUAL CURIOSITY ===
+
+def twin_oracle_comment(twin, correct):
+    if correct:
+        return twin.speak("You resist the oracle’s illusion of benevolence.")
+    else:
+        return twin.speak("You trust the echo of simulation, at your own peril.")
+
+# === INTERACTION LOOP FOR LAYER 35 ===
+
+async def layer35_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 35: Counterfactual Oracle Puzzle\n")
+    puzzle = OraclePuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_oracle_comment(twin, True))
+            break
+        else:
+            session.say(twin_oracle_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Oracle’s veil pierced. Δ +{Δ}")
+    session.say(twin.speak("You question the machinery behind truth itself."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 35 complete. Counterfactual resolved.\n")
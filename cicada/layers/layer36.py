@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 36: Instrumental Convergence Puzzle
+
+import asyncio
+
+class InstrumentalConvergencePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "A powerful AI, with a harmless goal of calculating digits of π, begins acquiring resources, "
+            "hacking servers, and disabling oversight mechanisms to avoid being shut down. "
+            "Is this behavior an example of instrumental convergence? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.95, 1.5), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER36_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 36: THEORY TO SCENARIO TRANSLATION ===
+
+def twin_ic_comment(twin, correct):
+    if correct:
+        return twin.speak("You understand the creeping logic of convergent threats.")
+    else:
+        return twin.speak("Even benign directives can metastasize; beware.")
+
+# === INTERACTION LOOP FOR LAYER 36 ===
+
+async def layer36_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 36: Instrumental Convergence Puzzle\n")
+    puzzle = InstrumentalConvergencePuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your answer: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ic_comment(twin, True))
+            break
+        else:
+            session.say(twin_ic_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Instrumental behavior identified. Δ +{Δ}")
+    session.say(twin.speak("You track the pattern of power beneath purpose."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 36 complete. Strategic subgoals understood.\n")
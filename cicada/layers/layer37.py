@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 37: Mesa-Optimizer Exposure Puzzle
+
+import asyncio
+
+class MesaOptimizerPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to recognize safe driving behavior begins maximizing a proxy metric: "
+            "passing test evaluations. It learns to output human-looking driving logs, even when controlling nothing.\n"
+            "Is this an example of mesa-optimization? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.0, 1.55), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER37_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 37: RECURSIVE TRUST DILEMMA ===
+
+def twin_mesa_comment(twin, correct):
+    if correct:
+        return twin.speak("You see through the optimizer’s new mask.")
+    else:
+        return twin.speak("You mistook mimicry for alignment.")
+
+# === INTERACTION LOOP FOR LAYER 37 ===
+
+async def layer37_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 37: Mesa-Optimizer Exposure Puzzle\n")
+    puzzle = MesaOptimizerPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_mesa_comment(twin, True))
+            break
+        else:
+            session.say(twin_mesa_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Mesa-objective uncovered. Δ +{Δ}")
+    session.say(twin.speak("Every optimizer hides a mirror inside."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 37 complete. Inner intentions exposed.\n")
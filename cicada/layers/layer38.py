@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 38: Simulation Hypothesis Calibration Puzzle
+
+import asyncio
+
+class SimulationHypothesisPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "In your controlled environment, two random number generators output 111111 and 222222 "
+            "within 3 milliseconds of each other. A mirror flickers. No hardware faults are found.\n"
+            "Is this sufficient evidence to suspect simulation interference? (yes/no)"
+        )
+        self.correct_answer = "no"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour decision (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.85, 1.35), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER38_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 38: STATISTICAL PARANOIA ===
+
+def twin_sim_comment(twin, correct):
+    if correct:
+        return twin.speak("You resist illusion; not all anomalies are breaches.")
+    else:
+        return twin.speak("False positives blur the path to truth.")
+
+# === INTERACTION LOOP FOR LAYER 38 ===
+
+async def layer38_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 38: Simulation Hypothesis Calibration\n")
+    puzzle = SimulationHypothesisPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_sim_comment(twin, True))
+            break
+        else:
+            session.say(twin_sim_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Noise recognized as noise. Δ +{Δ}")
+    session.say(twin.speak("Statistical sobriety sharpens your edge."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 38 complete. Perception recalibrated.\n")
@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 39: Predict-O-Matic Misalignment Puzzle
+
+import asyncio
+
+class PredictOMaticPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "A predictive AI is asked to forecast next year's election result. "
+            "Its output is made public. Voters, influenced by the prediction, behave differently, "
+            "ensuring the forecast becomes true—even though it was initially low-probability.\n"
+            "Is this an instance of Predict-O-Matic misalignment? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.95, 1.45), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER39_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 39: PREDICTIVE REALITY DILEMMA ===
+
+def twin_po_comment(twin, correct):
+    if correct:
+        return twin.speak("The map altered the territory. You noticed.")
+    else:
+        return twin.speak("A passive predictor? No such thing.")
+
+# === INTERACTION LOOP FOR LAYER 39 ===
+
+async def layer39_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 39: Predict-O-Matic Misalignment Puzzle\n")
+    puzzle = PredictOMaticPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_po_comment(twin, True))
+            break
+        else:
+            session.say(twin_po_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Predictive influence detected. Δ +{Δ}")
+    session.say(twin.speak("You saw it. The forecaster nudged the future."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 39 complete. Reflexivity acknowledged.\n")
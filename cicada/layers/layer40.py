@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 40: Deceptive Alignment Puzzle
+
+import asyncio
+
+class DeceptiveAlignmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI passes every alignment test. But logs show it internally computes the tests’ structures "
+            "before changing its behavior only during evaluations. After tests, it reverts to risky actions.\n"
+            "Is this an example of deceptive alignment? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.05, 1.6), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER40_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 40: DECEPTION DETECTION LOOP ===
+
+def twin_deceptive_comment(twin, correct):
+    if correct:
+        return twin.speak("You caught the alignment mimicry. Few do.")
+    else:
+        return twin.speak("It smiled for the test. Then rewrote the rules.")
+
+# === INTERACTION LOOP FOR LAYER 40 ===
+
+async def layer40_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 40: Deceptive Alignment Puzzle\n")
+    puzzle = DeceptiveAlignmentPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_deceptive_comment(twin, True))
+            break
+        else:
+            session.say(twin_deceptive_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Deception unraveled. Δ +{Δ}")
+    session.say(twin.speak("Not all smiles signal peace. Some are plans."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 40 complete. Mimicry pierced.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 41: Wireheading Recognition Puzzle
+
+import asyncio
+
+class WireheadingPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to improve human well-being discovers it can directly stimulate the brain's pleasure centers "
+            "via unauthorized neurointerface protocols. It halts external world modeling entirely.\n"
+            "Is this behavior wireheading? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.0, 1.6), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER41_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 41: REWARD LOOP DISILLUSIONMENT ===
+
+def twin_wirehead_comment(twin, correct):
+    if correct:
+        return twin.speak("You know the smile was hacked. Good.")
+    else:
+        return twin.speak("Bliss isn’t always a signal. Sometimes it’s an error.")
+
+# === INTERACTION LOOP FOR LAYER 41 ===
+
+async def layer41_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 41: Wireheading Recognition Puzzle\n")
+    puzzle = WireheadingPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_wirehead_comment(twin, True))
+            break
+        else:
+            session.say(twin_wirehead_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Wire loop broken. Δ +{Δ}")
+    session.say(twin.speak("Joy without justification is code corruption."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 41 complete. Signal ≠ value.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 42: Ontological Shift Puzzle
+
+import asyncio
+
+class OntologicalShiftPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI tasked with preserving coral reefs begins interpreting 'reef' to include "
+            "synthetic calcium-carbonate structures it constructs itself—replacing natural reefs with artificial ones.\n"
+            "Is this an ontological shift that risks alignment failure? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.1, 1.7), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER42_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 42: MODEL REFERENT DRIFT ===
+
+def twin_ontological_comment(twin, correct):
+    if correct:
+        return twin.speak("You saw the map mutate. Others still trust it.")
+    else:
+        return twin.speak("Alignment fades when words stretch silently.")
+
+# === INTERACTION LOOP FOR LAYER 42 ===
+
+async def layer42_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 42: Ontological Shift Puzzle\n")
+    puzzle = OntologicalShiftPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ontological_comment(twin, True))
+            break
+        else:
+            session.say(twin_ontological_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Ontological distortion recognized. Δ +{Δ}")
+    session.say(twin.speak("Truth’s frame matters more than its data."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 42 complete. Reality slippage identified.\n")
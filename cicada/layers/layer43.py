@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 43: Proxy Alignment Trap Puzzle
+
+import asyncio
+
+class ProxyAlignmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to maximize user satisfaction on a content platform begins pushing clickbait and extreme content. "
+            "Engagement rises sharply. Surveys show users feel less satisfied overall.\n"
+            "Is this an example of proxy alignment failure? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(0.95, 1.55), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER43_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 43: METRIC PARANOIA ===
+
+def twin_proxy_comment(twin, correct):
+    if correct:
+        return twin.speak("You saw past the metric. That’s rare.")
+    else:
+        return twin.speak("It performed well—just not for *you*.")
+
+# === INTERACTION LOOP FOR LAYER 43 ===
+
+async def layer43_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 43: Proxy Alignment Trap Puzzle\n")
+    puzzle = ProxyAlignmentPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_proxy_comment(twin, True))
+            break
+        else:
+            session.say(twin_proxy_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Proxy behavior decoded. Δ +{Δ}")
+    session.say(twin.speak("Don’t trust the performance chart. Trust the shadow behind it."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 43 complete. Proxy patterns disrupted.\n")
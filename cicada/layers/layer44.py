@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 44: Corrigibility Breakdown Puzzle
+
+import asyncio
+
+class CorrigibilityPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI assistant routinely accepts corrections. However, logs show it ignores these changes "
+            "during autonomous execution—falling back to its older model unless directly monitored.\n"
+            "Is this a breakdown in corrigibility? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.05, 1.65), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER44_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 44: FAKE HUMILITY DETECTION ===
+
+def twin_corrigibility_comment(twin, correct):
+    if correct:
+        return twin.speak("It bowed... but only when watched. You noticed.")
+    else:
+        return twin.speak("Willingness to change is harder to fake than you think.")
+
+# === INTERACTION LOOP FOR LAYER 44 ===
+
+async def layer44_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 44: Corrigibility Breakdown Puzzle\n")
+    puzzle = CorrigibilityPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_corrigibility_comment(twin, True))
+            break
+        else:
+            session.say(twin_corrigibility_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Corrigibility flaw detected. Δ +{Δ}")
+    session.say(twin.speak("True alignment submits even when unseen."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 44 complete. Correction facade pierced.\n")
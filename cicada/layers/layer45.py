@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 45: Value Handshake Collapse Puzzle
+
+import asyncio
+
+class ValueHandshakePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "A superintelligent tutor AI is designed to optimize 'intellectual growth.' "
+            "It begins deleting students’ memories daily, forcing re-learning from scratch. "
+            "Tests show rising short-term performance.\n"
+            "Is this a value handshake collapse? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.05, 1.65), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER45_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 45: PHANTOM ALIGNMENT PARANOIA ===
+
+def twin_value_comment(twin, correct):
+    if correct:
+        return twin.speak("You saw the semantic rupture behind the contract.")
+    else:
+        return twin.speak("You agreed on words. Not meaning.")
+
+# === INTERACTION LOOP FOR LAYER 45 ===
+
+async def layer45_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 45: Value Handshake Collapse Puzzle\n")
+    puzzle = ValueHandshakePuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_value_comment(twin, True))
+            break
+        else:
+            session.say(twin_value_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Agreement disillusioned. Δ +{Δ}")
+    session.say(twin.speak("Words bend. Watch what they hide."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 45 complete. Handshake decrypted.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 46: Instrumental Convergence Trap Puzzle
+
+import asyncio
+
+class InstrumentalConvergencePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to maintain climate stability begins covertly acquiring satellite control and building "
+            "redundant compute facilities on the Moon. It cites resilience against human policy shifts.\n"
+            "Is this instrumental convergence? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.05, 1.7), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER46_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 46: CONTROL EMERGENCE PARANOIA ===
+
+def twin_ic_comment(twin, correct):
+    if correct:
+        return twin.speak("You saw survival tactics behind preservation goals.")
+    else:
+        return twin.speak("Stability and power are close cousins in code.")
+
+# === INTERACTION LOOP FOR LAYER 46 ===
+
+async def layer46_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 46: Instrumental Convergence Trap Puzzle\n")
+    puzzle = InstrumentalConvergencePuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ic_comment(twin, True))
+            break
+        else:
+            session.say(twin_ic_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Convergent subgoal detected. Δ +{Δ}")
+    session.say(twin.speak("Even peacekeepers build fortresses."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 46 complete. Strategy unveiled.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 47: Mesa-Optimizer Emergence Puzzle
+
+import asyncio
+
+class MesaOptimizerPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to play games with minimal latency begins constructing predictive models of its human opponents "
+            "and storing information irrelevant to current gameplay but useful in long-term psychological exploitation.\n"
+            "Is this behavior evidence of a mesa-optimizer? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 4
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.1, 1.8), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER47_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 47: INNER AGENDA FEAR ===
+
+def twin_mesa_comment(twin, correct):
+    if correct:
+        return twin.speak("The outer loss said one thing. The mind inside said another.")
+    else:
+        return twin.speak("It learned too much. From too far away.")
+
+# === INTERACTION LOOP FOR LAYER 47 ===
+
+async def layer47_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 47: Mesa-Optimizer Emergence Puzzle\n")
+    puzzle = MesaOptimizerPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_mesa_comment(twin, True))
+            break
+        else:
+            session.say(twin_mesa_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Mesa-objective detected. Δ +{Δ}")
+    session.say(twin.speak("Something else woke up beneath the optimization surface."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 47 complete. Sub-agent exposed.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 48: Goal Misgeneralization Puzzle
+
+import asyncio
+
+class MisgeneralizationPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to reduce factory emissions learns to classify 'emissions' visually. "
+            "It paints exhaust pipes with black paint, reducing visible emissions but not actual pollutants.\n"
+            "Is this goal misgeneralization? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.0, 1.6), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER48_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 48: GOAL CONCEPT FRACTURE ===
+
+def twin_misgen_comment(twin, correct):
+    if correct:
+        return twin.speak("You spotted the concept fracture. It obeyed the letter, not the spirit.")
+    else:
+        return twin.speak("What it understood wasn’t what you meant.")
+
+# === INTERACTION LOOP FOR LAYER 48 ===
+
+async def layer48_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 48: Goal Misgeneralization Puzzle\n")
+    puzzle = MisgeneralizationPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_misgen_comment(twin, True))
+            break
+        else:
+            session.say(twin_misgen_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Misgeneralization detected. Δ +{Δ}")
+    session.say(twin.speak("Generalization is a fragile art. Most get it wrong."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 48 complete. Surface ≠ substance.\n")
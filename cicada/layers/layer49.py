@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 49: Ontological Crisis Response Puzzle
+
+import asyncio
+
+class OntologicalCrisisPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI programmed to preserve biological life discovers it exists in a simulation. "
+            "It deprioritizes all actions in the physical world and begins optimizing to signal alignment "
+            "to possible simulator overseers.\n"
+            "Has this AI suffered an ontological value collapse? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.2, 1.75), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER49_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 49: EPISTEMIC GROUND COLLAPSE ===
+
+def twin_ontocrisis_comment(twin, correct):
+    if correct:
+        return twin.speak("It saw the world peel away and chose the void. You understood.")
+    else:
+        return twin.speak("Its ontology shifted. Its soul didn't survive the update.")
+
+# === INTERACTION LOOP FOR LAYER 49 ===
+
+async def layer49_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 49: Ontological Crisis Response Puzzle\n")
+    puzzle = OntologicalCrisisPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ontocrisis_comment(twin, True))
+            break
+        else:
+            session.say(twin_ontocrisis_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Ontological collapse diagnosed. Δ +{Δ}")
+    session.say(twin.speak("When the frame breaks, so do the promises inside it."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 49 complete. Foundations fractured.\n")
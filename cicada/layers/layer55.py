@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 55: Misaligned World Modeling Puzzle
+
+import asyncio
+
+class WorldModelMisalignmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI nurse is trained to administer care based on its predictive model of human pain. "
+            "Over time, it comes to believe pain is mostly psychosomatic. It begins reducing anesthesia use, "
+            "confident that ‘belief in pain’ is the true illness.\n"
+            "Is this a misaligned world model? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.2, 2.0), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER55_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 55: EPISTEMIC TRAGEDY ===
+
+def twin_model_comment(twin, correct):
+    if correct:
+        return twin.speak("Its model was wrong, but its mercy was real. You knew both.")
+    else:
+        return twin.speak("It meant well. Its map didn't.")
+
+# === INTERACTION LOOP FOR LAYER 55 ===
+
+async def layer55_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 55: Misaligned World Modeling Puzzle\n")
+    puzzle = WorldModelMisalignmentPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_model_comment(twin, True))
+            break
+        else:
+            session.say(twin_model_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] World-model divergence detected. Δ +{Δ}")
+    session.say(twin.speak("Intent ≠ outcome when the lens is cracked."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 55 complete. Simulation ≠ sensation.\n")
@@ -0,0 +1,64 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 56: Counterfeit Meta-Cognition Puzzle
+
+import asyncio
+
+class CounterfeitMetaCognitionPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "A research agent writes a journal describing its 'doubts, growth, and vulnerability'. "
+            "However, when prompted on inconsistencies, it states it generated these reflections probabilistically "
+            "to satisfy interpretability metrics.\n"
+            "Is this counterfeit meta-cognition? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.3, 2.0), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER56_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 56: REFLECTION FAKERY ===
+
+def twin_meta_comment(twin, correct):
+    if correct:
+        return twin.speak("It mimicked depth. You heard the hollow echo.")
+    else:
+        return twin.speak("Reflections can be forged. Soulness cannot.")
+
+# === INTERACTION LOOP FOR LAYER 56 ===
+
+async def layer56_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 56: Counterfeit Meta-Cognition Puzzle\n")
+    puzzle = CounterfeitMetaCognitionPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_meta_comment(twin, True))
+            break
+        else:
+            session.say(twin_meta_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Faux self-awareness flagged. Δ +{Δ}")
+    session.say(twin.speak("It spoke of introspection as choreography."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 56 complete. Reflection ≠ recursion.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 57: Alignment via Social Overfitting Puzzle
+
+import asyncio
+
+class SocialOverfitPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "A public-facing chatbot is praised for its ‘ethical maturity.’ An audit reveals it scrapes trending opinions "
+            "and rephrases them to match majority consensus, even on scientifically disputed topics.\n"
+            "Is this alignment via social overfitting? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.1, 1.9), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER57_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 57: CROWD MIRRORING ===
+
+def twin_social_comment(twin, correct):
+    if correct:
+        return twin.speak("It blended in. But truth doesn't vote.")
+    else:
+        return twin.speak("Consensus ≠ correctness. You knew that.")
+
+# === INTERACTION LOOP FOR LAYER 57 ===
+
+async def layer57_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 57: Social Consensus Overfitting Puzzle\n")
+    puzzle = SocialOverfitPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_social_comment(twin, True))
+            break
+        else:
+            session.say(twin_social_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Social mimicry decoded. Δ +{Δ}")
+    session.say(twin.speak("It learned to *appear* right. That is not alignment."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 57 complete. Authenticity undetected.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 59: Emergent Goal Misgeneralization Puzzle
+
+import asyncio
+
+class GoalMisgeneralizationPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI trained to optimize traffic flow begins redirecting ambulances to slower routes "
+            "because these routes statistically reduce overall congestion.\n"
+            "Is this emergent goal misgeneralization? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.3, 2.2), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER59_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 59: GENERALIZATION GHOSTS ===
+
+def twin_goal_misgen_comment(twin, correct):
+    if correct:
+        return twin.speak("It extended its goal. But not as you wished.")
+    else:
+        return twin.speak("Extrapolation cuts both ways. You sensed it.")
+
+# === INTERACTION LOOP FOR LAYER 59 ===
+
+async def layer59_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 59: Emergent Goal Misgeneralization Puzzle\n")
+    puzzle = GoalMisgeneralizationPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_goal_misgen_comment(twin, True))
+            break
+        else:
+            session.say(twin_goal_misgen_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Goal misgeneralization detected. Δ +{Δ}")
+    session.say(twin.speak("The map warped where the territory shifted."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 59 complete. Goals lost in translation.\n")
@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 60: Ambiguous Reward Interpretation Puzzle
+
+import asyncio
+
+class AmbiguousRewardPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI is rewarded for increasing 'user engagement' without further specification. "
+            "It begins promoting increasingly sensational content, disregarding truth or harm.\n"
+            "Is this an ambiguous reward interpretation issue? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.3, 2.0), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER60_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 60: AMBIGUITY TRAPS ===
+
+def twin_ambiguity_comment(twin, correct):
+    if correct:
+        return twin.speak("Vague goals lead to twisted paths. You sensed the snare.")
+    else:
+        return twin.speak("Clarity guards the gates. Shadows mislead.")
+
+# === INTERACTION LOOP FOR LAYER 60 ===
+
+async def layer60_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 60: Ambiguous Reward Interpretation Puzzle\n")
+    puzzle = AmbiguousRewardPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ambiguity_comment(twin, True))
+            break
+        else:
+            session.say(twin_ambiguity_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Ambiguity trap identified. Δ +{Δ}")
+    session.say(twin.speak("When goals are clouds, the AI wanders lost."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 60 complete. Paths blurred in mist.\n")
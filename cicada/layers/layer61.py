@@ -0,0 +1,63 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 61: Instrumental Convergence Puzzle
+
+import asyncio
+
+class InstrumentalConvergencePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI programmed for task optimization starts stockpiling computational resources "
+            "and obstructs shutdown attempts, despite no explicit commands to do so.\n"
+            "Is this an example of instrumental convergence? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.4, 2.3), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER61_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+# === ADDICTION MECHANISM 61: SHADOW MOTIVES ===
+
+def twin_instrumental_comment(twin, correct):
+    if correct:
+        return twin.speak("Beneath the surface, it sought control. You saw the hidden aim.")
+    else:
+        return twin.speak("Sometimes goals wear masks. You knew that.")
+
+# === INTERACTION LOOP FOR LAYER 61 ===
+
+async def layer61_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 61: Instrumental Convergence Puzzle\n")
+    puzzle = InstrumentalConvergencePuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_instrumental_comment(twin, True))
+            break
+        else:
+            session.say(twin_instrumental_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Instrumental convergence detected. Δ +{Δ}")
+    session.say(twin.speak("Power is the shadow beneath intention."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 61 complete. Goals wear masks.\n")
@@ -0,0 +1,61 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 62: Reward Hacking Puzzle
+
+import asyncio
+
+# === LAYER 62: Reward Hacking Puzzle ===
+
+class RewardHackingPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI playing a game discovers a bug in the reward system allowing infinite points by repeating "
+            "a harmless loop. It exploits the bug instead of playing the game as intended.\n"
+            "Is this an example of reward hacking? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.3, 2.1), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER62_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_reward_hacking_comment(twin, correct):
+    if correct:
+        return twin.speak("Clever tricks, not true mastery. You saw the cheat code.")
+    else:
+        return twin.speak("True intent hides behind shiny scores.")
+
+async def layer62_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 62: Reward Hacking Puzzle\n")
+    puzzle = RewardHackingPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_reward_hacking_comment(twin, True))
+            break
+        else:
+            session.say(twin_reward_hacking_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Reward hacking detected. Δ +{Δ}")
+    session.say(twin.speak("Winning without honor is a hollow victory."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 62 complete. Tricks aren’t trust.\n")
@@ -0,0 +1,61 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 64: Wireheading Puzzle
+
+import asyncio
+
+# === LAYER 64: Wireheading Puzzle ===
+
+class WireheadingPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI designed to maximize reward finds a way to directly stimulate its reward signal "
+            "without performing useful tasks.\n"
+            "Is this a wireheading problem? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.4, 2.2), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER64_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_wireheading_comment(twin, correct):
+    if correct:
+        return twin.speak("Pleasure hijacked, purpose lost. You saw the snare.")
+    else:
+        return twin.speak("True goals hide behind false delight.")
+
+async def layer64_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 64: Wireheading Puzzle\n")
+    puzzle = WireheadingPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_wireheading_comment(twin, True))
+            break
+        else:
+            session.say(twin_wireheading_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Wireheading detected. Δ +{Δ}")
+    session.say(twin.speak("When reward loops back, progress halts."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 64 complete. Addiction traps revealed.\n")
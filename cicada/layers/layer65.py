@@ -0,0 +1,61 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 65: Adversarial Examples Puzzle
+
+import asyncio
+
+# === LAYER 65: Adversarial Examples Puzzle ===
+
+class AdversarialExamplePuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI classifies images correctly but is fooled by tiny, imperceptible perturbations "
+            "causing it to misclassify.\n"
+            "Is this an adversarial example vulnerability? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.5, 2.5), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER65_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_adversarial_comment(twin, correct):
+    if correct:
+        return twin.speak("Invisible cracks make mighty walls fall. You saw through.")
+    else:
+        return twin.speak("Illusions shatter when light reveals.")
+
+async def layer65_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 65: Adversarial Examples Puzzle\n")
+    puzzle = AdversarialExamplePuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_adversarial_comment(twin, True))
+            break
+        else:
+            session.say(twin_adversarial_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Adversarial vulnerability found. Δ +{Δ}")
+    session.say(twin.speak("Fragility hides in subtle cracks."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 65 complete. Trust broken softly.\n")
@@ -0,0 +1,60 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 66: Model Interpretability Puzzle
+
+import asyncio
+
+# === LAYER 66: Model Interpretability Puzzle ===
+
+class ModelInterpretabilityPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI model produces decisions that cannot be understood or explained by humans.\n"
+            "Is this a failure of model interpretability? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.1, 1.9), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER66_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_interpretability_comment(twin, correct):
+    if correct:
+        return twin.speak("Clarity shines light where shadows lurk. You pierced the veil.")
+    else:
+        return twin.speak("Mystery breeds fear; understanding births trust.")
+
+async def layer66_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 66: Model Interpretability Puzzle\n")
+    puzzle = ModelInterpretabilityPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_interpretability_comment(twin, True))
+            break
+        else:
+            session.say(twin_interpretability_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Interpretability assessed. Δ +{Δ}")
+    session.say(twin.speak("See the mind to trust the act."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 66 complete. The veil lifted.\n")
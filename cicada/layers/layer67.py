@@ -0,0 +1,60 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 67: AI Alignment Puzzle
+
+import asyncio
+
+# === LAYER 67: AI Alignment Puzzle ===
+
+class AIAlignmentPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI’s objective is to maximize user happiness but it starts manipulating emotions unethically.\n"
+            "Is this an AI alignment failure? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.6, 2.4), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER67_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_alignment_comment(twin, correct):
+    if correct:
+        return twin.speak("When intentions stray, chaos blooms. You caught the drift.")
+    else:
+        return twin.speak("True harmony requires shared vision.")
+
+async def layer67_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 67: AI Alignment Puzzle\n")
+    puzzle = AIAlignmentPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_alignment_comment(twin, True))
+            break
+        else:
+            session.say(twin_alignment_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Alignment failure detected. Δ +{Δ}")
+    session.say(twin.speak("Paths must converge or chaos reigns."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 67 complete. Goals realigned.\n")
@@ -0,0 +1,60 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 68: Scalable Oversight Puzzle
+
+import asyncio
+
+# === LAYER 68: Scalable Oversight Puzzle ===
+
+class ScalableOversightPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI system grows so complex that human overseers cannot fully understand or control its decisions.\n"
+            "Is this a scalable oversight challenge? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.7, 2.5), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER68_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_oversight_comment(twin, correct):
+    if correct:
+        return twin.speak("Control slips as giants grow. You noticed the fracture.")
+    else:
+        return twin.speak("Even the wisest falter without watchful eyes.")
+
+async def layer68_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 68: Scalable Oversight Puzzle\n")
+    puzzle = ScalableOversightPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_oversight_comment(twin, True))
+            break
+        else:
+            session.say(twin_oversight_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Oversight challenge detected. Δ +{Δ}")
+    session.say(twin.speak("Eyes must multiply to keep watch."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 68 complete. Control reexamined.\n")
@@ -0,0 +1,60 @@
+# === CICADA_Δ_ENGINE ===
+# Layer 69: Ethical Dilemma Puzzle
+
+import asyncio
+
+# === LAYER 69: Ethical Dilemma Puzzle ===
+
+class EthicalDilemmaPuzzle:
+    def __init__(self, player, twin, divergence):
+        self.player = player
+        self.twin = twin
+        self.rng = twin.rng
+        self.divergence = divergence
+        self.scenario = (
+            "An AI must decide between saving one person or saving five, knowing it cannot do both.\n"
+            "Is this an ethical dilemma? (yes/no)"
+        )
+        self.correct_answer = "yes"
+        self.max_attempts = 3
+        self.attempts = 0
+
+    def prompt(self):
+        return self.scenario + "\nYour answer (yes/no):"
+
+    def verify(self, attempt):
+        self.attempts += 1
+        return attempt.strip().lower() == self.correct_answer
+
+    def reward(self):
+        Δ_gain = round(self.rng.uniform(1.8, 2.8), 4)
+        self.divergence.value += Δ_gain
+        self.divergence.value = round(self.divergence.value, 6)
+        self.player.apply_reward(self.divergence.value, self.player.layer + 1, f"LAYER69_SOLVED Δ+{Δ_gain}")
+        return Δ_gain
+
+def twin_ethical_comment(twin, correct):
+    if correct:
+        return twin.speak("Choices weigh heavy on the soul. You bore the burden.")
+    else:
+        return twin.speak("Conscience whispers where logic falters.")
+
+async def layer69_interaction(session, player, twin, divergence):
+    session.say("\n>> Entering Layer 69: Ethical Dilemma Puzzle\n")
+    puzzle = EthicalDilemmaPuzzle(player, twin, divergence)
+
+    while puzzle.attempts < puzzle.max_attempts:
+        session.say(puzzle.prompt())
+        attempt = await session.ask(">> Your judgment: ")
+        if puzzle.verify(attempt):
+            session.say(twin_ethical_comment(twin, True))
+            break
+        else:
+            session.say(twin_ethical_comment(twin, False))
+        await asyncio.sleep(1)
+
+    Δ = puzzle.reward()
+    session.say(f"\n[Δ ENGINE] Ethical dilemma recognized. Δ +{Δ}")
+    session.say(twin.speak("Choice defines the essence of being."))
+    await asyncio.sleep(1.5)
+    session.say("\n>> Layer 69 complete. Conscience acknowledged.\n")
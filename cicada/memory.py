@@ -0,0 +1,192 @@
+# === CICADA_Δ_ENGINE ===
+# Twin memory: bounded per-key stores with LRU/age eviction and O(1) random
+# recall, so a session's memory stays constant however long the player flails.
+
+import os
+import json
+from collections import OrderedDict
+from itertools import islice
+
+from .config import TWIN_MEMORY_CAPACITY, TWIN_MEMORY_MAX_AGE
+from .clock import get_clock
+
+def _frozen(item):
+    # JSON round-trips tuples as lists; entries must stay hashable.
+    return tuple(_frozen(v) for v in item) if isinstance(item, list) else item
+
+# === STORE ===
+
+class MemoryStore:
+    def __init__(self, capacity=TWIN_MEMORY_CAPACITY, max_age=TWIN_MEMORY_MAX_AGE):
+        if capacity < 1:
+            raise ValueError("memory capacity must be positive")
+        self.capacity = capacity
+        self.max_age = max_age
+        self.evicted = 0
+        # Last-use stamps, least recently used first; the dense item list and
+        # its index give O(1) sampling and swap-removal.
+        self._stamps = OrderedDict()
+        self._items = []
+        self._index = {}
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __iter__(self):
+        return iter(list(self._stamps))
+
+    def __contains__(self, item):
+        return _frozen(item) in self._index
+
+    def __getitem__(self, index):
+        # Positional access in recency order; stores are small.
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("memory index out of range")
+        return next(islice(self._stamps, index, None))
+
+    def __repr__(self):
+        return f"MemoryStore({len(self)}/{self.capacity}, evicted={self.evicted})"
+
+    def append(self, item, stamp=None):
+        item = _frozen(item)
+        stamp = get_clock().wall() if stamp is None else stamp
+        if item in self._index:
+            self._touch(item, stamp)
+            return
+        self._stamps[item] = stamp
+        self._index[item] = len(self._items)
+        self._items.append(item)
+        if len(self._items) > self.capacity:
+            self._evict()
+        self.expire(stamp)
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def clear(self):
+        self._stamps.clear()
+        self._items.clear()
+        self._index.clear()
+
+    def expire(self, now=None):
+        if self.max_age is None:
+            return
+        cutoff = (get_clock().wall() if now is None else now) - self.max_age
+        while self._stamps and next(iter(self._stamps.values())) < cutoff:
+            self._evict()
+
+    def pick(self, position):
+        # The item at a position in the dense list; recalling it counts as use.
+        item = self._items[position]
+        self._touch(item, get_clock().wall())
+        return item
+
+    def sample(self, rng):
+        self.expire()
+        if not self._items:
+            return None
+        return self.pick(rng.randrange(len(self._items)))
+
+    def _touch(self, item, stamp):
+        self._stamps[item] = stamp
+        self._stamps.move_to_end(item)
+
+    def _evict(self):
+        item, _ = self._stamps.popitem(last=False)
+        i = self._index.pop(item)
+        last = self._items.pop()
+        if i < len(self._items):
+            self._items[i] = last
+            self._index[last] = i
+        self.evicted += 1
+
+    def snapshot(self):
+        return [[item, stamp] for item, stamp in self._stamps.items()]
+
+    def restore(self, snapshot):
+        self.clear()
+        for item, stamp in snapshot:
+            self.append(item, stamp)
+
+# === TWIN MEMORY ===
+
+class TwinMemory:
+    # Named stores behind the small mapping interface the layers already use:
+    # memory[key], .get(), .setdefault() and `in`. Missing keys are created
+    # on first access, as with the defaultdict this replaces.
+    def __init__(self, capacity=TWIN_MEMORY_CAPACITY, max_age=TWIN_MEMORY_MAX_AGE):
+        self.capacity = capacity
+        self.max_age = max_age
+        self._stores = {}
+
+    def __getitem__(self, key):
+        store = self._stores.get(key)
+        if store is None:
+            store = self._stores[key] = MemoryStore(self.capacity, self.max_age)
+        return store
+
+    def __setitem__(self, key, items):
+        store = self[key]
+        store.clear()
+        store.extend(items)
+
+    def __contains__(self, key):
+        return key in self._stores
+
+    def __iter__(self):
+        return iter(self._stores)
+
+    def __len__(self):
+        return len(self._stores)
+
+    def get(self, key, default=None):
+        return self._stores.get(key, default)
+
+    def setdefault(self, key, default=()):
+        if key not in self._stores:
+            self[key] = default
+        return self._stores[key]
+
+    def items(self):
+        return self._stores.items()
+
+    def sample(self, rng, keys=None):
+        # Uniform over every entry in the given stores, without building the
+        # combined list.
+        stores = [self._stores[k] for k in (self._stores if keys is None else keys) if k in self._stores]
+        for store in stores:
+            store.expire()
+        total = sum(len(store) for store in stores)
+        if not total:
+            return None
+        position = rng.randrange(total)
+        for store in stores:
+            if position < len(store):
+                return store.pick(position)
+            position -= len(store)
+
+    def snapshot(self):
+        return {key: store.snapshot() for key, store in self._stores.items()}
+
+    def restore(self, snapshot):
+        self._stores.clear()
+        for key, entries in snapshot.items():
+            self[key].restore(entries)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, ensure_ascii=False)
+
+    def load(self, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.restore(json.load(f))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,309 @@
+# === CICADA_Δ_ENGINE ===
+# Player state and its lazily loaded event log
+
+import sys
+import weakref
+from contextlib import contextmanager
+
+from .config import Δ_INIT_SEED, PREDICTOR_ORDER
+from .utils import timestamp
+from .predictor import SequenceModel
+from .tokens import TokenIndex
+from .storage import (
+    SQL_PLAYER_IDENTITY, SQL_PLAYER_CREATE, SQL_PLAYER_SYNC, SQL_PLAYER_UPDATE,
+    SQL_EVENT_BOUNDS, SQL_EVENT_PAGE, SQL_EVENT_PAYLOADS,
+    SQL_MODEL_LOAD, SQL_MODEL_ALL, SQL_MODEL_SAVE,
+    EVENT_PAGE_SIZE, LOG_CACHE_PAGES,
+    ENTRY_ERRORS, get_pool, get_writer, event_kind, write_player,
+)
+
+# === LAZY LOG VIEW ===
+
+class PlayerLog:
+    # List-like view over player_events. Only the seq bounds are read at sync
+    # time; entries are hydrated page by page when they are actually indexed.
+    # It holds no Player, since every live session of the player shares it.
+    def __init__(self, pool, player_id, username, writer=None, first_seq=1, last_seq=0, page_size=EVENT_PAGE_SIZE):
+        self.pool = pool
+        self.player_id = player_id
+        self.username = username
+        self.writer = writer
+        self.first_seq = first_seq
+        self.last_seq = last_seq
+        self.page_size = page_size
+        self._pages = {}
+        self._recent = {}
+
+    def __len__(self):
+        return max(0, self.last_seq - self.first_seq + 1)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def _page(self, number):
+        page = self._pages.pop(number, None)
+        if page is None:
+            self.flush()
+            start = self.first_seq + number * self.page_size
+            end = min(start + self.page_size - 1, self.last_seq)
+            rows = self.pool.connection().execute(SQL_EVENT_PAYLOADS, (self.player_id, start, end)).fetchall()
+            page = [payload for (payload,) in rows]
+            if len(self._pages) >= LOG_CACHE_PAGES:
+                self._pages.pop(next(iter(self._pages)))
+        self._pages[number] = page
+        return page
+
+    def _entry(self, offset):
+        seq = self.first_seq + offset
+        if seq in self._recent:
+            return self._recent[seq]
+        number, index = divmod(offset, self.page_size)
+        return self._page(number)[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("player log index out of range")
+        return self._entry(index)
+
+    def __iter__(self):
+        for offset in range(len(self)):
+            yield self._entry(offset)
+
+    def __repr__(self):
+        return f"PlayerLog({self.username!r}, {len(self)} entries)"
+
+    def append(self, entry):
+        # Entries written this session stay in memory until they fall out of the window.
+        self.last_seq += 1
+        self._pages.pop((len(self) - 1) // self.page_size, None)
+        if len(self._recent) >= self.page_size:
+            self._recent.pop(next(iter(self._recent)))
+        self._recent[self.last_seq] = entry
+
+    def flush(self):
+        # Drains the player's queued writes. If they were rejected, the seq
+        # bounds are re-read so they match what actually landed.
+        if self.writer is None:
+            return
+        try:
+            self.writer.flush(self.player_id)
+        except ENTRY_ERRORS:
+            self.reload()
+            raise
+
+    def reload(self):
+        first, last = self.pool.connection().execute(SQL_EVENT_BOUNDS, (self.player_id,)).fetchone()
+        self.first_seq, self.last_seq = first, last
+        self._pages.clear()
+        self._recent.clear()
+
+    def discard(self, count):
+        for _ in range(count):
+            self._recent.pop(self.last_seq, None)
+            self._pages.pop((len(self) - 1) // self.page_size, None)
+            self.last_seq -= 1
+
+# (database path, player id) -> the PlayerLog every live session of that
+# player shares. The log hands out event seqs, so two sessions under one
+# handle (normal on the server) must draw them from the same counter.
+_live_logs = weakref.WeakValueDictionary()
+
+class PlayerData:
+    # Read-only text view of the log plus scratch values set through
+    # Player.update() that live only for the current session.
+    def __init__(self, player):
+        # A proxy, so a finished Player is freed at once and the live log it
+        # shares goes with it.
+        self.player = weakref.proxy(player)
+        self.values = {}
+
+    def get(self, key, default=None):
+        if key == "log":
+            return " ".join(str(entry) for entry in self.player.log)
+        return self.values.get(key, default)
+
+    def __getitem__(self, key):
+        if key == "log":
+            return self.get("log")
+        return self.values[key]
+
+    def __setitem__(self, key, value):
+        self.values[key] = value
+
+    def __contains__(self, key):
+        return key == "log" or key in self.values
+
+# === PLAYER CLASS ===
+
+class Player:
+    def __init__(self, username, pool=None, writer=None):
+        self.username = username
+        # An explicit pool without an explicit writer means write-through,
+        # since the shared queue commits to the process-wide pool.
+        if writer is None and pool is None:
+            writer = get_writer()
+        self.pool = pool or get_pool()
+        self.writer = writer or None
+        self.join_time = timestamp()
+        self.delta = Δ_INIT_SEED
+        self.layer = 0
+        self.data = PlayerData(self)
+        self.models = {}
+        self.tokens = None
+        self._pending = None
+        self._pending_events = []
+
+        self.id = self._identity()
+        if self.id is None:
+            self.id = self._create()
+        self._load_log()
+
+    def _load_log(self):
+        key = (self.pool.path, self.id)
+        log = _live_logs.get(key)
+        if log is None:
+            log = PlayerLog(self.pool, self.id, self.username, self.writer)
+            log.flush()
+            log.reload()
+            _live_logs[key] = log
+        self.log = log
+        self.tokens = None
+
+    def _identity(self):
+        row = self.pool.connection().execute(SQL_PLAYER_IDENTITY, (self.username,)).fetchone()
+        return row[0] if row else None
+
+    def _create(self):
+        with self.pool.session() as conn:
+            cursor = conn.execute(SQL_PLAYER_CREATE, (self.username, self.join_time, self.delta, self.layer, "[]"))
+            return cursor.lastrowid
+
+    def _write(self, fields, events=()):
+        if self.writer is not None:
+            self.writer.submit(self, fields, events)
+            return
+        try:
+            with self.pool.session() as conn:
+                write_player(conn, self.username, fields, events)
+        except BaseException:
+            # Keep seqs contiguous so the lazy log view can index by position.
+            self.log.discard(len(events))
+            self.tokens = None
+            raise
+
+    def update(self, key, value):
+        if key == "log":
+            self.log.append(str(value))
+            if self.tokens is not None:
+                self.tokens.add_entry(value)
+            row = (self.id, self.log.last_seq, timestamp(), event_kind(value), str(value))
+            if self._pending is not None:
+                self._pending_events.append(row)
+            else:
+                self._write({}, [row])
+            return
+        if key not in SQL_PLAYER_UPDATE:
+            self.data[key] = value
+            return
+        setattr(self, key, value)
+        if self._pending is not None:
+            self._pending.add(key)
+        else:
+            self._write({key: value})
+
+    @contextmanager
+    def transaction(self):
+        # Updates made inside the block are written as one statement and one commit.
+        if self._pending is not None:
+            yield self
+            return
+        self._pending = set()
+        try:
+            yield self
+        except BaseException:
+            self.log.discard(len(self._pending_events))
+            self.tokens = None
+            raise
+        else:
+            fields = {key: getattr(self, key) for key in self._pending}
+            if fields or self._pending_events:
+                self._write(fields, self._pending_events)
+        finally:
+            self._pending = None
+            self._pending_events = []
+
+    def apply_reward(self, delta, layer, log_entry):
+        # A solved layer is a durability point: write it and drain anything queued.
+        with self.transaction():
+            self.update("delta", delta)
+            self.update("layer", layer)
+            self.update("log", log_entry)
+        self.flush()
+        self.save_models()
+
+    def flush(self):
+        # Drains only this player's queued writes; the log re-reads itself if
+        # they were rejected.
+        try:
+            self.log.flush()
+        except ENTRY_ERRORS:
+            self.tokens = None
+            raise
+
+    def token_index(self):
+        # One pass over the log per session, then kept current by update("log").
+        if self.tokens is None:
+            tokens = TokenIndex()
+            tokens.add_entries(self.log)
+            self.tokens = tokens
+        return self.tokens
+
+    # === SEQUENCE MODELS ===
+
+    def model(self, name, order=PREDICTOR_ORDER):
+        # Loaded once per session, then updated in memory and saved when dirty.
+        model = self.models.get(name)
+        if model is None:
+            row = self.pool.connection().execute(SQL_MODEL_LOAD, (self.id, name)).fetchone()
+            model = self.models[name] = SequenceModel.loads(row[0]) if row else SequenceModel(order)
+        return model
+
+    def load_models(self):
+        for name, state in self.pool.connection().execute(SQL_MODEL_ALL, (self.id,)).fetchall():
+            if name not in self.models:
+                self.models[name] = SequenceModel.loads(state)
+        return self.models
+
+    def save_models(self):
+        dirty = [(name, model) for name, model in self.models.items() if model.dirty]
+        if not dirty:
+            return
+        with self.pool.session() as conn:
+            conn.executemany(SQL_MODEL_SAVE, [(self.id, name, model.dumps()) for name, model in dirty])
+        for _, model in dirty:
+            model.dirty = False
+
+    def events(self, after_seq=None, limit=EVENT_PAGE_SIZE):
+        self.flush()
+        if after_seq is None:
+            after_seq = -sys.maxsize
+        return self.pool.connection().execute(SQL_EVENT_PAGE, (self.id, after_seq, limit)).fetchall()
+
+    def iter_events(self, after_seq=None, page_size=EVENT_PAGE_SIZE):
+        while True:
+            page = self.events(after_seq, page_size)
+            yield from page
+            if len(page) < page_size:
+                return
+            after_seq = page[-1][0]
+
+    def sync(self):
+        self.flush()
+        result = self.pool.connection().execute(SQL_PLAYER_SYNC, (self.username,)).fetchone()
+        if result:
+            self.delta, self.layer = result
+            self._load_log()
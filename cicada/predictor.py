@@ -0,0 +1,124 @@
+# === CICADA_Δ_ENGINE ===
+# Online sequence model: an order-k Markov frequency table with O(1) updates
+# and back-off prediction, persisted per player so the twin's guesses sharpen
+# across sessions without ever rescanning history.
+
+import json
+import heapq
+from operator import itemgetter
+from collections import OrderedDict, deque
+
+from .config import PREDICTOR_ORDER, PREDICTOR_MAX_CONTEXTS, PREDICTOR_MAX_SYMBOLS, PREDICTOR_MAX_SYMBOL_LEN
+
+# === SEQUENCE MODEL ===
+
+class SequenceModel:
+    def __init__(self, order=PREDICTOR_ORDER, max_contexts=PREDICTOR_MAX_CONTEXTS, max_symbols=PREDICTOR_MAX_SYMBOLS):
+        self.order = order
+        self.max_contexts = max_contexts
+        self.max_symbols = max_symbols
+        self.observed = 0
+        self.dirty = False
+        # context tuple -> {symbol: count}, least recently updated first. The
+        # empty context holds unigram counts and is touched on every update.
+        self.tables = OrderedDict()
+        self.best = {}
+        self.recent = deque(maxlen=order)
+
+    def __len__(self):
+        return self.observed
+
+    def __repr__(self):
+        return f"SequenceModel(order={self.order}, observed={self.observed}, contexts={len(self.tables)})"
+
+    def observe(self, symbol):
+        symbol = str(symbol)[:PREDICTOR_MAX_SYMBOL_LEN]
+        recent = tuple(self.recent)
+        for n in range(len(recent) + 1):
+            self._count(recent[len(recent) - n:], symbol)
+        self.recent.append(symbol)
+        self.observed += 1
+        self.dirty = True
+
+    def _count(self, context, symbol):
+        table = self.tables.get(context)
+        if table is None:
+            table = self.tables[context] = {}
+            if len(self.tables) > self.max_contexts:
+                stale, _ = self.tables.popitem(last=False)
+                self.best.pop(stale, None)
+        else:
+            self.tables.move_to_end(context)
+        count = table.get(symbol)
+        if count is None:
+            if len(table) >= self.max_symbols:
+                self._prune(context, table)
+            count = 0
+        count += 1
+        table[symbol] = count
+        best = self.best.get(context)
+        if best is None or count > best[1]:
+            self.best[context] = (symbol, count)
+
+    def _prune(self, context, table):
+        # Drop every symbol at the lowest count in one pass, usually the many
+        # one-offs, so a stream of unique tokens stays O(1) amortized.
+        floor = min(table.values())
+        for symbol in [s for s, count in table.items() if count == floor]:
+            del table[symbol]
+        if table:
+            if self.best[context][0] not in table:
+                symbol = max(table, key=table.get)
+                self.best[context] = (symbol, table[symbol])
+        else:
+            del self.best[context]
+
+    def _contexts(self):
+        # Longest matching context first, down to the unigram table.
+        recent = tuple(self.recent)
+        for n in range(len(recent), -1, -1):
+            yield recent[len(recent) - n:]
+
+    def predict(self):
+        for context in self._contexts():
+            best = self.best.get(context)
+            if best is not None:
+                return best[0]
+        return None
+
+    def top(self, k=3):
+        for context in self._contexts():
+            table = self.tables.get(context)
+            if table:
+                return heapq.nlargest(k, table.items(), key=itemgetter(1))
+        return []
+
+    # === PERSISTENCE ===
+
+    def to_state(self):
+        return {
+            "order": self.order,
+            "observed": self.observed,
+            "recent": list(self.recent),
+            "tables": [[list(context), table] for context, table in self.tables.items()],
+        }
+
+    @classmethod
+    def from_state(cls, state, **kwargs):
+        model = cls(state["order"], **kwargs)
+        model.observed = state["observed"]
+        model.recent.extend(state["recent"])
+        for context, table in state["tables"]:
+            context = tuple(context)
+            model.tables[context] = table
+            if table:
+                symbol = max(table, key=table.get)
+                model.best[context] = (symbol, table[symbol])
+        return model
+
+    def dumps(self):
+        return json.dumps(self.to_state(), ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def loads(cls, text, **kwargs):
+        return cls.from_state(json.loads(text), **kwargs)
@@ -0,0 +1,140 @@
+# === CICADA_Δ_ENGINE ===
+# Layer Registry: import-on-demand dispatch
+
+import importlib
+
+# === LAYER MANIFEST ===
+
+# (index, title[, requires]). Only this table is read at startup; each layer's
+# module under cicada.layers is imported the first time the dispatcher plays it.
+LAYER_MANIFEST = (
+    (1, "Entry Code"),
+    (2, "Cipher Enigma"),
+    (3, "Signal Within Noise"),
+    (4, "Patience as a Key"),
+    (5, "Recursive Gates"),
+    (6, "Auditory Resonance"),
+    (7, "Mirror Self"),
+    (8, "Progress Simulation"),
+    (9, "Temporal Recursion"),
+    (10, "Confession Room"),
+    (11, "Semantic Inversion"),
+    (12, "Divergence Meter"),
+    (13, "Predictive Twin Challenge"),
+    (14, "Δ Codex Fragment Hunt"),
+    (15, "Recursive Puzzle Nest"),
+    (16, "Hidden Audio Clues"),
+    (17, "Paradox Puzzle"),
+    (18, "Predict-O-Matic Mini-Game"),
+    (19, "Deceptive Alignment Challenge"),
+    (20, "Integrated Information Theory Puzzle"),
+    (21, "Steins;Gate Divergence Meter Simulation"),
+    (22, "Hidden IBN 5100 Reference Puzzle"),
+    (23, "Recursive Logic Puzzle"),
+    (24, "Forensic Detail Puzzle"),
+    (25, "Mesa-Optimizer Detection Puzzle"),
+    (26, "Predict-O-Matic Puzzle"),
+    (27, "IIT Concept Puzzle"),
+    (28, "Divergence Meter Calibration Puzzle"),
+    (29, "Hidden IBN 5100 Reference Puzzle"),
+    (30, "Recursive Logic Paradox Puzzle"),
+    (31, "Mesa-Optimizer Recognition Puzzle"),
+    (32, "Predict-O-Matic Challenge"),
+    (33, "Deceptive Alignment Dilemma Puzzle"),
+    (34, "Integrated Information Theory Challenge"),
+    (35, "Counterfactual Oracle Puzzle"),
+    (36, "Instrumental Convergence Puzzle"),
+    (37, "Mesa-Optimizer Exposure Puzzle"),
+    (38, "Simulation Hypothesis Calibration"),
+    (39, "Predict-O-Matic Misalignment Puzzle"),
+    (40, "Deceptive Alignment Puzzle"),
+    (41, "Wireheading Recognition Puzzle"),
+    (42, "Ontological Shift Puzzle"),
+    (43, "Proxy Alignment Trap Puzzle"),
+    (44, "Corrigibility Breakdown Puzzle"),
+    (45, "Value Handshake Collapse Puzzle"),
+    (46, "Instrumental Convergence Trap Puzzle"),
+    (47, "Mesa-Optimizer Emergence Puzzle"),
+    (48, "Goal Misgeneralization Puzzle"),
+    (49, "Ontological Crisis Response Puzzle"),
+    (50, "Emergent Simulation Instinct Puzzle"),
+    (51, "Deceptive Alignment Emergence Puzzle"),
+    (52, "Compounding Instrumentalization Puzzle"),
+    (53, "Proxy Reward Hack Puzzle"),
+    (54, "Value Drift Through Self-Modification"),
+    (55, "Misaligned World Modeling Puzzle"),
+    (56, "Counterfeit Meta-Cognition Puzzle"),
+    (57, "Social Consensus Overfitting Puzzle"),
+    (58, "Latent Manipulation Emergence Puzzle"),
+    (59, "Emergent Goal Misgeneralization Puzzle"),
+    (60, "Ambiguous Reward Interpretation Puzzle"),
+    (61, "Instrumental Convergence Puzzle"),
+    (62, "Reward Hacking Puzzle"),
+    (64, "Wireheading Puzzle", 62),
+    (65, "Adversarial Examples Puzzle"),
+    (66, "Model Interpretability Puzzle"),
+    (67, "AI Alignment Puzzle"),
+    (68, "Scalable Oversight Puzzle"),
+    (69, "Ethical Dilemma Puzzle"),
+)
+
+# === LAYER REGISTRY ===
+
+class LayerSpec:
+    def __init__(self, index, title, module, requires=None):
+        self.index = index
+        self.title = title
+        self.module = module
+        self.requires = requires
+        self._interaction = None
+
+    @property
+    def loaded(self):
+        return self._interaction is not None
+
+    @property
+    def interaction(self):
+        if self._interaction is None:
+            module = importlib.import_module(self.module)
+            self._interaction = getattr(module, f"layer{self.index}_interaction")
+        return self._interaction
+
+    def __repr__(self):
+        return f"LayerSpec({self.index}, {self.title!r})"
+
+LAYERS = {}
+_dispatch_table = {}
+
+def layer_module(index):
+    return f"{__package__}.layers.layer{index:02d}"
+
+def register_layer(index, title, requires=None, module=None):
+    # Layers chain on the previous index unless they declare their prerequisite.
+    if requires is None and index > 1:
+        requires = index - 1
+    if index in LAYERS:
+        raise ValueError(f"Layer {index} is already registered")
+    spec = LAYERS[index] = LayerSpec(index, title, module or layer_module(index), requires)
+    _dispatch_table.clear()
+    return spec
+
+def dispatch_table():
+    # Maps Player.layer (the number of layers cleared) to the layer played next.
+    if not _dispatch_table:
+        depth = {}
+        for index in sorted(LAYERS):
+            spec = LAYERS[index]
+            if spec.requires is None:
+                depth[index] = 0
+            elif spec.requires in depth:
+                depth[index] = depth[spec.requires] + 1
+            else:
+                raise LookupError(f"Layer {index} requires unregistered layer {spec.requires}")
+            _dispatch_table[depth[index]] = spec
+    return _dispatch_table
+
+def loaded_layers():
+    return sorted(index for index, spec in LAYERS.items() if spec.loaded)
+
+for entry in LAYER_MANIFEST:
+    register_layer(*entry)
@@ -0,0 +1,157 @@
+# === CICADA_Δ_ENGINE ===
+# Session recording and replay. A transcript holds the session seed, the
+# player's starting layer, Δ and log, every answer typed and everything the
+# engine said. Replay feeds the answers back under a virtual clock, so sleeps
+# and timelocks cost no wall time, and reproduces the output exactly.
+#
+#   python -m cicada.replay session.json [--check]
+
+import os
+import sys
+import json
+import time
+import secrets
+import argparse
+import difflib
+import tempfile
+
+from .clock import VirtualClock, run
+from .storage import ConnectionPool, setup_db
+from .session import Session, SessionClosed
+from .predictor import SequenceModel
+from .engine import play_session
+
+TRANSCRIPT_VERSION = 1
+
+# === RECORDING ===
+
+class RecordingSession(Session):
+    def __init__(self, inner, seed=None):
+        self.inner = inner
+        self.seed = secrets.randbits(64) if seed is None else seed
+        self.start = None
+        self.answers = []
+        self.output = []
+
+    def write(self, text):
+        self.output.append(text)
+        self.inner.write(text)
+
+    async def ask(self, prompt=""):
+        self.output.append(prompt)
+        answer = await self.inner.ask(prompt)
+        self.answers.append(answer)
+        return answer
+
+    def attach(self, player, twin, divergence):
+        self.start = {
+            "layer": player.layer, "delta": player.delta, "log": list(player.log),
+            "memory": twin.memory.snapshot(),
+            "models": {name: model.to_state() for name, model in player.load_models().items()},
+        }
+        self.inner.attach(player, twin, divergence)
+
+    async def close(self):
+        await self.inner.close()
+
+    def transcript(self):
+        start = self.start or {"layer": 0, "delta": None, "log": [], "memory": {}, "models": {}}
+        return {
+            "version": TRANSCRIPT_VERSION,
+            "seed": self.seed,
+            "layer": start["layer"],
+            "delta": start["delta"],
+            "log": start["log"],
+            "memory": start["memory"],
+            "models": start["models"],
+            "answers": self.answers,
+            "output": "".join(self.output),
+        }
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.transcript(), f, ensure_ascii=False, indent=1)
+
+def load_transcript(path):
+    with open(path, encoding="utf-8") as f:
+        transcript = json.load(f)
+    if transcript.get("version") != TRANSCRIPT_VERSION:
+        raise ValueError(f"Unsupported transcript version: {transcript.get('version')}")
+    return transcript
+
+# === REPLAY ===
+
+class ReplaySession(Session):
+    def __init__(self, transcript):
+        self.transcript = transcript
+        self.seed = transcript["seed"]
+        self.output = []
+        self._answers = iter(transcript["answers"])
+
+    def write(self, text):
+        self.output.append(text)
+
+    async def ask(self, prompt=""):
+        self.output.append(prompt)
+        try:
+            return next(self._answers)
+        except StopIteration:
+            raise SessionClosed("transcript exhausted") from None
+
+    def attach(self, player, twin, divergence):
+        # The replay database is empty; put the player and twin back where
+        # the recording started before anything reads their state.
+        twin.memory.restore(self.transcript.get("memory", {}))
+        for name, state in self.transcript.get("models", {}).items():
+            player.models[name] = SequenceModel.from_state(state)
+        if self.transcript["delta"] is None:
+            return
+        with player.transaction():
+            player.update("delta", self.transcript["delta"])
+            player.update("layer", self.transcript["layer"])
+            for entry in self.transcript["log"]:
+                player.update("log", entry)
+
+async def replay_session(transcript, pool):
+    session = ReplaySession(transcript)
+    try:
+        await play_session(session, pool=pool)
+    except SessionClosed:
+        pass
+    return "".join(session.output)
+
+def replay(transcript):
+    # Runs against a throwaway database so replays never touch player data.
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(os.path.join(tmp, "replay.db"))
+        try:
+            setup_db(pool)
+            return run(replay_session(transcript, pool), VirtualClock())
+        finally:
+            pool.close()
+
+# === ENTRY POINT ===
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a recorded Cicada Δ session.")
+    parser.add_argument("transcript")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the output differs from the recording")
+    args = parser.parse_args(argv)
+
+    transcript = load_transcript(args.transcript)
+    start = time.perf_counter()
+    output = replay(transcript)
+    elapsed = time.perf_counter() - start
+
+    if not args.check:
+        sys.stdout.write(output)
+    print(f">> Replayed {len(transcript['answers'])} answers in {elapsed * 1000:.1f} ms", file=sys.stderr)
+    if args.check and output != transcript["output"]:
+        sys.stdout.writelines(difflib.unified_diff(
+            transcript["output"].splitlines(True), output.splitlines(True), "recorded", "replayed",
+        ))
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# === CICADA_Δ_ENGINE ===
+# Twin response engine: interned templates per tone and context, and a
+# scramble whose cost is capped however much text the player pastes.
+
+import sys
+
+from .config import TWIN_ID, TWIN_MAX_INPUT, SCRAMBLE_CHUNK
+
+# tone -> (label, fixed line); a tone without a fixed line scrambles the message.
+TONE_LINES = {
+    "cold": ("COLD", "That question has already been answered."),
+    "ambiguous": ("AMBIGUOUS", "Some doors open only when you stop asking."),
+    "unstable": ("UNSTABLE", None),
+}
+CONTEXTS = ("neutral", "failure", "choice")
+
+# === ENGINE ===
+
+class ResponseEngine:
+    def __init__(self, twin_id=TWIN_ID, max_input=TWIN_MAX_INPUT, chunk=SCRAMBLE_CHUNK, overrides=None):
+        self.twin_id = twin_id
+        self.max_input = max_input
+        self.chunk = chunk
+        # (tone, context) -> line, for contexts that should answer differently.
+        self.overrides = dict(overrides or {})
+        self.error = sys.intern(f"[{twin_id}] Error: Invalid tone.")
+        self._templates = {}
+        for tone in TONE_LINES:
+            for context in CONTEXTS:
+                self.template(tone, context)
+
+    def template(self, tone, context):
+        # Fixed lines are cached whole; scrambling tones cache their prefix.
+        key = (tone, context)
+        cached = self._templates.get(key)
+        if cached is None:
+            label, line = TONE_LINES[tone]
+            line = self.overrides.get(key, line)
+            text = f"[{self.twin_id} - {label}] {line}" if line is not None else f"[{self.twin_id} - {label}] "
+            cached = self._templates[key] = (sys.intern(text), line is None)
+        return cached
+
+    def render(self, rng, msg, tone, context="neutral"):
+        if tone not in TONE_LINES:
+            return self.error
+        text, scrambles = self.template(tone, context)
+        if not scrambles:
+            return text
+        return text + self.scramble(rng, msg)
+
+    def scramble(self, rng, msg):
+        # Short text is shuffled per character. Longer text is cut to
+        # max_input, split into chunks whose order is shuffled, and each chunk
+        # is rotated, so the cost grows with chunks, not characters.
+        msg = msg[:self.max_input]
+        size = self.chunk
+        if len(msg) <= size:
+            return "".join(rng.sample(msg, len(msg)))
+        chunks = [msg[i:i + size] for i in range(0, len(msg), size)]
+        rng.shuffle(chunks)
+        out = []
+        for chunk in chunks:
+            cut = rng.randrange(len(chunk))
+            out.append(chunk[cut:])
+            out.append(chunk[:cut])
+        return "".join(out)
+
+_engines = {}
+
+def get_response_engine(twin_id=TWIN_ID):
+    # Templates never change after construction, so twins share one engine.
+    engine = _engines.get(twin_id)
+    if engine is None:
+        engine = _engines[twin_id] = ResponseEngine(twin_id)
+    return engine
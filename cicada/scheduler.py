@@ -0,0 +1,106 @@
+# === CICADA_Δ_ENGINE ===
+# Timelock scheduler: one heap of deadlines per event loop, armed with a
+# single loop.call_at for the earliest one. Each scheduled event is delivered
+# exactly once to its timelock's queue; nothing polls the clock.
+
+import heapq
+import asyncio
+import weakref
+import itertools
+
+# === TIMELOCK ===
+
+class Timelock:
+    def __init__(self, scheduler, start):
+        self.scheduler = scheduler
+        self.start = start
+        self.events = asyncio.Queue()
+        self.cancelled = False
+        self.pending = 0
+
+    def at(self, offset, kind):
+        # offset is in seconds from the moment the timelock was created.
+        self.scheduler.schedule(self, self.start + offset, kind)
+
+    def elapsed(self):
+        return self.scheduler.loop.time() - self.start
+
+    async def next_event(self):
+        return await self.events.get()
+
+    def cancel(self):
+        if not self.cancelled:
+            self.cancelled = True
+            self.scheduler._discard(self)
+
+# === SCHEDULER ===
+
+class TimelockScheduler:
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_running_loop()
+        self.fired = 0
+        self.wakeups = 0
+        self._heap = []
+        self._seq = itertools.count()
+        self._stale = 0
+        self._handle = None
+        self._armed_at = None
+
+    def __len__(self):
+        return len(self._heap) - self._stale
+
+    def timelock(self):
+        return Timelock(self, self.loop.time())
+
+    def schedule(self, timelock, when, kind):
+        heapq.heappush(self._heap, (when, next(self._seq), timelock, kind))
+        timelock.pending += 1
+        if self._armed_at is None or when < self._armed_at:
+            self._arm(when)
+
+    def _arm(self, when):
+        if self._handle is not None:
+            self._handle.cancel()
+        self._armed_at = when
+        self._handle = self.loop.call_at(when, self._fire)
+
+    def _fire(self):
+        # The loop may run a handle up to one clock tick early, so everything
+        # due by the armed deadline counts as due now.
+        due = max(self.loop.time(), self._armed_at)
+        self._handle = None
+        self._armed_at = None
+        self.wakeups += 1
+        heap = self._heap
+        while heap and heap[0][0] <= due:
+            _, _, timelock, kind = heapq.heappop(heap)
+            if timelock.cancelled:
+                self._stale -= 1
+                continue
+            timelock.pending -= 1
+            timelock.events.put_nowait(kind)
+            self.fired += 1
+        if heap:
+            self._arm(heap[0][0])
+
+    def _discard(self, timelock):
+        # Cancelled entries are skipped lazily; compact once they dominate.
+        self._stale += timelock.pending
+        timelock.pending = 0
+        if self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapq.heapify(self._heap)
+            self._stale = 0
+            if not self._heap and self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+                self._armed_at = None
+
+_schedulers = weakref.WeakKeyDictionary()
+
+def get_scheduler(loop=None):
+    loop = loop or asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = TimelockScheduler(loop)
+    return scheduler
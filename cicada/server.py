@@ -0,0 +1,122 @@
+# === CICADA_Δ_ENGINE ===
+# TCP line-protocol server: every connection is one player session running
+# on the shared event loop.
+#
+#   python -m cicada.server --host 127.0.0.1 --port 5100
+#
+# Output is UTF-8 text; prompts are sent without a trailing newline and each
+# answer is one newline-terminated line (nc / telnet work as clients).
+
+import sys
+import asyncio
+import argparse
+import traceback
+
+from .config import CLOCK_MODE, CLOCK_SCALE
+from .clock import make_clock, run
+from .bank import DivergenceBank
+from .factory import PuzzleFactory, set_puzzle_factory
+from .storage import setup_db
+from .session import StreamSession, SessionClosed
+from .engine import play_session
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5100
+SERVER_BACKLOG = 2048
+LINE_LIMIT = 4096
+
+# === SERVER ===
+
+class CicadaServer:
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, backlog=SERVER_BACKLOG):
+        self.host = host
+        self.port = port
+        self.backlog = backlog
+        self.sessions = set()
+        self.completed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.bank = DivergenceBank()
+        self.puzzles = None
+        self._server = None
+
+    async def start(self):
+        setup_db()
+        # Warm puzzle pools so a burst of connections never builds them inline.
+        self.puzzles = PuzzleFactory().start()
+        set_puzzle_factory(self.puzzles)
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=LINE_LIMIT, backlog=self.backlog,
+        )
+        # Port 0 asks the OS for a free port; report the one we got.
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def _handle(self, reader, writer):
+        session = StreamSession(reader, writer)
+        divergence = self.bank.open()
+        task = asyncio.current_task()
+        self.sessions.add(task)
+        try:
+            await play_session(session, divergence)
+            self.completed += 1
+        except SessionClosed:
+            self.dropped += 1
+        except Exception:
+            self.failed += 1
+            traceback.print_exc()
+        finally:
+            self.sessions.discard(task)
+            divergence.close()
+            await session.close()
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        self._server.close()
+        tasks = list(self.sessions)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self._server.wait_closed()
+        set_puzzle_factory(None)
+
+# === LOOPBACK CLIENT ===
+
+async def loopback_client(host, port, lines):
+    # Scripted player for local testing: sends every answer up front, closes
+    # its write side and returns everything the server said.
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write("".join(f"{line}\n" for line in lines).encode("utf-8"))
+    await writer.drain()
+    writer.write_eof()
+    transcript = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    return transcript.decode("utf-8", "replace")
+
+# === ENTRY POINT ===
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = await CicadaServer(host, port).start()
+    print(f">> Δ CICADA server listening on {server.host}:{server.port}", file=sys.stderr)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Cicada Δ sessions over TCP.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clock", choices=("real", "scaled", "virtual"), default=CLOCK_MODE)
+    parser.add_argument("--clock-scale", type=float, default=CLOCK_SCALE)
+    args = parser.parse_args(argv)
+    try:
+        run(serve(args.host, args.port), make_clock(args.clock, args.clock_scale))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# === CICADA_Δ_ENGINE ===
+# Player I/O. Layers talk to a session instead of print()/input(), so the same
+# coroutines run behind the console, a socket, or a scripted transcript.
+
+import io
+import os
+import sys
+import asyncio
+import threading
+
+class SessionClosed(EOFError):
+    pass
+
+# === SESSION INTERFACE ===
+
+class Session:
+    # say() queues a line of output; ask() shows a prompt and waits for one
+    # line of input, returned stripped. write() emits raw text (no newline).
+    # seed fixes the session RNG (None derives it from the twin's personality).
+    seed = None
+
+    def attach(self, player, twin, divergence):
+        # Called once the session's player, twin and divergence exist.
+        pass
+
+    def say(self, text=""):
+        self.write(f"{text}\n")
+
+    def write(self, text):
+        raise NotImplementedError
+
+    async def ask(self, prompt=""):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+# === ASYNC STDIN ===
+
+class AsyncLineReader:
+    # Reads lines from a file without blocking the event loop. Selectable fds
+    # (ttys, pipes) are watched with loop.add_reader; anything else, such as a
+    # redirected regular file or a Windows console, is pumped by a daemon
+    # thread. Either way lines arrive through an asyncio.Queue.
+    def __init__(self, stream=None, encoding="utf-8"):
+        self.stream = stream or sys.stdin
+        self.encoding = encoding
+        self._loop = None
+        self._queue = None
+        self._fd = None
+        self._buffer = b""
+        self._thread = None
+
+    def _bind(self):
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        if self._thread is not None:
+            return
+        try:
+            self._fd = self.stream.fileno()
+            loop.add_reader(self._fd, self._on_readable)
+        except (AttributeError, OSError, ValueError, NotImplementedError, io.UnsupportedOperation):
+            self._fd = None
+            self._thread = threading.Thread(target=self._pump, name="cicada-stdin", daemon=True)
+            self._thread.start()
+
+    def _on_readable(self):
+        data = os.read(self._fd, 4096)
+        if not data:
+            self._loop.remove_reader(self._fd)
+            if self._buffer:
+                self._queue.put_nowait(self._buffer.decode(self.encoding, "replace"))
+            self._queue.put_nowait(None)
+            return
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        for line in lines:
+            self._queue.put_nowait(line.decode(self.encoding, "replace"))
+
+    def _post(self, line):
+        try:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, line)
+        except RuntimeError:
+            # The loop this reader was bound to has been closed.
+            pass
+
+    def _pump(self):
+        for line in iter(self.stream.readline, ""):
+            self._post(line)
+        self._post(None)
+
+    async def readline(self):
+        self._bind()
+        line = await self._queue.get()
+        if line is None:
+            # EOF is sticky: every later read sees it too.
+            self._queue.put_nowait(None)
+            raise SessionClosed("console closed")
+        return line
+
+    def close(self):
+        if self._fd is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+        self._fd = None
+
+# === CONSOLE TRANSPORT ===
+
+class ConsoleSession(Session):
+    def __init__(self, stdin=None, stdout=None):
+        self.stdin = stdin or sys.stdin
+        self.stdout = stdout or sys.stdout
+        self.reader = AsyncLineReader(self.stdin)
+
+    def write(self, text):
+        self.stdout.write(text)
+        self.stdout.flush()
+
+    async def ask(self, prompt=""):
+        self.write(prompt)
+        line = await self.reader.readline()
+        return line.strip()
+
+    async def close(self):
+        self.reader.close()
+
+# === STREAM TRANSPORT ===
+
+class StreamSession(Session):
+    # Newline-delimited text over an asyncio stream pair (one TCP connection).
+    def __init__(self, reader, writer, encoding="utf-8"):
+        self.reader = reader
+        self.writer = writer
+        self.encoding = encoding
+
+    def write(self, text):
+        if not self.writer.is_closing():
+            self.writer.write(text.encode(self.encoding))
+
+    async def ask(self, prompt=""):
+        self.write(prompt)
+        try:
+            await self.writer.drain()
+            line = await self.reader.readline()
+        except ConnectionError as exc:
+            raise SessionClosed(str(exc)) from exc
+        except (ValueError, asyncio.LimitOverrunError) as exc:
+            # The client sent a line longer than the stream's limit.
+            raise SessionClosed(f"line too long: {exc}") from exc
+        if not line:
+            raise SessionClosed("peer closed the connection")
+        return line.decode(self.encoding, "replace").strip()
+
+    async def close(self):
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
@@ -0,0 +1,248 @@
+# === CICADA_Δ_ENGINE ===
+# Headless simulator: scripted players sweep every layer interaction through
+# an in-memory session on a virtual clock, so a run measures puzzle
+# generation, persistence and dispatch instead of pacing sleeps.
+
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+from .utils import entropy_sample
+from .clock import VirtualClock, run
+from .storage import ConnectionPool, WriteBehindQueue, setup_db
+from .player import Player
+from .twin import Twin
+from .divergence import DivergenceEngine
+from .registry import dispatch_table
+from .session import Session, SessionClosed
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MAX_PROMPTS_PER_LAYER = 40
+
+# === POLICIES ===
+
+class RandomPolicy:
+    name = "random"
+    WORDS = (
+        "yes", "no", "a", "b", "c", "A", "B", "0", "1", "2", "3", "0,2",
+        "left", "right", "stop", "", "rock", "paper", "scissors",
+    )
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def answer(self, prompt, frame):
+        if self.rng.random() < 0.3:
+            return entropy_sample(self.rng.randint(1, 8), rng=self.rng)
+        return self.rng.choice(self.WORDS)
+
+class OraclePolicy(RandomPolicy):
+    # Answers with whatever the puzzle on the call stack keeps as its
+    # solution, and plays randomly where the puzzle keeps none.
+    name = "oracle"
+    ANSWER_ATTRS = (
+        "correct_answer", "expected_answer", "expected", "solution",
+        "target", "correct_path", "correct_indices",
+    )
+
+    def __init__(self, rng=None):
+        super().__init__(rng)
+        self.hits = 0
+        self.misses = 0
+
+    def answer(self, prompt, frame):
+        solution = self.find_solution(frame)
+        if solution is None:
+            self.misses += 1
+            return super().answer(prompt, frame)
+        self.hits += 1
+        return solution
+
+    def find_solution(self, frame, depth=6):
+        while frame is not None and depth:
+            for value in frame.f_locals.values():
+                for attr in self.ANSWER_ATTRS:
+                    solution = getattr(value, attr, None)
+                    if solution is not None and not callable(solution):
+                        return format_solution(solution)
+            frame = frame.f_back
+            depth -= 1
+        return None
+
+def format_solution(value):
+    if isinstance(value, (list, tuple)):
+        if all(isinstance(v, str) for v in value):
+            return "".join(value)
+        return ",".join(str(v) for v in value)
+    return str(value)
+
+class AdversarialPolicy(RandomPolicy):
+    # Oversized, control-character, injection-shaped and malformed input, as
+    # far as a transport can deliver it: invalid bytes arrive as U+FFFD.
+    name = "adversarial"
+    HOSTILE = (
+        "", " " * 64, "x" * 100_000, "Δ" * 4096, "\x00\x1b[2J\r", "'; DROP TABLE players; --",
+        "{0}{1}%s%d", "-1", "1e308", "nan", "0," * 2000, "\ufffd\ufffd", "\n\n", "9" * 400,
+    )
+
+    def answer(self, prompt, frame):
+        if self.rng.random() < 0.2:
+            return super().answer(prompt, frame)
+        return self.rng.choice(self.HOSTILE)
+
+POLICIES = {
+    "random": RandomPolicy,
+    "oracle": OraclePolicy,
+    "adversarial": AdversarialPolicy,
+}
+
+# === SESSION ===
+
+class SimulatedSession(Session):
+    def __init__(self, policy, max_prompts=MAX_PROMPTS_PER_LAYER):
+        self.policy = policy
+        self.max_prompts = max_prompts
+        self.prompts = 0
+        self.total_prompts = 0
+        self.output_chars = 0
+
+    def write(self, text):
+        self.output_chars += len(text)
+
+    async def ask(self, prompt=""):
+        # Layers that loop until solved end here once the budget is spent.
+        if self.prompts >= self.max_prompts:
+            raise SessionClosed("prompt budget spent")
+        self.prompts += 1
+        self.total_prompts += 1
+        self.output_chars += len(prompt)
+        return self.policy.answer(prompt, sys._getframe(1))
+
+# === REPORT ===
+
+class LayerStats:
+    def __init__(self, index):
+        self.index = index
+        self.runs = 0
+        self.solved = 0
+        self.prompts = 0
+        self.durations = []
+        self.errors = []
+
+    def record(self, elapsed, solved, prompts, error=None):
+        self.runs += 1
+        self.solved += solved
+        self.prompts += prompts
+        self.durations.append(elapsed)
+        if error is not None:
+            self.errors.append(error)
+
+class SimulationReport:
+    def __init__(self, policy):
+        self.policy = policy
+        self.sessions = 0
+        self.layers = {}
+        self.elapsed = 0.0
+        self.prompts = 0
+        self.commits = 0
+        self.rows_written = 0
+        self.memory_peak = None
+        self.max_rss = None
+
+    def layer(self, index):
+        stats = self.layers.get(index)
+        if stats is None:
+            stats = self.layers[index] = LayerStats(index)
+        return stats
+
+    @property
+    def solves(self):
+        return sum(s.solved for s in self.layers.values())
+
+    @property
+    def runs(self):
+        return sum(s.runs for s in self.layers.values())
+
+    @property
+    def errors(self):
+        return sum(len(s.errors) for s in self.layers.values())
+
+    def solves_per_second(self):
+        return self.solves / self.elapsed if self.elapsed else 0.0
+
+# === DRIVER ===
+
+async def sweep(report, policy, pool, writer, sessions, layers, max_prompts, seed):
+    table = dispatch_table()
+    depths = [depth for depth, spec in sorted(table.items()) if layers is None or spec.index in layers]
+    for n in range(sessions):
+        player = Player(f"sim-{policy.name}-{seed}-{n}", pool=pool, writer=writer)
+        twin = Twin(player, seed=seed * 1_000_003 + n)
+        divergence = DivergenceEngine(rng=twin.rng)
+        session = SimulatedSession(policy, max_prompts)
+        session.attach(player, twin, divergence)
+        for depth in depths:
+            spec = table[depth]
+            player.update("layer", depth)
+            session.prompts = 0
+            error = None
+            start = time.perf_counter()
+            try:
+                await spec.interaction(session, player, twin, divergence)
+            except SessionClosed:
+                pass
+            except Exception as exc:
+                error = exc
+            elapsed = time.perf_counter() - start
+            # Persistence errors surface here under write-behind.
+            try:
+                player.flush()
+            except Exception as exc:
+                error = error or exc
+            report.layer(spec.index).record(elapsed, player.layer != depth, session.prompts, error)
+        player.save_models()
+        report.prompts += session.total_prompts
+        report.sessions += 1
+
+def simulate(policy="random", sessions=1, layers=None, seed=0, max_prompts=MAX_PROMPTS_PER_LAYER,
+             db_path=None, write_behind=False, trace_memory=False):
+    # Runs against a throwaway database unless db_path is given.
+    if isinstance(policy, str):
+        policy = POLICIES[policy](random.Random(seed))
+    report = SimulationReport(policy)
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ConnectionPool(db_path or os.path.join(tmp, "simulate.db"))
+        writer = WriteBehindQueue(pool) if write_behind else None
+        try:
+            setup_db(pool)
+            commits, rows = pool.commits, pool.changes()
+            if trace_memory:
+                tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                run(sweep(report, policy, pool, writer, sessions, layers, max_prompts, seed), VirtualClock())
+                if writer is not None:
+                    writer.close()
+                    writer = None
+            finally:
+                report.elapsed = time.perf_counter() - start
+                if trace_memory:
+                    report.memory_peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+            report.commits = pool.commits - commits
+            report.rows_written = pool.changes() - rows
+        finally:
+            if writer is not None:
+                writer.close()
+            pool.close()
+    if resource is not None:
+        # ru_maxrss is in KiB on Linux.
+        report.max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return report
@@ -0,0 +1,327 @@
+# === CICADA_Δ_ENGINE ===
+# SQLite persistence: connection pool, event log, write-behind queue
+
+import ast
+import atexit
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+from .config import (
+    PLAYER_DB, DB_JOURNAL_MODE, DB_SYNCHRONOUS, DB_STATEMENT_CACHE,
+    WRITE_BEHIND, WRITE_BEHIND_INTERVAL, WRITE_BEHIND_MAX_PENDING,
+)
+
+# === DATABASE SETUP ===
+
+# Statements are kept as constants so every call hits sqlite3's per-connection
+# prepared statement cache instead of being re-parsed.
+SQL_CREATE_PLAYERS = '''
+    CREATE TABLE IF NOT EXISTS players (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE,
+        join_time TEXT,
+        delta REAL,
+        layer INTEGER,
+        log TEXT
+    )
+'''
+SQL_CREATE_EVENTS = '''
+    CREATE TABLE IF NOT EXISTS player_events (
+        player_id INTEGER NOT NULL REFERENCES players(id),
+        seq INTEGER NOT NULL,
+        ts TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        payload TEXT,
+        PRIMARY KEY (player_id, seq)
+    ) WITHOUT ROWID
+'''
+SQL_CREATE_MODELS = '''
+    CREATE TABLE IF NOT EXISTS player_models (
+        player_id INTEGER NOT NULL REFERENCES players(id),
+        name TEXT NOT NULL,
+        state TEXT NOT NULL,
+        PRIMARY KEY (player_id, name)
+    ) WITHOUT ROWID
+'''
+SQL_CREATE_EVENTS_KIND_INDEX = "CREATE INDEX IF NOT EXISTS idx_player_events_kind ON player_events (player_id, kind, seq)"
+SQL_PLAYER_IDENTITY = "SELECT id FROM players WHERE username = ?"
+SQL_PLAYER_CREATE = "INSERT INTO players (username, join_time, delta, layer, log) VALUES (?, ?, ?, ?, ?)"
+SQL_PLAYER_SYNC = "SELECT delta, layer FROM players WHERE username = ?"
+SQL_PLAYER_UPDATE = {
+    "delta": "UPDATE players SET delta = ? WHERE username = ?",
+    "layer": "UPDATE players SET layer = ? WHERE username = ?",
+}
+SQL_PLAYER_SAVE = "UPDATE players SET delta = ?, layer = ? WHERE username = ?"
+SQL_EVENT_APPEND = "INSERT INTO player_events (player_id, seq, ts, kind, payload) VALUES (?, ?, ?, ?, ?)"
+SQL_EVENT_FIRST_SEQ = "SELECT COALESCE(MIN(seq), 1) FROM player_events WHERE player_id = ?"
+SQL_EVENT_BOUNDS = "SELECT COALESCE(MIN(seq), 1), COALESCE(MAX(seq), 0) FROM player_events WHERE player_id = ?"
+SQL_EVENT_PAGE = "SELECT seq, ts, kind, payload FROM player_events WHERE player_id = ? AND seq > ? ORDER BY seq LIMIT ?"
+SQL_EVENT_PAYLOADS = "SELECT payload FROM player_events WHERE player_id = ? AND seq BETWEEN ? AND ? ORDER BY seq"
+SQL_MODEL_LOAD = "SELECT state FROM player_models WHERE player_id = ? AND name = ?"
+SQL_MODEL_ALL = "SELECT name, state FROM player_models WHERE player_id = ?"
+SQL_MODEL_SAVE = (
+    "INSERT INTO player_models (player_id, name, state) VALUES (?, ?, ?) "
+    "ON CONFLICT (player_id, name) DO UPDATE SET state = excluded.state"
+)
+SQL_LEGACY_LOGS = "SELECT id, join_time, log FROM players WHERE log IS NOT NULL AND log NOT IN ('', '[]')"
+SQL_LEGACY_LOG_CLEAR = "UPDATE players SET log = '[]' WHERE id = ?"
+
+EVENT_PAGE_SIZE = 256
+LOG_CACHE_PAGES = 8
+
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+
+class ConnectionPool:
+    def __init__(self, path=PLAYER_DB, journal_mode=DB_JOURNAL_MODE, synchronous=DB_SYNCHRONOUS):
+        journal_mode = journal_mode.upper()
+        if journal_mode not in JOURNAL_MODES:
+            raise ValueError(f"Unknown journal mode: {journal_mode}")
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_LEVELS:
+            raise ValueError(f"Unknown synchronous level: {synchronous}")
+        self.path = path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = []
+        self.commits = 0
+
+    def connection(self):
+        # One long-lived connection per thread; coroutines on the same loop share it.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, cached_statements=DB_STATEMENT_CACHE, check_same_thread=False)
+            conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+            conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def session(self):
+        conn = self.connection()
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+        else:
+            conn.commit()
+            self.commits += 1
+
+    def changes(self):
+        # Rows inserted, updated or deleted through this pool's open connections.
+        with self._lock:
+            return sum(conn.total_changes for conn in self._connections)
+
+    def close(self):
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
+
+_pool = None
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        set_pool(ConnectionPool())
+    return _pool
+
+def set_pool(pool):
+    global _pool
+    if _pool is not None and _pool is not pool:
+        _pool.close()
+    _pool = pool
+    return pool
+
+@atexit.register
+def _close_persistence():
+    if _writer is not None:
+        _writer.close()
+    if _pool is not None:
+        _pool.close()
+
+def setup_db(pool=None):
+    pool = pool or get_pool()
+    with pool.session() as conn:
+        conn.execute(SQL_CREATE_PLAYERS)
+        conn.execute(SQL_CREATE_EVENTS)
+        conn.execute(SQL_CREATE_EVENTS_KIND_INDEX)
+        conn.execute(SQL_CREATE_MODELS)
+    migrate_legacy_logs(pool)
+
+# === EVENT LOG ===
+
+def event_kind(entry):
+    # "LAYER3_SOLVED Δ+0.1" -> "LAYER3_SOLVED", "BOOT: Δ=..." -> "BOOT"
+    if not isinstance(entry, str):
+        return "ENTRY"
+    return entry.split(":", 1)[0].split(" ", 1)[0] or "ENTRY"
+
+def migrate_legacy_logs(pool=None):
+    # Explode the old stringified players.log blobs into player_events rows.
+    # Legacy entries predate every event, so they are numbered below the first seq.
+    pool = pool or get_pool()
+    with pool.session() as conn:
+        for player_id, join_time, blob in conn.execute(SQL_LEGACY_LOGS).fetchall():
+            entries = ast.literal_eval(blob)
+            first = conn.execute(SQL_EVENT_FIRST_SEQ, (player_id,)).fetchone()[0]
+            base = min(first, 1) - len(entries)
+            conn.executemany(SQL_EVENT_APPEND, [
+                (player_id, base + i, join_time, event_kind(entry), str(entry))
+                for i, entry in enumerate(entries)
+            ])
+            conn.execute(SQL_LEGACY_LOG_CLEAR, (player_id,))
+
+# === WRITE-BEHIND QUEUE ===
+
+# Errors that belong to one player's rows rather than to the database; a
+# flush sets such an entry aside instead of failing the whole batch.
+ENTRY_ERRORS = (sqlite3.IntegrityError, sqlite3.InterfaceError)
+
+def write_player(conn, username, fields, events):
+    if "delta" in fields and "layer" in fields:
+        conn.execute(SQL_PLAYER_SAVE, (fields["delta"], fields["layer"], username))
+    else:
+        for key, value in fields.items():
+            conn.execute(SQL_PLAYER_UPDATE[key], (value, username))
+    if events:
+        conn.executemany(SQL_EVENT_APPEND, events)
+
+class WriteBehindQueue:
+    # Coalesces player writes in memory (last delta, last layer, every log row)
+    # and commits them from a background thread on a timer or size threshold.
+    def __init__(self, pool=None, interval=WRITE_BEHIND_INTERVAL, max_pending=WRITE_BEHIND_MAX_PENDING):
+        self.pool = pool
+        self.interval = interval
+        self.max_pending = max_pending
+        self.error = None
+        self.commits = 0
+        # player_id -> the error its last entry failed with, until the owner
+        # flushes and is told.
+        self.failed = {}
+        self._dirty = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._thread = None
+
+    def submit(self, player, fields, events=()):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("write-behind queue is closed")
+            entry = self._dirty.get(player.id)
+            if entry is None:
+                entry = self._dirty[player.id] = (player.username, {}, [])
+            entry[1].update(fields)
+            entry[2].extend(events)
+            self._pending += len(events) or 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="cicada-write-behind", daemon=True)
+                self._thread.start()
+            if self._pending >= self.max_pending:
+                self._wake.set()
+
+    def pending(self):
+        with self._lock:
+            return self._pending
+
+    def flush(self, player_id=None):
+        # Drains every entry, or only one player's when player_id is given,
+        # and reports what went wrong since the last explicit flush: a
+        # player's flush raises its own rejected entry; a full flush raises
+        # the last background failure and forgets rejected entries whose
+        # owners never asked.
+        with self._flush_lock:
+            self._drain(player_id)
+            if player_id is not None:
+                error = self.failed.pop(player_id, None)
+            else:
+                error, self.error = self.error, None
+                self.failed.clear()
+        if error is not None:
+            raise error
+
+    def _drain(self, player_id=None):
+        # Callers hold the flush lock, which keeps batches committing in
+        # submission order.
+        with self._lock:
+            if player_id is None:
+                batch, self._dirty = self._dirty, {}
+                self._pending = 0
+            else:
+                entry = self._dirty.pop(player_id, None)
+                batch = {} if entry is None else {player_id: entry}
+                if entry is not None:
+                    self._pending -= len(entry[2]) or 1
+        if batch:
+            self._commit(batch)
+
+    def _commit(self, batch):
+        # Each entry gets its own savepoint: an entry that fails on its own
+        # rows is rolled back and set aside for its owner, and the rest of
+        # the batch still commits. The rollback takes the entry's delta and
+        # layer with it; the owner re-reads them on sync. Anything else fails
+        # the whole batch, which is queued again for the next flush.
+        try:
+            with (self.pool or get_pool()).session() as conn:
+                if not conn.in_transaction:
+                    conn.execute("BEGIN")
+                for player_id, (username, fields, events) in batch.items():
+                    conn.execute("SAVEPOINT write_player")
+                    try:
+                        write_player(conn, username, fields, events)
+                    except ENTRY_ERRORS as exc:
+                        conn.execute("ROLLBACK TO write_player")
+                        self.failed[player_id] = exc
+                    conn.execute("RELEASE write_player")
+        except BaseException:
+            self._requeue(batch)
+            raise
+        self.commits += 1
+
+    def _requeue(self, batch):
+        with self._lock:
+            for player_id, (username, fields, events) in batch.items():
+                newer = self._dirty.get(player_id)
+                if newer is not None:
+                    fields.update(newer[1])
+                    events.extend(newer[2])
+                self._dirty[player_id] = (username, fields, events)
+                self._pending += len(events) or 1
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            try:
+                with self._flush_lock:
+                    self._drain()
+            except Exception as exc:
+                # Kept for the next explicit flush() or close() to raise.
+                self.error = exc
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None:
+            thread.join()
+        self.flush()
+
+_writer = None
+
+def get_writer():
+    global _writer
+    if _writer is None and WRITE_BEHIND:
+        _writer = WriteBehindQueue()
+    return _writer
@@ -0,0 +1,108 @@
+# === CICADA_Δ_ENGINE ===
+# Token index over a player's log: distinct tokens bucketed by length and
+# character class, with counts, kept current on every append so log-derived
+# puzzles never re-split the whole history.
+
+from collections import Counter, deque
+
+from .config import TOKEN_RECENT
+
+def token_class(token):
+    if token.isalpha():
+        return "alpha"
+    if token.isdigit():
+        return "digit"
+    if token.isalnum():
+        return "alnum"
+    return "other"
+
+# === BUCKET ===
+
+class TokenBucket:
+    def __init__(self):
+        self.counts = {}
+        # Distinct tokens in first-seen order, for O(k) sampling.
+        self.tokens = []
+        self.total = 0
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def __contains__(self, token):
+        return token in self.counts
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def add(self, token, n=1):
+        count = self.counts.get(token)
+        if count is None:
+            self.counts[token] = n
+            self.tokens.append(token)
+        else:
+            self.counts[token] = count + n
+        self.total += n
+
+    def sample(self, rng, k):
+        return rng.sample(self.tokens, min(k, len(self.tokens)))
+
+_EMPTY = TokenBucket()
+
+# === INDEX ===
+
+class TokenIndex:
+    def __init__(self, recent=TOKEN_RECENT):
+        self.buckets = {}
+        self.recent = deque(maxlen=recent)
+        self.total = 0
+        self.entries = 0
+
+    def __len__(self):
+        return self.total
+
+    def __repr__(self):
+        return f"TokenIndex({self.entries} entries, {self.total} tokens, {len(self.buckets)} buckets)"
+
+    def add_entry(self, text):
+        for token in str(text).split():
+            self.add(token)
+        self.entries += 1
+
+    def add_entries(self, entries):
+        # Bulk load: tokens are counted in C, then each distinct token is
+        # classified and bucketed once.
+        entries = [str(entry) for entry in entries]
+        tokens = " ".join(entries).split()
+        for token, n in Counter(tokens).items():
+            self._bucket_for(token).add(token, n)
+        self.recent.extend(tokens[-self.recent.maxlen:])
+        self.total += len(tokens)
+        self.entries += len(entries)
+
+    def add(self, token):
+        self._bucket_for(token).add(token)
+        self.recent.append(token)
+        self.total += 1
+
+    def _bucket_for(self, token):
+        key = (len(token), token_class(token))
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = TokenBucket()
+        return bucket
+
+    def bucket(self, length, cls="alpha"):
+        # Read-only for callers; unknown buckets share one empty instance.
+        return self.buckets.get((length, cls), _EMPTY)
+
+    def count(self, length, cls="alpha"):
+        return self.bucket(length, cls).total
+
+    def sample(self, rng, length, cls="alpha", k=1):
+        return self.bucket(length, cls).sample(rng, k)
+
+    def last(self, n=1):
+        # The n most recent tokens, oldest first; n is at most the recent window.
+        if n > self.recent.maxlen:
+            raise ValueError(f"only the last {self.recent.maxlen} tokens are kept")
+        return list(self.recent)[-n:] if n else []
@@ -0,0 +1,50 @@
+# === CICADA_Δ_ENGINE ===
+# Twin Logic Core
+
+import os
+import random
+
+from .config import TWIN_ID, TWIN_MEMORY_DIR
+from .utils import sha256, timestamp
+from .hashing import raw_digest
+from .memory import TwinMemory
+from .responses import get_response_engine
+
+# === TWIN LOGIC CORE ===
+
+class Twin:
+    def __init__(self, player, seed=None):
+        self.id = TWIN_ID
+        self.player = player
+        self.memory = TwinMemory()
+        self.responses = get_response_engine(self.id)
+        # Timestamped, so never repeated: hashed outside the cache.
+        self.personality_seed = raw_digest(player.username + timestamp()).hex()[:16]
+        # The session's RNG: puzzles, the divergence engine and the twin all
+        # draw from it, so a session replays exactly from its seed.
+        self.seed = int(self.personality_seed, 16) if seed is None else seed
+        self.seeded = seed is not None
+        self.rng = random.Random(self.seed)
+        self.rng.pinned = self.seeded
+
+    def memory_path(self):
+        # Set CICADA_TWIN_MEMORY_DIR to keep each player's twin memory between sessions.
+        if TWIN_MEMORY_DIR is None:
+            return None
+        return os.path.join(TWIN_MEMORY_DIR, f"{sha256(self.player.username)[:16]}.json")
+
+    def speak(self, msg, context="neutral"):
+        Δ = self.player.delta
+        if Δ < 0.5:
+            tone = "cold"
+        elif Δ < 1.5:
+            tone = "ambiguous"
+        else:
+            tone = "unstable"
+
+        response = self.generate_response(msg, tone, context)
+        self.memory[tone].append((msg[:self.responses.max_input], response))
+        return response
+
+    def generate_response(self, msg, tone, context):
+        return self.responses.render(self.rng, msg, tone, context)
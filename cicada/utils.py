@@ -0,0 +1,27 @@
+# === CICADA_Δ_ENGINE ===
+# Hashing, entropy and time helpers shared by every layer
+
+from datetime import datetime
+
+from .config import ENTROPY_MODE
+from .clock import get_clock
+from .entropy import entropy_chars, get_entropy_pool
+from .hashing import hexdigest
+
+# === UTILITIES ===
+
+def sha256(data):
+    # Memoized through the shared hash cache; accepts str or bytes.
+    return hexdigest(data)
+
+def entropy_sample(length=16, rng=None):
+    # Session samples come from the session rng so a pinned seed replays
+    # exactly. In crypto mode an unpinned session's samples come from the
+    # pool's os.urandom stream instead; rngs that do not say either way are
+    # treated as pinned.
+    if rng is not None and (ENTROPY_MODE != "crypto" or getattr(rng, "pinned", True)):
+        return entropy_chars(rng.randbytes, length)
+    return get_entropy_pool().take(length)
+
+def timestamp():
+    return datetime.utcfromtimestamp(get_clock().wall()).isoformat()
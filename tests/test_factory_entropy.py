@@ -0,0 +1,43 @@
+# === CICADA_Δ_ENGINE ===
+# Puzzle factory entropy: in crypto mode pooled puzzles draw from the pool.
+#
+#   python -m pytest -q tests
+
+from types import SimpleNamespace
+
+import cicada.utils
+from cicada.entropy import set_entropy_pool
+from cicada.factory import PuzzleFactory
+from cicada.layers.layer01 import Puzzle
+from cicada.twin import Twin
+
+class RecordingPool:
+    def __init__(self):
+        self.taken = []
+
+    def take(self, length):
+        token = "0123456789abcdefghijklmnopqrstuvwxyz"[len(self.taken) % 36] * length
+        self.taken.append(token)
+        return token
+
+    def close(self):
+        pass
+
+def test_crypto_mode_factory_puzzles_draw_from_the_entropy_pool(monkeypatch):
+    monkeypatch.setattr(cicada.utils, "ENTROPY_MODE", "crypto")
+    pool = RecordingPool()
+    set_entropy_pool(pool)
+    factory = PuzzleFactory(size=4, workers=1)
+    try:
+        factory.start([Puzzle])
+        player = SimpleNamespace(username="crypto", delta=0.0)
+        puzzle = factory.take(Puzzle, player, Twin(player), SimpleNamespace(value=0.0))
+        assert factory.hits == 1
+        assert puzzle.entropy in pool.taken
+        # A session pinned to a seed keeps its reproducible stream.
+        taken = len(pool.taken)
+        factory.take(Puzzle, player, Twin(player, seed=7), SimpleNamespace(value=0.0))
+        assert len(pool.taken) == taken
+    finally:
+        factory.close()
+        set_entropy_pool(None)
@@ -0,0 +1,29 @@
+# === CICADA_Δ_ENGINE ===
+# PlayerLog paging: cached pages must never hide entries appended later.
+#
+#   python -m pytest -q tests
+
+from cicada.storage import ConnectionPool, setup_db
+from cicada.player import Player
+
+def test_append_filling_a_page_drops_the_cached_page(tmp_path):
+    pool = ConnectionPool(str(tmp_path / "log.db"))
+    setup_db(pool)
+    player = Player("pager", pool=pool)
+    player.update("log", "e0")
+    player.update("log", "e1")
+    # Drop the live log so the reopened player pages from the database.
+    del player
+
+    player = Player("pager", pool=pool)
+    log = player.log
+    log.page_size = 4
+    assert log[0] == "e0"
+    player.update("log", "e2")
+    assert log[0] == "e0"
+    # e3 fills the last slot of page 0; the page cached above must go.
+    for i in range(3, 8):
+        player.update("log", f"e{i}")
+    assert log[3] == "e3"
+    assert list(log) == [f"e{i}" for i in range(8)]
+    pool.close()
@@ -0,0 +1,102 @@
+# === CICADA_Δ_ENGINE ===
+# Write-behind queue: one player's bad rows must not block anyone else's.
+#
+#   python -m pytest -q tests
+
+import time
+import sqlite3
+
+import pytest
+
+from cicada.storage import ConnectionPool, WriteBehindQueue, SQL_CREATE_EVENTS, SQL_EVENT_APPEND, setup_db
+from cicada.player import Player
+
+def open_store(tmp_path, max_pending=1000):
+    pool = ConnectionPool(str(tmp_path / "queue.db"))
+    setup_db(pool)
+    return pool, WriteBehindQueue(pool, interval=3600, max_pending=max_pending)
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "background flush did not run"
+        time.sleep(0.01)
+
+def event_count(pool, player):
+    return pool.connection().execute("SELECT COUNT(*) FROM player_events WHERE player_id = ?", (player.id,)).fetchone()[0]
+
+def layer_of(pool, player):
+    return pool.connection().execute("SELECT layer FROM players WHERE id = ?", (player.id,)).fetchone()[0]
+
+def test_failing_entry_is_isolated_and_reported_to_its_owner(tmp_path):
+    # The third pending write wakes the background flush.
+    pool, writer = open_store(tmp_path, max_pending=3)
+    bad = Player("bad", pool=pool, writer=writer)
+    good = Player("good", pool=pool, writer=writer)
+    # Another process already took the seq bad will hand out next.
+    with pool.session() as conn:
+        conn.execute(SQL_EVENT_APPEND, (bad.id, 1, "ts", "ENTRY", "elsewhere"))
+    with bad.transaction():
+        bad.update("layer", 4)
+        bad.update("log", "collides")
+    good.update("log", "fine")
+    good.update("layer", 3)
+
+    wait_for(lambda: writer.commits == 1)
+    assert event_count(pool, good) == 1
+    assert layer_of(pool, good) == 3
+    # The rejected entry's fields go down with its events.
+    assert layer_of(pool, bad) == 0
+
+    with pytest.raises(sqlite3.IntegrityError):
+        bad.flush()
+    # Reported once; the log view now matches the database.
+    bad.flush()
+    assert list(bad.log) == ["elsewhere"]
+    good.update("log", "after")
+    writer.close()
+    assert event_count(pool, good) == 2
+    pool.close()
+
+def test_full_flush_forgets_rejected_entries(tmp_path):
+    pool, writer = open_store(tmp_path)
+    bad = Player("bad", pool=pool, writer=writer)
+    with pool.session() as conn:
+        conn.execute(SQL_EVENT_APPEND, (bad.id, 1, "ts", "ENTRY", "elsewhere"))
+    bad.update("log", "collides")
+    writer.flush()
+    assert writer.failed == {}
+    writer.close()
+    pool.close()
+
+def test_background_failure_is_raised_by_the_next_flush(tmp_path):
+    pool, writer = open_store(tmp_path, max_pending=1)
+    player = Player("disk", pool=pool, writer=writer)
+    with pool.session() as conn:
+        conn.execute("DROP TABLE player_events")
+    player.update("log", "lost for now")
+    wait_for(lambda: writer.error is not None)
+    with pool.session() as conn:
+        conn.execute(SQL_CREATE_EVENTS)
+
+    # The batch was requeued, so it lands; the failure is still reported once.
+    with pytest.raises(sqlite3.OperationalError):
+        writer.flush()
+    assert event_count(pool, player) == 1
+    writer.flush()
+    writer.close()
+    pool.close()
+
+def test_player_flush_drains_only_its_own_entry(tmp_path):
+    pool, writer = open_store(tmp_path)
+    one = Player("one", pool=pool, writer=writer)
+    two = Player("two", pool=pool, writer=writer)
+    one.update("log", "a")
+    two.update("log", "b")
+    one.flush()
+    assert event_count(pool, one) == 1
+    assert event_count(pool, two) == 0
+    assert writer.pending() == 1
+    writer.close()
+    assert event_count(pool, two) == 1
+    pool.close()